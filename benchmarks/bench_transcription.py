@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+음성 인식 파이프라인 실시간 배율(RTF) 벤치마크
+
+녹음 후처리(AudioRecorder.process_buffer_for_whisper)와 WhisperWorker의
+전처리 / VAD / transcribe 경로를 1, 5, 15, 30초 길이의 결정적 합성 클립과
+benchmarks/clips/ 의 음성 클립으로 실행하고, RTF, p50/p95 지연 시간,
+클립별 RSS 증가량, CPU 시간을 JSON으로 출력합니다.
+
+rss_delta_mb는 클립 측정 중 샘플링한 RSS 최댓값에서 측정 직전 RSS를 뺀 값이고,
+peak_rss_mb는 측정 시점까지의 프로세스 전체 최대 RSS(ru_maxrss)입니다.
+
+사용 예:
+    python benchmarks/bench_transcription.py --models tiny base --output bench.json
+    python benchmarks/bench_transcription.py --preprocess-only
+    python benchmarks/bench_transcription.py --baseline bench.json --tolerance 0.15
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import wave
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), 'src'))
+
+from PyQt6.QtCore import QCoreApplication
+
+from audio_buffer import AudioBuffer
+from audio_recorder import AudioRecorder
+from whisper_handler import WhisperHandler, WhisperWorker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+SAMPLE_RATE = 16000
+DEFAULT_DURATIONS = (1, 5, 15, 30)
+CAPTURE_DTYPES = ('float32', 'int16')
+CAPTURE_BLOCK = 1024  # 녹음 콜백 한 번에 들어오는 프레임 수
+CLIPS_DIR = os.path.join(BENCH_DIR, 'clips')
+
+# 디코딩 옵션 프리셋 (None 값은 Whisper 기본값 사용 = 옵션 제거)
+DECODE_PRESETS = {
+    'greedy': {'beam_size': None, 'best_of': None, 'temperature': 0.0},
+    'beam5': {'beam_size': 5, 'best_of': 5, 'temperature': 0.0},
+}
+
+
+def synthetic_clip(duration, seed=0):
+    """음성과 비슷한 결정적 합성 신호 생성
+
+    기본 주파수가 천천히 변하는 배음 신호에 음절 속도(약 4Hz)의 진폭 변조와
+    약한 잡음을 더하고, 앞뒤에 짧은 무음을 둡니다.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration * SAMPLE_RATE)
+    t = np.arange(total, dtype=np.float64) / SAMPLE_RATE
+
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 4.0 * t + rng.uniform(0, np.pi)), 0, None) ** 2
+
+    audio = 0.3 * voiced * envelope + 0.005 * rng.standard_normal(total)
+
+    edge = min(int(0.2 * SAMPLE_RATE), total // 10)
+    audio[:edge] = 0.002 * rng.standard_normal(edge)
+    audio[total - edge:] = 0.002 * rng.standard_normal(edge)
+    return audio.astype(np.float32)
+
+
+def load_wav(path):
+    """16비트 PCM WAV 로드 (16kHz 모노로 변환)"""
+    with wave.open(path, 'rb') as wav_file:
+        sample_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        if wav_file.getsampwidth() != 2:
+            raise ValueError(f"16비트 PCM만 지원합니다: {path}")
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    if sample_rate != SAMPLE_RATE:
+        new_length = int(len(audio) * SAMPLE_RATE / sample_rate)
+        audio = np.interp(
+            np.linspace(0, len(audio) - 1, new_length),
+            np.arange(len(audio)),
+            audio
+        ).astype(np.float32)
+    return audio
+
+
+def fit_duration(audio, duration):
+    """클립을 지정 길이로 자르거나 반복"""
+    target = int(duration * SAMPLE_RATE)
+    if len(audio) >= target:
+        return audio[:target]
+    repeats = int(np.ceil(target / len(audio)))
+    return np.tile(audio, repeats)[:target]
+
+
+def build_clips(durations, include_synthetic=True):
+    """(이름, 출처, 오디오) 목록 생성"""
+    clips = []
+
+    if include_synthetic:
+        for duration in durations:
+            seed = int(duration * 1000)
+            clips.append((f"synthetic_{duration:g}s", 'synthetic', synthetic_clip(duration, seed=seed)))
+
+    for path in sorted(glob.glob(os.path.join(CLIPS_DIR, '*.wav'))):
+        base = load_wav(path)
+        name = os.path.splitext(os.path.basename(path))[0]
+        for duration in durations:
+            clips.append((f"{name}_{duration:g}s", os.path.basename(path), fit_duration(base, duration)))
+
+    return clips
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb():
+    """현재 RSS (MB) - /proc가 없는 플랫폼에서는 None"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class RssSampler:
+    """측정 구간 동안 현재 RSS를 주기적으로 읽어 측정 직전 대비 최대 증가량 계산
+
+    ru_maxrss는 프로세스 전체의 최댓값이라 먼저 측정한 큰 모델/클립이 이후
+    클립의 값을 가리므로 클립별 메모리 사용량은 이 방식으로 구합니다.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.baseline = None
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.baseline = self.peak = current_rss_mb()
+        if self.baseline is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+        return False
+
+    @property
+    def delta_mb(self):
+        if self.baseline is None:
+            return None
+        return max(0.0, self.peak - self.baseline)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        rss = current_rss_mb()
+        if rss is not None and self.peak is not None:
+            self.peak = max(self.peak, rss)
+
+
+def summarize(latencies, cpu_times, audio_seconds, rss_delta_mb=None):
+    """반복 실행 결과 요약"""
+    latencies = np.array(latencies)
+    rtf = latencies / audio_seconds
+    return {
+        'runs': len(latencies),
+        'latency_mean': float(latencies.mean()),
+        'latency_p50': float(np.percentile(latencies, 50)),
+        'latency_p95': float(np.percentile(latencies, 95)),
+        'rtf_p50': float(np.percentile(rtf, 50)),
+        'rtf_p95': float(np.percentile(rtf, 95)),
+        'cpu_seconds_per_run': float(np.mean(cpu_times)),
+        'rss_delta_mb': rss_delta_mb,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+class NullModel:
+    """transcribe 직전까지의 경로만 측정하기 위한 빈 모델"""
+
+    def transcribe(self, audio, **options):
+        return {'text': '', 'language': 'unknown', 'segments': []}
+
+
+def run_worker(model, audio, options):
+    """WhisperWorker를 현재 스레드에서 동기 실행"""
+    outcome = {}
+
+    def callback(text, error, metadata):
+        outcome.update(text=text, error=error, metadata=metadata)
+
+    worker = WhisperWorker(model, audio.copy(), SAMPLE_RATE, options, callback)
+    worker.run()
+
+    if outcome.get('error'):
+        raise RuntimeError(outcome['error'])
+    return outcome
+
+
+def capture_frames(audio, dtype):
+    """클립을 녹음 콜백과 같은 블록 단위 프레임 목록으로 변환"""
+    if dtype == 'int16':
+        audio = np.round(np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    return [audio[i:i + CAPTURE_BLOCK].reshape(-1, 1) for i in range(0, len(audio), CAPTURE_BLOCK)]
+
+
+def bench_recorder(clips, repeat):
+    """녹음 종료 후 Whisper 입력까지의 후처리 측정 (녹음 형식별)
+
+    녹음 프레임을 AudioBuffer로 병합한 뒤 process_buffer_for_whisper가
+    정규화 / int16 → float32 변환 / 무음 제거를 마칠 때까지의 시간입니다.
+    """
+    QCoreApplication.instance() or QCoreApplication([])
+    recorder = AudioRecorder(probe_device=False)
+    results = []
+
+    try:
+        for dtype in CAPTURE_DTYPES:
+            for name, source, audio in clips:
+                audio_seconds = len(audio) / SAMPLE_RATE
+                frames = capture_frames(audio, dtype)
+                latencies, cpu_times = [], []
+
+                with RssSampler() as rss:
+                    for _ in range(repeat):
+                        wall_start, cpu_start = time.perf_counter(), time.process_time()
+                        buffer = AudioBuffer.from_frames(frames, SAMPLE_RATE, getattr(np, dtype))
+                        processed = recorder.process_buffer_for_whisper(buffer)
+                        latencies.append(time.perf_counter() - wall_start)
+                        cpu_times.append(time.process_time() - cpu_start)
+                        if processed is not None:
+                            processed.release()
+
+                entry = {'clip': name, 'source': source, 'dtype': dtype, 'audio_seconds': audio_seconds}
+                entry.update(summarize(latencies, cpu_times, audio_seconds, rss.delta_mb))
+                results.append(entry)
+                print(f"[recorder/{dtype}] {name}: p50 {entry['latency_p50'] * 1000:.2f}ms", file=sys.stderr)
+    finally:
+        recorder.close()
+
+    return results
+
+
+def bench_preprocessing(clips, repeat, options):
+    """모델 없이 WhisperWorker의 전처리 + VAD만 측정 (빈 모델로 run() 실행)"""
+    results = []
+    model = NullModel()
+
+    for name, source, audio in clips:
+        audio_seconds = len(audio) / SAMPLE_RATE
+        latencies, cpu_times = [], []
+
+        with RssSampler() as rss:
+            for _ in range(repeat):
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                run_worker(model, audio, options)
+                latencies.append(time.perf_counter() - wall_start)
+                cpu_times.append(time.process_time() - cpu_start)
+
+        entry = {'clip': name, 'source': source, 'audio_seconds': audio_seconds}
+        entry.update(summarize(latencies, cpu_times, audio_seconds, rss.delta_mb))
+        results.append(entry)
+        print(f"[preprocess] {name}: p50 {entry['latency_p50'] * 1000:.2f}ms", file=sys.stderr)
+
+    return results
+
+
+def bench_models(clips, models, presets, repeat, warmup, base_options):
+    """모델 크기 x 디코딩 옵션 x 클립 조합 측정"""
+    import whisper
+
+    results = []
+    for model_name in models:
+        load_start = time.perf_counter()
+        model = whisper.load_model(model_name, in_memory=True)
+        load_seconds = time.perf_counter() - load_start
+        print(f"[{model_name}] 모델 로딩 {load_seconds:.2f}초", file=sys.stderr)
+
+        for preset_name in presets:
+            options = dict(base_options)
+            options.update(DECODE_PRESETS[preset_name])
+
+            for name, source, audio in clips:
+                audio_seconds = len(audio) / SAMPLE_RATE
+
+                for _ in range(warmup):
+                    run_worker(model, audio, options)
+
+                latencies, cpu_times = [], []
+                with RssSampler() as rss:
+                    for _ in range(repeat):
+                        wall_start, cpu_start = time.perf_counter(), time.process_time()
+                        run_worker(model, audio, options)
+                        latencies.append(time.perf_counter() - wall_start)
+                        cpu_times.append(time.process_time() - cpu_start)
+
+                entry = {
+                    'model': model_name,
+                    'decode': preset_name,
+                    'clip': name,
+                    'source': source,
+                    'audio_seconds': audio_seconds,
+                    'model_load_seconds': load_seconds
+                }
+                entry.update(summarize(latencies, cpu_times, audio_seconds, rss.delta_mb))
+                results.append(entry)
+                print(f"[{model_name}/{preset_name}] {name}: RTF p50 {entry['rtf_p50']:.3f}, "
+                      f"p95 {entry['latency_p95']:.2f}s", file=sys.stderr)
+
+        del model
+
+    return results
+
+
+def environment_info():
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__
+    }
+    for module_name in ('torch', 'whisper'):
+        try:
+            module = __import__(module_name)
+            info[module_name] = getattr(module, '__version__', 'unknown')
+        except ImportError:
+            info[module_name] = None
+    return info
+
+
+def result_key(entry):
+    return (entry.get('model'), entry.get('decode'), entry.get('dtype'), entry['clip'])
+
+
+def compare_with_baseline(report, baseline_path, tolerance):
+    """기준 결과 대비 RTF p50 회귀 검사 - 회귀 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for section in ('results', 'preprocessing', 'recorder'):
+        previous = {result_key(e): e for e in baseline.get(section, [])}
+        for entry in report.get(section, []):
+            old = previous.get(result_key(entry))
+            if not old or old['rtf_p50'] <= 0:
+                continue
+            change = entry['rtf_p50'] / old['rtf_p50'] - 1
+            if change > tolerance:
+                regressions.append({
+                    'section': section,
+                    'key': list(result_key(entry)),
+                    'baseline_rtf_p50': old['rtf_p50'],
+                    'rtf_p50': entry['rtf_p50'],
+                    'change': change
+                })
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="음성 인식 파이프라인 RTF 벤치마크")
+    parser.add_argument('--models', nargs='+', default=['tiny', 'base'], help="측정할 Whisper 모델")
+    parser.add_argument('--decode', nargs='+', default=list(DECODE_PRESETS),
+                        choices=list(DECODE_PRESETS), help="디코딩 옵션 프리셋")
+    parser.add_argument('--durations', nargs='+', type=float, default=list(DEFAULT_DURATIONS),
+                        help="클립 길이 (초)")
+    parser.add_argument('--repeat', type=int, default=5, help="조합별 반복 횟수")
+    parser.add_argument('--warmup', type=int, default=1, help="측정 전 워밍업 횟수")
+    parser.add_argument('--preprocess-only', action='store_true', help="모델 없이 전처리만 측정")
+    parser.add_argument('--no-synthetic', action='store_true', help="합성 클립 제외 (clips/ 의 음성 클립만 사용)")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="허용 RTF 증가율 (기본 15%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    clips = build_clips(args.durations, include_synthetic=not args.no_synthetic)
+    if not clips:
+        print("측정할 클립이 없습니다", file=sys.stderr)
+        return 1
+
+    base_options = WhisperHandler._load_whisper_options()
+
+    report = {
+        'environment': environment_info(),
+        'parameters': {
+            'models': [] if args.preprocess_only else args.models,
+            'decode': args.decode,
+            'durations': args.durations,
+            'repeat': args.repeat,
+            'warmup': args.warmup
+        },
+        'recorder': bench_recorder(clips, max(args.repeat, 20)),
+        'preprocessing': bench_preprocessing(clips, max(args.repeat, 20), base_options),
+        'results': []
+    }
+
+    if not args.preprocess_only:
+        report['results'] = bench_models(clips, args.models, args.decode, args.repeat, args.warmup, base_options)
+
+    exit_code = 0
+    if args.baseline:
+        regressions = compare_with_baseline(report, args.baseline, args.tolerance)
+        report['regressions'] = regressions
+        if regressions:
+            print(f"⚠️ RTF 회귀 {len(regressions)}건 감지", file=sys.stderr)
+            exit_code = 2
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
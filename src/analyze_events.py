@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+이벤트 로그 분석 스크립트
+
+event_log.py가 기록한 JSONL 이벤트 로그에서 모델별 음성 인식 지연 시간 백분위수와
+실시간 배율(RTF) 분포, 녹음/전처리/클립보드 단계별 소요 시간을 계산합니다.
+
+사용 예:
+    python analyze_events.py                      # 설정의 이벤트 로그 (+ .1 파일)
+    python analyze_events.py events.jsonl --model base --since-hours 24
+    python analyze_events.py --json > report.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+from config import config
+from event_log import read_events
+from metrics import RTF_BUCKETS
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """선형 보간 백분위수 (정렬된 목록 기준)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(values):
+    """개수, 평균, 백분위수, 최댓값 요약 (값이 없으면 None)"""
+    values = sorted(value for value in values if isinstance(value, (int, float)))
+    if not values:
+        return None
+    summary = {'count': len(values), 'mean': sum(values) / len(values), 'max': values[-1]}
+    for pct in PERCENTILES:
+        summary[f'p{pct}'] = percentile(values, pct)
+    return summary
+
+
+def histogram(values, buckets):
+    """누적이 아닌 구간별 개수 ("≤0.5": n, ..., ">4.0": n)"""
+    counts = {f"≤{bucket}": 0 for bucket in buckets}
+    counts[f">{buckets[-1]}"] = 0
+    for value in values:
+        for bucket in buckets:
+            if value <= bucket:
+                counts[f"≤{bucket}"] += 1
+                break
+        else:
+            counts[f">{buckets[-1]}"] += 1
+    return counts
+
+
+def analyze(events, model=None, since=None):
+    """이벤트 목록을 보고서 딕셔너리로 집계"""
+    transcriptions = defaultdict(list)
+    stages = defaultdict(list)
+    total = 0
+
+    for event in events:
+        if since is not None and (event.get('ts') or 0) < since:
+            continue
+        total += 1
+        kind = event['event']
+
+        if kind == 'transcription':
+            if model is None or event.get('model') == model:
+                transcriptions[event.get('model') or 'unknown'].append(event)
+        elif kind == 'recording_stopped':
+            stages['recording_seconds'].append(event.get('duration'))
+        elif kind == 'audio_preprocessed':
+            stages['preprocess_seconds'].append(event.get('seconds'))
+        elif kind == 'clipboard_copy':
+            stages['clipboard_copy_seconds'].append(event.get('copy_seconds'))
+            stages['clipboard_verify_seconds'].append(event.get('verify_seconds'))
+        elif kind == 'model_loaded':
+            stages['model_load_seconds'].append(event.get('load_seconds'))
+
+    models = {}
+    for name, entries in sorted(transcriptions.items()):
+        succeeded = [entry for entry in entries if entry.get('success')]
+        rtf_values = [entry['rtf'] for entry in succeeded if isinstance(entry.get('rtf'), (int, float))]
+        models[name] = {
+            'transcriptions': len(entries),
+            'success_rate': len(succeeded) / len(entries),
+            'latency_seconds': summarize(entry.get('processing_seconds') for entry in succeeded),
+            'audio_seconds': summarize(entry.get('audio_seconds') for entry in succeeded),
+            'rtf': summarize(rtf_values),
+            'rtf_histogram': histogram(rtf_values, RTF_BUCKETS) if rtf_values else None
+        }
+
+    return {
+        'events': total,
+        'models': models,
+        'stages': {name: summarize(values) for name, values in sorted(stages.items())}
+    }
+
+
+def _format_summary(summary, seconds=True):
+    """초 단위 값은 ms로, RTF 같은 배율은 그대로 표시"""
+    if summary is None:
+        return "데이터 없음"
+    value = (lambda v: f"{v * 1000:.1f}ms") if seconds else (lambda v: f"{v:.3f}")
+    parts = [f"n={summary['count']}"]
+    parts += [f"p{pct} {value(summary[f'p{pct}'])}" for pct in PERCENTILES]
+    parts.append(f"max {value(summary['max'])}")
+    return ", ".join(parts)
+
+
+def format_report(report):
+    """사람이 읽는 텍스트 보고서"""
+    lines = [f"이벤트 {report['events']}개 분석"]
+
+    if not report['models']:
+        lines.append("음성 인식 이벤트가 없습니다")
+    for name, model in report['models'].items():
+        lines.append("")
+        lines.append(f"[모델 {name}] 인식 {model['transcriptions']}회, 성공률 {model['success_rate'] * 100:.1f}%")
+        lines.append(f"  처리 시간: {_format_summary(model['latency_seconds'])}")
+        lines.append(f"  오디오 길이: {_format_summary(model['audio_seconds'])}")
+        lines.append(f"  RTF: {_format_summary(model['rtf'], seconds=False)}")
+        if model['rtf_histogram']:
+            total = sum(model['rtf_histogram'].values())
+            for bucket, count in model['rtf_histogram'].items():
+                if count:
+                    bar = '█' * max(1, round(count / total * 40))
+                    lines.append(f"    {bucket:>6}: {count:5d} {bar}")
+
+    if any(report['stages'].values()):
+        lines.append("")
+        lines.append("[단계별 소요 시간]")
+        for name, summary in report['stages'].items():
+            lines.append(f"  {name}: {_format_summary(summary)}")
+
+    return "\n".join(lines)
+
+
+def default_paths():
+    """설정의 이벤트 로그 경로 (교체된 .1 파일이 있으면 먼저 포함)"""
+    path = config.get('events.file', 'events.jsonl')
+    return [candidate for candidate in (path + '.1', path) if os.path.exists(candidate)]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="구조화 이벤트 로그 분석 (모델별 지연 시간 백분위수, RTF 분포)")
+    parser.add_argument('paths', nargs='*', help="이벤트 로그 JSONL 파일 (기본: 설정의 events.file)")
+    parser.add_argument('--model', default=None, help="특정 모델만 분석")
+    parser.add_argument('--since-hours', type=float, default=None, help="최근 N시간 이벤트만 분석")
+    parser.add_argument('--json', action='store_true', help="JSON 형식으로 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """이벤트 분석 진입점"""
+    args = parse_args(argv)
+    paths = args.paths or default_paths()
+    if not paths:
+        print("분석할 이벤트 로그가 없습니다", file=sys.stderr)
+        return 1
+
+    since = time.time() - args.since_hours * 3600 if args.since_hours else None
+    try:
+        report = analyze(read_events(paths), model=args.model, since=since)
+    except OSError as e:
+        print(f"이벤트 로그를 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
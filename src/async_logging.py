@@ -0,0 +1,157 @@
+"""
+비동기 로깅 파이프라인 모듈
+
+오디오 콜백, pynput 리스너, 워커 스레드가 모두 루트 로거에 기록하므로 파일/콘솔
+핸들러를 직접 붙이면 각 스레드가 파일 I/O를 기다리며 서로 직렬화됩니다. 로그
+레코드는 제한된 크기의 큐에 넣기만 하고(가득 차면 버리고 개수만 셈), 전용 기록
+스레드가 실제 핸들러로 내보냅니다. 같은 위치(파일, 줄)에서 반복되는 로그는
+구간마다 일정 개수만 통과시키고 생략한 개수를 다음 로그에 덧붙입니다.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+
+class CallSiteRateLimiter(logging.Filter):
+    """호출 위치별 로그 빈도 제한 필터
+
+    interval초 구간마다 위치당 burst개까지 통과시킵니다. 다음 구간에 처음 통과하는
+    로그에 앞 구간에서 생략된 개수를 표시합니다.
+    """
+
+    def __init__(self, interval=1.0, burst=5):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.sites = {}  # (파일, 줄) -> [구간 시작, 통과 수, 생략 수]
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if self.interval <= 0:
+            return True
+
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            site = self.sites.get(key)
+            if site is None:
+                self.sites[key] = [now, 1, 0]
+                return True
+
+            if now - site[0] >= self.interval:
+                skipped = site[2]
+                site[0], site[1], site[2] = now, 1, 0
+                if skipped:
+                    record.msg = f"{record.getMessage()} (같은 위치 로그 {skipped}건 생략)"
+                    record.args = None
+                return True
+
+            if site[1] < self.burst:
+                site[1] += 1
+                return True
+
+            site[2] += 1
+            self.suppressed += 1
+            return False
+
+
+class BoundedQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _ReportingQueueListener(QueueListener):
+    """삭제된 로그가 있으면 다음 레코드 앞에 경고를 남기는 리스너"""
+
+    def __init__(self, log_queue, queue_handler, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self.reported_dropped = 0
+
+    def handle(self, record):
+        dropped = self.queue_handler.dropped
+        if dropped > self.reported_dropped:
+            notice = logging.makeLogRecord({
+                'name': __name__,
+                'levelno': logging.WARNING,
+                'levelname': logging.getLevelName(logging.WARNING),
+                'msg': f"로그 큐가 가득 차 {dropped - self.reported_dropped}건을 기록하지 못했습니다"
+            })
+            self.reported_dropped = dropped
+            super().handle(notice)
+        super().handle(record)
+
+    def enqueue_sentinel(self):
+        # 큐가 가득 차 있어도 종료 신호는 기록 스레드가 비울 때까지 기다려 넣음
+        self.queue.put(self._sentinel)
+
+
+class AsyncLogPipeline:
+    """루트 로거용 큐 기반 로깅 파이프라인 (전용 기록 스레드)"""
+
+    def __init__(self):
+        self.queue_handler = None
+        self.rate_limiter = None
+        self.listener = None
+        self._atexit_registered = False
+
+    @property
+    def running(self):
+        return self.listener is not None
+
+    def start(self, handlers, queue_size=10000, rate_limit_interval=1.0, rate_limit_burst=5):
+        """handlers를 기록 스레드로 옮기고 루트 로거에는 큐 핸들러만 연결"""
+        self.stop()
+
+        log_queue = queue.Queue(maxsize=max(int(queue_size), 1))
+        self.queue_handler = BoundedQueueHandler(log_queue)
+        self.rate_limiter = CallSiteRateLimiter(rate_limit_interval, rate_limit_burst)
+        self.queue_handler.addFilter(self.rate_limiter)
+
+        self.listener = _ReportingQueueListener(log_queue, self.queue_handler, *handlers)
+        self.listener.start()
+
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        return self.queue_handler
+
+    def stop(self):
+        """남은 레코드를 모두 기록한 뒤 기록 스레드 종료 및 핸들러 닫기"""
+        listener, self.listener = self.listener, None
+        if listener is None:
+            return
+
+        listener.stop()
+        for handler in listener.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+
+    @property
+    def stats(self):
+        return {
+            'dropped': self.queue_handler.dropped if self.queue_handler else 0,
+            'suppressed': self.rate_limiter.suppressed if self.rate_limiter else 0,
+            'queued': self.queue_handler.queue.qsize() if self.running else 0
+        }
+
+
+# 전역 파이프라인 인스턴스
+log_pipeline = AsyncLogPipeline()
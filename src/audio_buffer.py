@@ -0,0 +1,161 @@
+"""
+공유 메모리 기반 오디오 버퍼 모듈
+"""
+
+import logging
+import numpy as np
+from multiprocessing import shared_memory
+
+
+class AudioBuffer:
+    """녹음 데이터를 복사 없이 전달하기 위한 오디오 버퍼 핸들
+
+    데이터는 multiprocessing.shared_memory 블록에 저장되며, 레코더 →
+    SpeechToTextApp → WhisperWorker 로 핸들만 전달됩니다. descriptor()로
+    다른 프로세스에서 같은 메모리를 attach()할 수 있습니다.
+    """
+
+    def __init__(self, shm, base, sample_rate, owner=True):
+        self.logger = logging.getLogger(__name__)
+        self._shm = shm
+        self._base = base
+        self._start = 0
+        self._stop = len(base)
+        self.sample_rate = sample_rate
+        self.owner = owner
+        self.released = False
+
+    @classmethod
+    def allocate(cls, num_samples, sample_rate=16000, dtype=np.float32):
+        """지정한 길이의 빈 버퍼 할당"""
+        dtype = np.dtype(dtype)
+        nbytes = max(int(num_samples) * dtype.itemsize, 1)
+
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            base = np.ndarray((int(num_samples),), dtype=dtype, buffer=shm.buf)
+        except (OSError, ValueError) as e:
+            # /dev/shm을 사용할 수 없는 환경에서는 일반 메모리로 폴백
+            logging.getLogger(__name__).warning(f"공유 메모리 할당 실패, 일반 메모리 사용: {e}")
+            shm = None
+            base = np.empty(int(num_samples), dtype=dtype)
+
+        return cls(shm, base, sample_rate)
+
+    @classmethod
+    def from_frames(cls, frames, sample_rate=16000, dtype=np.float32):
+        """녹음 프레임 목록을 하나의 버퍼로 병합 (중간 배열 없이 직접 기록)"""
+        total = sum(frame.size for frame in frames)
+        buffer = cls.allocate(total, sample_rate, dtype)
+
+        position = 0
+        for frame in frames:
+            # 기존 np.concatenate(...).flatten()과 동일한 순서로 기록
+            length = frame.size
+            buffer._base[position:position + length] = frame.reshape(-1)
+            position += length
+
+        return buffer
+
+    @classmethod
+    def from_array(cls, audio_data, sample_rate=16000):
+        """기존 numpy 배열을 버퍼로 복사"""
+        audio_data = np.asarray(audio_data).reshape(-1)
+        buffer = cls.allocate(len(audio_data), sample_rate, audio_data.dtype)
+        buffer._base[:] = audio_data
+        return buffer
+
+    @classmethod
+    def attach(cls, descriptor):
+        """다른 프로세스에서 descriptor()로 받은 버퍼에 연결"""
+        shm = shared_memory.SharedMemory(name=descriptor['name'])
+        dtype = np.dtype(descriptor['dtype'])
+        base = np.ndarray((descriptor['capacity'],), dtype=dtype, buffer=shm.buf)
+
+        buffer = cls(shm, base, descriptor['sample_rate'], owner=False)
+        buffer.trim(descriptor['start'], descriptor['stop'])
+        return buffer
+
+    @property
+    def array(self):
+        """유효 구간의 numpy 뷰 (복사 없음)"""
+        if self.released:
+            raise ValueError("이미 해제된 오디오 버퍼입니다")
+        return self._base[self._start:self._stop]
+
+    @property
+    def dtype(self):
+        return self._base.dtype
+
+    @property
+    def duration(self):
+        """버퍼 길이 (초)"""
+        return len(self) / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def is_shared(self):
+        return self._shm is not None
+
+    def trim(self, start, stop):
+        """유효 구간을 [start, stop)으로 축소 (현재 구간 기준 상대 인덱스)"""
+        length = self._stop - self._start
+        start = max(0, min(int(start), length))
+        stop = max(start, min(int(stop), length))
+        self._stop = self._start + stop
+        self._start = self._start + start
+        return self
+
+    def descriptor(self):
+        """프로세스 간 전달용 버퍼 정보"""
+        if self._shm is None:
+            raise ValueError("공유 메모리 버퍼가 아닙니다")
+        return {
+            'name': self._shm.name,
+            'dtype': self._base.dtype.str,
+            'capacity': len(self._base),
+            'start': self._start,
+            'stop': self._stop,
+            'sample_rate': self.sample_rate
+        }
+
+    def release(self):
+        """버퍼 해제 (소유자인 경우 공유 메모리 삭제)"""
+        if self.released:
+            return
+
+        self.released = True
+        self._base = None
+
+        if self._shm is None:
+            return
+
+        try:
+            self._shm.close()
+        except BufferError:
+            # 아직 뷰를 들고 있는 소비자가 있으면 매핑은 GC에 맡김
+            self.logger.debug("오디오 버퍼 뷰가 남아있어 close 생략")
+
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.array
+        if dtype is not None and array.dtype != dtype:
+            return array.astype(dtype)
+        return array
+
+    def __len__(self):
+        return 0 if self.released else self._stop - self._start
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
+
+    def __repr__(self):
+        return (f"AudioBuffer(samples={len(self)}, sample_rate={self.sample_rate}, "
+                f"shared={self.is_shared})")
@@ -11,24 +11,41 @@ from collections import deque
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from io import BytesIO
 from config import config
+from audio_buffer import AudioBuffer
+from tracing import tracer
+from metrics import metrics
+from event_log import event_log
+from device_cache import DeviceCapabilityCache, DeviceHotplugWatcher
 
 
 class AudioRecorder(QObject):
-    recording_finished = pyqtSignal(np.ndarray)
+    recording_finished = pyqtSignal(object)  # AudioBuffer (공유 메모리 핸들)
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal()
     device_changed = pyqtSignal(str)
+    devices_changed = pyqtSignal()  # 장치 연결/해제 감지 (감시 스레드에서 발생)
     audio_level_changed = pyqtSignal(float)
     
-    def __init__(self):
+    def __init__(self, probe_device=True):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         
         # 설정에서 녹음 파라미터 로드
         self.sample_rate = config.get('audio.sample_rate', 16000)
         self.channels = config.get('audio.channels', 1)
-        self.dtype = np.float32
+        self.dtype = self._capture_dtype(config.get('audio.dtype', 'float32'))
+        # 정수 형식이면 레벨 계산 시 -1.0 ~ 1.0 범위로 환산
+        self.level_scale = 1.0 / 32768 if self.dtype == np.int16 else 1.0
         self.device_index = config.get('audio.device_index', None)
+        self.requested_sample_rate = self.sample_rate
+        self.configured_device_index = self.device_index  # 식별자 도입 이전 설정 이전용
+        # 선호 장치 식별자 (장치 번호는 연결/해제 시 바뀌므로 "호스트 API|이름"으로 저장)
+        self.preferred_device_id = config.get('audio.device_id', None)
+        self.active_device_id = None
+        self.fallback_device = None  # 미리 검증한 대체 장치 (번호, 샘플레이트, 식별자, 이름)
+        self.pending_device = None  # 녹음 중에 정해진 사용 장치 (다음 녹음 시작 시 적용)
+        self.device_lock = threading.Lock()  # 사용 장치 교체와 녹음 시작 사이 동기화
+        self._resolve_lock = threading.Lock()
         self.silence_threshold = config.get('audio.silence_threshold', 0.01)
         self.remove_silence_enabled = config.get('audio.remove_silence', True)
         self.buffer_size = config.get('advanced.audio_buffer_size', 1024)
@@ -37,7 +54,10 @@ class AudioRecorder(QObject):
         self.is_recording = False
         self.audio_data = deque()  # 효율적인 데이터 추가를 위해 deque 사용
         self.stream = None
+        self.stream_sample_rate = None  # 현재 스트림을 연 샘플레이트 (녹음 중 장치 재설정과 무관)
         self.recording_start_time = None
+        self.capture_start_perf = None
+        self.xrun_count = 0  # 오디오 스트림 overflow/underflow 횟수 (오디오 스레드만 갱신)
         self.max_recording_duration = 300  # 5분 최대 녹음 시간
         
         # 실시간 오디오 레벨 모니터링
@@ -53,86 +73,237 @@ class AudioRecorder(QObject):
         self.max_silence_duration = 3000  # 3초 무음시 자동 종료
         self.auto_stop_enabled = config.get('audio.auto_stop_silence', False)
         
-        self.setup_audio_device()
+        # 장치 호환성 검사 결과 캐시 및 핫플러그 감시
+        self.device_cache = DeviceCapabilityCache(config.get('audio.device_cache_file', 'config/device_cache.json'))
+        self.hotplug_watcher = None
+        self._portaudio_signature = None
+        hotplug_interval = config.get('audio.hotplug_interval', 2.0)
+        if hotplug_interval:
+            self.hotplug_watcher = DeviceHotplugWatcher(self._on_devices_changed, hotplug_interval)
+            if not self.hotplug_watcher.start():
+                # OS 수준 서명이 없는 플랫폼(Windows, macOS)은 PortAudio 장치 목록을 느린 주기로 비교
+                poll_interval = max(hotplug_interval, config.get('audio.hotplug_poll_interval', 30.0))
+                self.hotplug_watcher = DeviceHotplugWatcher(
+                    self._on_devices_changed, poll_interval, signature=self._portaudio_device_signature
+                )
+                self.hotplug_watcher.start()
+        
+        # 장치 탐색은 Qt 객체를 건드리지 않으므로 probe_device=False로 생성한 뒤
+        # 다른 스레드에서 setup_audio_device()를 호출할 수 있음
+        if probe_device:
+            self.setup_audio_device()
+    
+    def _capture_dtype(self, name):
+        """녹음 형식 (int16이면 장치 기본 형식 그대로 받아 메모리를 절반만 사용)"""
+        if name in ('int16', 'float32'):
+            return getattr(np, name)
+        self.logger.warning(f"지원하지 않는 녹음 형식 '{name}', float32 사용")
+        return np.float32
     
     def setup_audio_device(self):
         """오디오 장치 설정 및 검증"""
         try:
-            # 사용 가능한 장치 목록 가져오기
-            devices = self.get_device_list()
-            if not devices:
-                raise Exception("사용 가능한 오디오 입력 장치가 없습니다")
-            
-            # 설정된 장치 인덱스 확인
-            if self.device_index is not None:
-                device_valid = any(d['index'] == self.device_index for d in devices)
-                if not device_valid:
-                    self.logger.warning(f"설정된 장치 인덱스 {self.device_index}가 유효하지 않음")
-                    self.device_index = None
-            
-            # 기본 입력 장치 또는 지정된 장치 정보 가져오기
-            if self.device_index is not None:
-                device_info = sd.query_devices(self.device_index)
-            else:
-                device_info = sd.query_devices(kind='input')
-                self.device_index = device_info.get('index', None)
-            
-            self.logger.info(f"사용할 마이크: {device_info['name']} (인덱스: {self.device_index})")
-            
-            # 장치가 지원하는 샘플레이트 확인 및 조정
-            self.validate_and_adjust_settings(device_info)
+            self.resolve_device()
             
             # 설정 저장
             config.set('audio.device_index', self.device_index)
             config.set('audio.sample_rate', self.sample_rate)
+            self.device_cache.save()
             
         except Exception as e:
             self.logger.error(f"오디오 장치 설정 실패: {e}")
             # 기본값으로 폴백
-            self.device_index = None
-            self.sample_rate = 16000
+            with self.device_lock:
+                self.device_index = None
+                self.sample_rate = 16000
+                self.fallback_device = None
+    
+    def resolve_device(self, notify=True):
+        """선호 장치를 안정적인 식별자(호스트 API + 이름)로 다시 찾고 대체 장치까지 미리 검증
+        
+        장치 번호는 연결/해제 때마다 바뀌므로 설정된 식별자로 현재 번호를 찾습니다.
+        선호 장치가 없으면 기본/호환 장치 순으로 고르고, 녹음 시작 시 바로 쓸 수
+        있도록 다음 후보 하나의 샘플레이트도 검증해 둡니다. 감시 스레드에서도
+        호출되며, 사용 장치가 바뀌면 device_changed를 발생시킵니다.
+        """
+        with self._resolve_lock:
+            devices = self.get_device_list()
+            if not devices:
+                raise Exception("사용 가능한 오디오 입력 장치가 없습니다")
+            
+            candidates = [device for device in devices if device['compatible']]
+            
+            # 이전 버전 설정(장치 번호만 저장)은 처음 한 번 식별자로 변환
+            if not self.preferred_device_id and self.configured_device_index is not None:
+                legacy = next((d for d in candidates if d['index'] == self.configured_device_index), None)
+                if legacy is not None:
+                    self.preferred_device_id = legacy['id']
+                    config.set('audio.device_id', self.preferred_device_id)
+                self.configured_device_index = None
+            
+            preferred = None
+            if self.preferred_device_id:
+                preferred = next((d for d in candidates if d['id'] == self.preferred_device_id), None)
+                if preferred is None:
+                    self.logger.warning(f"선호 장치가 연결되어 있지 않음: {self.preferred_device_id}")
+            if preferred is not None:
+                candidates.remove(preferred)
+                candidates.insert(0, preferred)
+            
+            # 후보를 순서대로 검증해 사용 장치와 대체 장치를 정함 (검사 결과는 캐시 사용)
+            resolved = []
+            for device in candidates:
+                device_info = sd.query_devices(device['index'])
+                sample_rate = self._supported_sample_rate(device_info)
+                if sample_rate is not None:
+                    resolved.append((device, sample_rate))
+                    if len(resolved) == 2:
+                        break
+            
+            if not resolved:
+                raise Exception("호환되는 오디오 설정을 찾을 수 없습니다")
+            
+            (device, sample_rate), fallback = resolved[0], (resolved[1] if len(resolved) > 1 else None)
+            with self.device_lock:
+                previous_id = self.active_device_id
+                self.fallback_device = (fallback[0]['index'], fallback[1], fallback[0]['id'], fallback[0]['name']) if fallback else None
+                if self.is_recording:
+                    # 열려 있는 스트림의 장치/샘플레이트는 유지하고 다음 녹음 시작 시 적용
+                    self.pending_device = (device['index'], sample_rate, device['id'])
+                else:
+                    self.pending_device = None
+                    self.device_index = device['index']
+                    self.sample_rate = sample_rate
+                    self.active_device_id = device['id']
+            
+            self.logger.info(
+                f"사용할 마이크: {device['name']} (인덱스: {device['index']}, {sample_rate}Hz)"
+                + (f", 대체 장치: {fallback[0]['name']}" if fallback else "")
+            )
+            if notify and previous_id is not None and previous_id != device['id']:
+                self.device_changed.emit(device['name'])
+            return device
     
     def validate_and_adjust_settings(self, device_info):
         """장치 설정 검증 및 조정"""
-        try:
-            # 현재 설정으로 테스트
-            sd.check_input_settings(
-                device=self.device_index,
-                channels=self.channels,
-                samplerate=self.sample_rate,
-                dtype=self.dtype
-            )
-            self.logger.info(f"오디오 설정 검증 완료: {self.sample_rate}Hz, {self.channels}ch")
-            
-        except Exception as e:
-            self.logger.warning(f"현재 설정 불가: {e}")
-            
-            # 장치의 기본 샘플레이트로 조정
+        sample_rate = self._supported_sample_rate(device_info)
+        if sample_rate is None:
+            raise Exception("호환되는 오디오 설정을 찾을 수 없습니다")
+        
+        if sample_rate != self.sample_rate:
+            self.logger.info(f"샘플레이트를 {sample_rate}Hz로 조정")
+        self.sample_rate = sample_rate
+        self.logger.info(f"오디오 설정 검증 완료: {self.sample_rate}Hz, {self.channels}ch")
+    
+    def _supported_sample_rate(self, device_info):
+        """설정된 샘플레이트, 장치 기본값, 44100Hz 순으로 지원되는 첫 샘플레이트 (없으면 None)"""
+        for sample_rate in dict.fromkeys((self.requested_sample_rate, int(device_info['default_samplerate']), 44100)):
+            try:
+                self._check_input_settings(device_info, sample_rate)
+                return sample_rate
+            except Exception as e:
+                self.logger.debug(f"{device_info['name']}: {sample_rate}Hz 사용 불가 ({e})")
+        return None
+    
+    def _check_input_settings(self, device_info, samplerate):
+        """현재 채널/형식으로 샘플레이트 지원 여부 확인 (결과는 장치 캐시 사용, 실패 시 예외)"""
+        def probe():
             try:
-                new_sample_rate = int(device_info['default_samplerate'])
                 sd.check_input_settings(
-                    device=self.device_index,
+                    device=device_info.get('index', self.device_index),
                     channels=self.channels,
-                    samplerate=new_sample_rate,
+                    samplerate=samplerate,
                     dtype=self.dtype
                 )
-                self.sample_rate = new_sample_rate
-                self.logger.info(f"샘플레이트를 {self.sample_rate}Hz로 조정")
-                
-            except Exception as e2:
-                self.logger.error(f"샘플레이트 조정 실패: {e2}")
-                # 최후의 수단으로 44100Hz 시도
-                try:
-                    sd.check_input_settings(
-                        device=self.device_index,
-                        channels=self.channels,
-                        samplerate=44100,
-                        dtype=self.dtype
-                    )
-                    self.sample_rate = 44100
-                    self.logger.info("샘플레이트를 44100Hz로 폴백")
-                except:
-                    raise Exception("호환되는 오디오 설정을 찾을 수 없습니다")
+                return True
+            except Exception as e:
+                return str(e) or "지원하지 않는 설정"
+        
+        check = f"{self.channels}ch/{samplerate}Hz/{np.dtype(self.dtype).name}"
+        result = self.device_cache.lookup(self._device_key(device_info), check, probe)
+        if result is not True:
+            raise Exception(result)
+    
+    @staticmethod
+    def _device_id(device):
+        """장치의 안정적인 식별자 (호스트 API + 이름)"""
+        try:
+            hostapi = sd.query_hostapis(device['hostapi'])['name']
+        except Exception:
+            hostapi = device.get('hostapi', '')
+        return f"{hostapi}|{device['name']}"
+    
+    @classmethod
+    def _device_key(cls, device):
+        """장치 번호 대신 식별자와 특성으로 만든 캐시 키 (실행마다 번호가 바뀔 수 있음)"""
+        return f"{cls._device_id(device)}|{device['max_input_channels']}|{device['default_samplerate']}"
+    
+    def _portaudio_device_signature(self):
+        """PortAudio 장치 목록으로 만든 장치 구성 서명 (system_device_signature 대체)
+        
+        PortAudio는 초기화 시점의 목록을 유지하므로 열린 스트림이 없을 때 재초기화한
+        뒤 목록을 읽습니다. 녹음 중에는 재초기화할 수 없으므로 직전 서명을 반환합니다.
+        """
+        with self.device_lock:
+            if self.is_recording or self.stream is not None:
+                return self._portaudio_signature
+            
+            try:
+                if self._portaudio_signature is not None:
+                    sd._terminate()  # _on_devices_changed 참고
+                    sd._initialize()
+                hostapis = sd.query_hostapis()
+                devices = sd.query_devices()
+            except Exception as e:
+                self.logger.debug(f"PortAudio 장치 목록 조회 실패: {e}")
+                return self._portaudio_signature
+            
+            self._portaudio_signature = '\n'.join(
+                [str(len(hostapis))] +
+                [f"{device['hostapi']}|{device['name']}|{device['max_input_channels']}" for device in devices]
+            )
+            return self._portaudio_signature
+    
+    def _on_devices_changed(self):
+        """감시 스레드에서 호출 - 장치 목록을 다시 읽도록 PortAudio 재초기화"""
+        # start_recording은 스트림을 열고 is_recording을 표시할 때까지 같은 잠금을 잡으므로
+        # 열린 스트림이 있는 동안에는 재초기화하지 않음 (중지 후 스트림을 닫는 중인 경우 포함)
+        with self.device_lock:
+            if self.is_recording or self.stream is not None:
+                return False  # 녹음이 끝난 뒤 다음 주기에 다시 처리
+            
+            self.logger.info("오디오 장치 구성 변경 감지")
+            try:
+                # PortAudio는 Pa_Initialize 시점의 장치 목록을 유지하고, sounddevice에는
+                # 목록을 새로 읽는 공개 API가 없음. sounddevice 문서(query_devices)가 안내하는
+                # 방법대로 내부 함수 _terminate/_initialize로 재초기화해야 새 장치가 보임.
+                # 재초기화하면 열린 스트림이 모두 무효가 되므로 위 조건에서만 호출함.
+                sd._terminate()
+                sd._initialize()
+            except Exception as e:
+                self.logger.warning(f"PortAudio 재초기화 실패: {e}")
+        
+        # 녹음 시작 시 다시 검사하지 않도록 여기서 사용/대체 장치를 미리 정함
+        self._resolve_in_background()
+        self.devices_changed.emit()
+        return True
+    
+    def _resolve_in_background(self, failed_index=None):
+        """감시/보조 스레드에서 사용 장치와 대체 장치 재설정 (failed_index 장치는 다시 검사)"""
+        try:
+            if failed_index is not None:
+                self._invalidate_device(failed_index)
+            self.resolve_device()
+            config.set('audio.device_index', self.device_index)
+            self.device_cache.save()
+        except Exception as e:
+            self.logger.error(f"장치 재설정 실패: {e}")
+    
+    def close(self):
+        """핫플러그 감시 중지 및 장치 캐시 저장"""
+        if self.hotplug_watcher:
+            self.hotplug_watcher.stop()
+        self.device_cache.save()
     
     def set_device(self, device_index):
         """오디오 장치 변경"""
@@ -140,39 +311,46 @@ class AudioRecorder(QObject):
             self.logger.warning("녹음 중에는 장치를 변경할 수 없습니다")
             return False
         
+        # 이전 설정 백업
+        old_preferred = self.preferred_device_id
+        with self.device_lock:
+            old_state = (self.device_index, self.sample_rate, self.active_device_id, self.fallback_device)
+        
         try:
             # 새 장치 정보 가져오기
             device_info = sd.query_devices(device_index)
             if device_info['max_input_channels'] == 0:
                 raise Exception("입력 장치가 아닙니다")
             
-            # 이전 설정 백업
-            old_device = self.device_index
-            old_sample_rate = self.sample_rate
-            
-            # 새 장치 설정
-            self.device_index = device_index
-            self.validate_and_adjust_settings(device_info)
+            # 새 장치를 선호 장치로 지정하고 대체 장치와 함께 검증
+            self.preferred_device_id = self._device_id(device_info)
+            device = self.resolve_device(notify=False)
+            if device['id'] != self.preferred_device_id:
+                raise Exception("선택한 장치와 호환되는 오디오 설정을 찾을 수 없습니다")
             
             self.logger.info(f"오디오 장치 변경: {device_info['name']}")
             self.device_changed.emit(device_info['name'])
             
             # 설정 저장
             config.set('audio.device_index', self.device_index)
-            config.save_settings()
+            config.set('audio.device_id', self.preferred_device_id)
+            if not config.save_settings(immediate=True):
+                raise Exception(f"설정 파일 저장 실패: {config.save_error}")
             
             return True
             
         except Exception as e:
             self.logger.error(f"장치 변경 실패: {e}")
             # 이전 설정 복원
-            self.device_index = old_device
-            self.sample_rate = old_sample_rate
+            self.preferred_device_id = old_preferred
+            with self.device_lock:
+                self.device_index, self.sample_rate, self.active_device_id, self.fallback_device = old_state
             return False
     
     def audio_callback(self, indata, frames, time, status):
         """실시간 오디오 스트림 콜백"""
         if status:
+            self.xrun_count += 1
             self.logger.warning(f"오디오 스트림 상태: {status}")
         
         if self.is_recording:
@@ -181,7 +359,7 @@ class AudioRecorder(QObject):
             self.audio_data.append(audio_frame)
             
             # 실시간 오디오 레벨 계산
-            rms_level = np.sqrt(np.mean(audio_frame**2))
+            rms_level = np.sqrt(np.mean(np.square(audio_frame, dtype=np.float32))) * self.level_scale
             self.level_buffer.append(rms_level)
             
             # 평균 레벨 계산 (노이즈 감소)
@@ -227,26 +405,32 @@ class AudioRecorder(QObject):
             self.silence_duration = 0
             self.recording_start_time = time.time()
             
-            # 스트림 생성 및 시작
-            self.stream = sd.InputStream(
-                device=self.device_index,
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=self.dtype,
-                blocksize=self.buffer_size,
-                callback=self.audio_callback,
-                latency='low'  # 낮은 지연시간 설정
-            )
+            # 스트림 생성 및 시작 (장치는 미리 정해 두므로 여기서는 검사하지 않음)
+            with self.device_lock:
+                if self.pending_device is not None:
+                    self.device_index, self.sample_rate, self.active_device_id = self.pending_device
+                    self.pending_device = None
+                failed_over, failed_index = self._start_stream()
+                
+                # 스트림을 연 상태를 잠금 안에서 표시해 감시 스레드가 PortAudio를 재초기화하지 않게 함
+                device_index, sample_rate = self.device_index, self.sample_rate
+                self.stream_sample_rate = sample_rate
+                self.capture_start_perf = time.perf_counter()
+                self.is_recording = True
             
-            self.stream.start()
-            self.is_recording = True
+            if failed_over:
+                self.device_changed.emit(failed_over)
+                # 실패한 장치 캐시 무효화와 다음 대체 장치 선정은 녹음 경로 밖에서 처리
+                threading.Thread(target=self._resolve_in_background, args=(failed_index,), daemon=True).start()
             
             # 타이머 시작
             self.audio_level_timer.start(100)  # 100ms마다 레벨 업데이트
             if self.auto_stop_enabled:
                 self.silence_timer.start(100)  # 100ms마다 무음 체크
             
-            self.logger.info(f"녹음 시작됨 - 장치: {self.device_index}, 샘플레이트: {self.sample_rate}Hz")
+            self.logger.info(f"녹음 시작됨 - 장치: {device_index}, 샘플레이트: {sample_rate}Hz")
+            event_log.emit('recording_started', device=self.active_device_id, sample_rate=sample_rate,
+                           channels=self.channels, dtype=np.dtype(self.dtype).name)
             self.recording_started.emit()
             
             return True
@@ -255,8 +439,61 @@ class AudioRecorder(QObject):
             self.logger.error(f"녹음 시작 실패: {e}")
             self.is_recording = False
             self.cleanup_recording()
+            self._invalidate_current_device()
             return False
     
+    def _start_stream(self):
+        """사용 장치로 스트림을 열고, 실패하면 대체 장치로 전환 (device_lock 안에서 호출)
+        
+        대체 장치로 전환했으면 (대체 장치 이름, 실패한 장치 번호)를 반환합니다.
+        """
+        with tracer.span('stream_start', device=self.device_index):
+            try:
+                self.stream = self._open_stream(self.device_index, self.sample_rate)
+                return None, None
+            except Exception as e:
+                if self.fallback_device is None:
+                    raise
+                
+                # 사용 장치가 사라진 경우 미리 검증한 대체 장치로 즉시 전환
+                index, sample_rate, device_id, name = self.fallback_device
+                self.logger.warning(f"녹음 장치 열기 실패 ({e}) - 대체 장치 사용: {name}")
+                failed_index = self.device_index
+                self.device_index, self.sample_rate, self.active_device_id = index, sample_rate, device_id
+                self.fallback_device = None
+                self.stream = self._open_stream(index, sample_rate)
+                return name, failed_index
+    
+    def _open_stream(self, device_index, sample_rate):
+        """입력 스트림을 열고 시작 (실패하면 닫고 예외 전달)"""
+        stream = sd.InputStream(
+            device=device_index,
+            samplerate=sample_rate,
+            channels=self.channels,
+            dtype=self.dtype,
+            blocksize=self.buffer_size,
+            callback=self.audio_callback,
+            latency='low'  # 낮은 지연시간 설정
+        )
+        try:
+            stream.start()
+        except Exception:
+            stream.close()
+            raise
+        return stream
+    
+    def _invalidate_current_device(self):
+        """스트림을 열 수 없었던 장치의 캐시된 검사 결과 삭제 (다음 설정 시 다시 검사)"""
+        self._invalidate_device(self.device_index)
+    
+    def _invalidate_device(self, device_index):
+        try:
+            device = sd.query_devices(device_index) if device_index is not None else sd.query_devices(kind='input')
+            self.device_cache.invalidate(self._device_key(device))
+            self.device_cache.save()
+        except Exception:
+            pass
+    
     def cleanup_recording(self):
         """녹음 관련 리소스 정리"""
         # 타이머 중지
@@ -282,30 +519,45 @@ class AudioRecorder(QObject):
         
         try:
             self.is_recording = False
+            tracer.add_span('capture', self.capture_start_perf, blocks=len(self.audio_data))
             
             # 리소스 정리
-            self.cleanup_recording()
+            with tracer.span('stream_stop'):
+                self.cleanup_recording()
             
             # 녹음 시간 계산
             recording_duration = 0
             if self.recording_start_time:
                 recording_duration = time.time() - self.recording_start_time
+                metrics.observe('recording_seconds', recording_duration)
             
             # 오디오 데이터 처리
             if self.audio_data:
-                # deque를 리스트로 변환 후 배열로 병합
+                # deque의 프레임을 공유 메모리 버퍼에 직접 병합 (중간 배열 없음)
                 audio_frames = list(self.audio_data)
+                self.audio_data.clear()
                 if audio_frames:
-                    audio_array = np.concatenate(audio_frames, axis=0)
-                    audio_array = audio_array.flatten()  # 2D -> 1D
+                    sample_rate = self.stream_sample_rate or self.sample_rate
+                    with tracer.span('frame_merge', frames=len(audio_frames)):
+                        audio_buffer = AudioBuffer.from_frames(audio_frames, sample_rate, self.dtype)
+                    event_log.emit('recording_stopped', duration=recording_duration, samples=len(audio_buffer),
+                                   blocks=len(audio_frames), xruns=self.xrun_count, sample_rate=sample_rate)
+                    del audio_frames
                     
-                    self.logger.info(f"원본 오디오: {len(audio_array)} 샘플, {recording_duration:.2f}초")
+                    self.logger.info(f"원본 오디오: {len(audio_buffer)} 샘플, {recording_duration:.2f}초")
                     
-                    # Whisper 호환 형식으로 변환
-                    processed_audio = self.process_audio_for_whisper(audio_array)
+                    # Whisper 호환 형식으로 변환 (버퍼 내부에서 처리)
+                    input_samples = len(audio_buffer)
+                    preprocess_start = time.perf_counter()
+                    with tracer.span('audio_preprocess', samples=input_samples):
+                        processed_audio = self.process_buffer_for_whisper(audio_buffer)
+                    event_log.emit('audio_preprocessed', input_samples=input_samples,
+                                   output_samples=len(processed_audio) if processed_audio is not None else 0,
+                                   sample_rate=processed_audio.sample_rate if processed_audio is not None else None,
+                                   seconds=time.perf_counter() - preprocess_start)
                     
                     if processed_audio is not None and len(processed_audio) > 0:
-                        final_duration = len(processed_audio) / self.sample_rate
+                        final_duration = processed_audio.duration
                         self.logger.info(f"처리된 오디오: {len(processed_audio)} 샘플, {final_duration:.2f}초")
                         
                         self.recording_stopped.emit()
@@ -363,6 +615,58 @@ class AudioRecorder(QObject):
             self.logger.error(f"오디오 처리 실패: {e}")
             return None
     
+    def process_buffer_for_whisper(self, audio_buffer):
+        """AudioBuffer를 복사 없이 Whisper 호환 형식으로 처리
+        
+        정규화는 버퍼 내부에서 수행하고, 무음 제거는 유효 구간만 축소합니다.
+        int16 녹음은 정규화 단계에서 한 번만 float32 버퍼로 변환하고, 리샘플링이
+        필요한 경우에만 새 버퍼를 할당합니다.
+        """
+        try:
+            audio_data = audio_buffer.array
+            if len(audio_data) == 0:
+                audio_buffer.release()
+                return None
+            
+            # 1. 정규화 (-1.0 ~ 1.0 범위)
+            max_val = max(float(audio_data.max()), -float(audio_data.min()))
+            scale = np.float32(1.0 / max_val) if max_val > 0 else np.float32(1.0)
+            if audio_data.dtype == np.float32:
+                np.multiply(audio_data, scale, out=audio_data)
+            else:
+                # 정수 녹음은 float32 버퍼로 변환과 정규화를 한 번에 수행 후 원본 해제
+                converted = AudioBuffer.allocate(len(audio_data), audio_buffer.sample_rate, np.float32)
+                np.multiply(audio_data, scale, out=converted.array, dtype=np.float32)
+                audio_buffer.release()
+                audio_buffer = converted
+                audio_data = converted.array
+            
+            # 2. 무음 제거 (유효 구간만 남김)
+            # (녹음 중 장치가 바뀌어도 버퍼에 기록된 녹음 샘플레이트 기준으로 처리)
+            if self.remove_silence_enabled:
+                start, end = self._find_active_range(audio_data, audio_buffer.sample_rate)
+                audio_buffer.trim(start, end)
+            
+            # 3. 최소 길이 확인 (0.1초 이상)
+            min_samples = int(audio_buffer.sample_rate * 0.1)
+            if len(audio_buffer) < min_samples:
+                self.logger.warning("오디오가 너무 짧습니다 (0.1초 미만)")
+                audio_buffer.release()
+                return None
+            
+            # 4. 샘플레이트가 16kHz가 아니면 리샘플링
+            if audio_buffer.sample_rate != 16000:
+                resampled = self.resample_audio(audio_buffer.array, audio_buffer.sample_rate, 16000)
+                audio_buffer.release()
+                audio_buffer = AudioBuffer.from_array(resampled, 16000)
+            
+            return audio_buffer
+            
+        except Exception as e:
+            self.logger.error(f"오디오 처리 실패: {e}")
+            audio_buffer.release()
+            return None
+    
     def resample_audio(self, audio_data, original_sr, target_sr):
         """오디오 리샘플링"""
         try:
@@ -391,9 +695,16 @@ class AudioRecorder(QObject):
         if len(audio_data) == 0:
             return audio_data
         
+        start, end = self._find_active_range(audio_data)
+        return audio_data[start:end]
+    
+    def _find_active_range(self, audio_data, sample_rate=None):
+        """무음이 아닌 구간의 샘플 범위 (start, end) 계산"""
+        full_range = (0, len(audio_data))
+        
         try:
             # 프레임 설정
-            frame_length = int(self.sample_rate * 0.02)  # 20ms 프레임
+            frame_length = int((sample_rate or self.sample_rate) * 0.02)  # 20ms 프레임
             hop_length = frame_length // 2  # 50% 오버랩
             
             # RMS 기반 에너지 계산
@@ -404,7 +715,7 @@ class AudioRecorder(QObject):
                 rms_values.append(rms)
             
             if not rms_values:
-                return audio_data
+                return full_range
             
             # 동적 임계값 계산
             rms_array = np.array(rms_values)
@@ -420,7 +731,7 @@ class AudioRecorder(QObject):
                 max_idx = np.argmax(rms_array)
                 start_sample = max_idx * hop_length
                 end_sample = min(start_sample + frame_length * 10, len(audio_data))
-                return audio_data[start_sample:end_sample]
+                return start_sample, end_sample
             
             # 첫 번째와 마지막 액티브 프레임 찾기
             first_active = np.where(active_frames)[0][0]
@@ -435,18 +746,16 @@ class AudioRecorder(QObject):
             start_sample = start_frame * hop_length
             end_sample = min(end_frame * hop_length + frame_length, len(audio_data))
             
-            result = audio_data[start_sample:end_sample]
-            
             # 결과 검증
-            if len(result) < frame_length:
-                return audio_data  # 너무 짧으면 원본 반환
+            if end_sample - start_sample < frame_length:
+                return full_range  # 너무 짧으면 원본 유지
             
-            self.logger.debug(f"무음 제거: {len(audio_data)} -> {len(result)} 샘플")
-            return result
+            self.logger.debug(f"무음 제거: {len(audio_data)} -> {end_sample - start_sample} 샘플")
+            return start_sample, end_sample
             
         except Exception as e:
             self.logger.warning(f"무음 제거 실패: {e}")
-            return audio_data
+            return full_range
     
     def remove_silence(self, audio_data, threshold=None):
         """기본 무음 제거 (하위 호환성)"""
@@ -461,13 +770,16 @@ class AudioRecorder(QObject):
             devices = sd.query_devices()
             input_devices = []
             
+            device_keys = []
             for i, device in enumerate(devices):
                 if device['max_input_channels'] > 0:
-                    # 장치 호환성 테스트
-                    is_compatible = self.test_device_compatibility(i)
+                    # 장치 호환성 테스트 (캐시된 결과가 있으면 재사용)
+                    device_keys.append(self._device_key(device))
+                    is_compatible = self.test_device_compatibility(i, device)
                     
                     device_info = {
                         'index': i,
+                        'id': self._device_id(device),
                         'name': device['name'],
                         'channels': device['max_input_channels'],
                         'sample_rate': device['default_samplerate'],
@@ -479,33 +791,47 @@ class AudioRecorder(QObject):
             # 호환 가능한 장치를 앞으로 정렬
             input_devices.sort(key=lambda x: (not x['compatible'], not x['is_default'], x['name']))
             
-            self.logger.info(f"발견된 입력 장치: {len(input_devices)}개")
+            self.device_cache.retain(device_keys)
+            self.device_cache.save()
+            
+            self.logger.info(f"발견된 입력 장치: {len(input_devices)}개 (캐시 적중 {self.device_cache.hits}, 검사 {self.device_cache.misses})")
             return input_devices
             
         except Exception as e:
             self.logger.error(f"장치 목록 조회 실패: {e}")
             return []
     
-    def test_device_compatibility(self, device_index):
-        """장치 호환성 테스트"""
+    def test_device_compatibility(self, device_index, device=None):
+        """장치 호환성 테스트 (결과는 장치 캐시에 보관)"""
+        try:
+            device = device or sd.query_devices(device_index)
+            return self.device_cache.lookup(
+                self._device_key(device), 'compatible',
+                lambda: self._probe_device_compatibility(device_index, device)
+            )
+        except Exception as e:
+            self.logger.warning(f"장치 호환성 확인 실패 ({device_index}): {e}")
+            return False
+    
+    def _probe_device_compatibility(self, device_index, device):
+        """실제 장치 호환성 검사"""
         try:
             # 간단한 호환성 테스트
             sd.check_input_settings(
                 device=device_index,
                 channels=1,
                 samplerate=16000,
-                dtype=np.float32
+                dtype=self.dtype
             )
             return True
         except:
             try:
                 # 다른 설정으로 재시도
-                device_info = sd.query_devices(device_index)
                 sd.check_input_settings(
                     device=device_index,
                     channels=1,
-                    samplerate=int(device_info['default_samplerate']),
-                    dtype=np.float32
+                    samplerate=int(device['default_samplerate']),
+                    dtype=self.dtype
                 )
                 return True
             except:
@@ -543,6 +869,7 @@ class AudioRecorder(QObject):
             'current_level': self.current_audio_level,
             'silence_duration': self.silence_duration,
             'buffer_size': len(self.audio_data) if self.audio_data else 0,
+            'xrun_count': self.xrun_count,
             'recording_duration': 0
         }
         
@@ -551,6 +878,40 @@ class AudioRecorder(QObject):
         
         return stats
     
+    def apply_settings(self, changes):
+        """설정 파일에서 바뀐 값 적용 - 녹음 중에도 스트림을 다시 열지 않고 임계값만 교체
+        
+        변경 내용의 None은 null 값과 삭제된 키를 구분하지 않으므로 현재 설정에서 다시
+        읽어, 삭제된 키만 건너뛰고 null(예: 장치 미지정 = 시스템 기본 장치)은 적용합니다.
+        """
+        removed = object()
+        values = {path: config.get(path, removed) for path in changes}
+        values = {path: value for path, value in values.items() if value is not removed}
+        
+        if 'audio.silence_threshold' in values:
+            self.silence_threshold = values['audio.silence_threshold']
+        if 'audio.remove_silence' in values:
+            self.remove_silence_enabled = values['audio.remove_silence']
+        if 'audio.auto_stop_silence' in values:
+            self.auto_stop_enabled = values['audio.auto_stop_silence']
+        
+        if 'audio.device_id' in values or 'audio.device_index' in values:
+            # 장치 교체는 다음 녹음부터 적용 (녹음 중이면 스트림 유지)
+            if 'audio.device_id' in values:
+                self.preferred_device_id = values['audio.device_id']
+            else:
+                # 장치 번호로 지정하면 resolve_device가 식별자로 변환, null이면 시스템 기본 장치
+                self.preferred_device_id = None
+                self.configured_device_index = values['audio.device_index']
+                config.set('audio.device_id', None)
+            threading.Thread(target=self._resolve_in_background, daemon=True).start()
+        
+        restart_required = [path for path in values if path in ('audio.sample_rate', 'audio.channels', 'audio.dtype')]
+        if restart_required:
+            self.logger.info(f"다시 시작해야 적용되는 오디오 설정: {', '.join(restart_required)}")
+        
+        self.logger.info(f"오디오 설정 재적용 - 무음 임계값: {self.silence_threshold}, 무음 제거: {self.remove_silence_enabled}")
+    
     def set_audio_settings(self, **kwargs):
         """오디오 설정 변경"""
         if self.is_recording:
@@ -579,7 +940,9 @@ class AudioRecorder(QObject):
                 updated = True
             
             if updated:
-                config.save_settings()
+                if not config.save_settings(immediate=True):
+                    self.logger.error(f"오디오 설정 저장 실패: {config.save_error}")
+                    return False
                 self.logger.info("오디오 설정이 업데이트되었습니다")
                 
             return updated
@@ -594,5 +957,7 @@ class AudioRecorder(QObject):
             if self.is_recording:
                 self.stop_recording()
             self.cleanup_recording()
+            if self.hotplug_watcher:
+                self.hotplug_watcher.stop(timeout=0)
         except:
             pass
\ No newline at end of file
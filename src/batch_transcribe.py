@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+헤드리스 배치 음성 인식 모듈 (트레이/단축키/마이크 없이 파일 처리)
+
+사용 예:
+    python batch_transcribe.py recordings/ --output-dir transcripts --workers 2
+    python main.py batch archive/2024 --format jsonl srt --resume
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from config import config, setup_logging
+from whisper_handler import WhisperHandler, WhisperWorker
+
+
+SUPPORTED_EXTENSIONS = ('.wav', '.flac')
+TARGET_SAMPLE_RATE = 16000
+
+# 워커 프로세스별 모델 (프로세스 초기화 시 로드)
+_worker_model = None
+
+
+def find_audio_files(inputs):
+    """입력 경로(파일/디렉터리)에서 오디오 파일 목록 수집
+
+    (절대 경로, 출력 기준 상대 경로) 튜플 목록을 반환합니다. 서로 다른 입력
+    경로에서 같은 상대 경로가 나오면 출력 파일이 겹치지 않도록 해당 파일들의
+    상대 경로 앞에 입력 경로 이름과 해시를 붙입니다.
+    """
+    found = []
+    for input_path in inputs:
+        input_path = os.path.abspath(input_path)
+        if os.path.isdir(input_path):
+            for root, _, names in os.walk(input_path):
+                for name in sorted(names):
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        path = os.path.join(root, name)
+                        found.append((path, input_path, os.path.relpath(path, input_path)))
+        elif input_path.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(input_path):
+            found.append((input_path, os.path.dirname(input_path), os.path.basename(input_path)))
+        else:
+            logging.getLogger(__name__).warning(f"지원하지 않는 입력: {input_path}")
+
+    roots_by_key = {}
+    for path, root, relative_path in found:
+        roots_by_key.setdefault(os.path.normcase(relative_path), set()).add(root)
+
+    files = {}
+    for path, root, relative_path in found:
+        if len(roots_by_key[os.path.normcase(relative_path)]) > 1:
+            relative_path = os.path.join(_root_label(root), relative_path)
+        files[path] = relative_path
+    return sorted(files.items())
+
+
+def _root_label(root):
+    """입력 경로를 구분하는 출력 디렉터리 이름 (이름-경로 해시)"""
+    digest = hashlib.sha1(root.encode('utf-8', 'surrogateescape')).hexdigest()[:8]
+    return f"{os.path.basename(root) or 'root'}-{digest}"
+
+
+def _pcm_to_float(frames, sample_width, channels):
+    """PCM 바이트를 float32 모노로 변환"""
+    if sample_width == 1:
+        audio = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128.0
+    elif sample_width == 2:
+        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    elif sample_width == 4:
+        audio = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"지원하지 않는 샘플 크기: {sample_width * 8}비트")
+
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio
+
+
+def _resample(audio, original_sr, target_sr=TARGET_SAMPLE_RATE):
+    """선형 보간 리샘플링 (AudioRecorder.resample_audio와 동일한 방식)"""
+    if original_sr == target_sr or len(audio) == 0:
+        return audio.astype(np.float32, copy=False)
+    new_length = int(len(audio) * target_sr / original_sr)
+    old_indices = np.linspace(0, len(audio) - 1, len(audio))
+    new_indices = np.linspace(0, len(audio) - 1, new_length)
+    return np.interp(new_indices, old_indices, audio).astype(np.float32)
+
+
+def stream_audio_chunks(path, chunk_seconds, start_chunk=0):
+    """오디오 파일을 chunk_seconds 단위로 스트리밍 디코딩
+
+    (청크 번호, 16kHz float32 오디오) 를 순서대로 반환하며, 전체 파일을
+    메모리에 올리지 않습니다. FLAC과 24비트 WAV는 soundfile이 설치된 경우에만
+    지원합니다.
+    """
+    try:
+        import soundfile
+    except ImportError:
+        soundfile = None
+
+    if soundfile is not None:
+        with soundfile.SoundFile(path) as audio_file:
+            sample_rate = audio_file.samplerate
+            chunk_frames = int(chunk_seconds * sample_rate)
+            audio_file.seek(min(start_chunk * chunk_frames, audio_file.frames))
+            index = start_chunk
+            while True:
+                block = audio_file.read(chunk_frames, dtype='float32', always_2d=True)
+                if len(block) == 0:
+                    break
+                yield index, _resample(block.mean(axis=1), sample_rate)
+                index += 1
+        return
+
+    if path.lower().endswith('.flac'):
+        raise RuntimeError("FLAC 파일을 읽으려면 soundfile 패키지가 필요합니다 (pip install soundfile)")
+
+    with wave.open(path, 'rb') as wav_file:
+        sample_rate = wav_file.getframerate()
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        if sample_width == 3:
+            raise RuntimeError("24비트 WAV 파일을 읽으려면 soundfile 패키지가 필요합니다 (pip install soundfile)")
+        chunk_frames = int(chunk_seconds * sample_rate)
+
+        wav_file.setpos(min(start_chunk * chunk_frames, wav_file.getnframes()))
+        index = start_chunk
+        while True:
+            frames = wav_file.readframes(chunk_frames)
+            if not frames:
+                break
+            yield index, _resample(_pcm_to_float(frames, sample_width, channels), sample_rate)
+            index += 1
+
+
+def format_srt_timestamp(seconds):
+    """초를 SRT 타임스탬프(HH:MM:SS,mmm)로 변환"""
+    milliseconds = int(round(max(seconds, 0.0) * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+
+
+def write_srt(segments, path):
+    """구간 목록을 SRT 자막 파일로 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for number, segment in enumerate(segments, 1):
+            f.write(f"{number}\n")
+            f.write(f"{format_srt_timestamp(segment['start'])} --> {format_srt_timestamp(segment['end'])}\n")
+            f.write(f"{segment['text']}\n\n")
+
+
+def _write_json_atomic(path, data):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+class FileJob:
+    """파일 하나의 출력/진행 상태 경로 관리"""
+
+    def __init__(self, path, relative_path, output_dir):
+        self.path = path
+        base = os.path.join(output_dir, os.path.splitext(relative_path)[0])
+        self.segments_path = base + '.jsonl'
+        self.srt_path = base + '.srt'
+        self.progress_path = base + '.progress.json'
+
+        stat = os.stat(path)
+        self.fingerprint = {'size': stat.st_size, 'mtime': int(stat.st_mtime)}
+
+    def load_progress(self, chunk_seconds):
+        """이전 진행 상태 로드
+
+        다른 파일의 기록이거나 원본 파일이 바뀌었으면 무시합니다. 청크 번호로
+        구간 시각을 계산하므로 청크 길이가 다른 기록도 무시하고 처음부터 처리합니다.
+        """
+        try:
+            with open(self.progress_path, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+            if (progress.get('file') == self.path and progress.get('fingerprint') == self.fingerprint
+                    and progress.get('chunk_seconds') == chunk_seconds):
+                return progress
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def save_progress(self, status, last_chunk, chunk_seconds):
+        _write_json_atomic(self.progress_path, {
+            'file': self.path,
+            'fingerprint': self.fingerprint,
+            'chunk_seconds': chunk_seconds,
+            'status': status,
+            'last_chunk': last_chunk,
+            'updated_at': time.time()
+        })
+
+    def load_segments(self, max_chunk=None):
+        """저장된 구간 로드 (max_chunk 이후 청크는 제외)"""
+        segments = []
+        if os.path.exists(self.segments_path):
+            with open(self.segments_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    segment = json.loads(line)
+                    if max_chunk is None or segment['chunk'] <= max_chunk:
+                        segments.append(segment)
+        return segments
+
+
+def transcribe_chunk(model, audio, options):
+    """WhisperWorker로 청크 하나를 동기 인식하여 구간 목록 반환"""
+    outcome = {}
+
+    def callback(text, error, metadata):
+        outcome.update(text=text, error=error, metadata=metadata or {})
+
+    WhisperWorker(model, audio, TARGET_SAMPLE_RATE, options, callback).run()
+
+    if outcome.get('error'):
+        raise RuntimeError(outcome['error'])
+    return outcome['metadata'].get('segment_list', []), outcome['metadata'].get('language')
+
+
+def process_file(job, options, chunk_seconds, formats, resume, model=None):
+    """파일 하나를 청크 단위로 인식하고 진행 상태를 기록"""
+    logger = logging.getLogger(__name__)
+    model = model or _worker_model
+    os.makedirs(os.path.dirname(job.segments_path), exist_ok=True)
+
+    progress = job.load_progress(chunk_seconds) if resume else None
+    if progress and progress['status'] == 'done':
+        return {'file': job.path, 'status': 'skipped'}
+
+    start_chunk = 0
+    if progress:
+        start_chunk = progress['last_chunk'] + 1
+        # 마지막으로 완료된 청크 이후에 기록된 구간은 다시 인식하므로 제거
+        kept = job.load_segments(max_chunk=progress['last_chunk'])
+        with open(job.segments_path, 'w', encoding='utf-8') as f:
+            for segment in kept:
+                f.write(json.dumps(segment, ensure_ascii=False) + '\n')
+        logger.info(f"이어서 처리: {job.path} (청크 {start_chunk}부터)")
+    elif os.path.exists(job.segments_path):
+        os.remove(job.segments_path)
+
+    started = time.time()
+    audio_seconds = 0.0
+    last_chunk = start_chunk - 1
+
+    for index, audio in stream_audio_chunks(job.path, chunk_seconds, start_chunk):
+        audio_seconds += len(audio) / TARGET_SAMPLE_RATE
+        offset = index * chunk_seconds
+
+        segments = []
+        if len(audio) >= TARGET_SAMPLE_RATE * 0.1:
+            segments, language = transcribe_chunk(model, audio, options)
+        else:
+            language = None
+
+        with open(job.segments_path, 'a', encoding='utf-8') as f:
+            for segment in segments:
+                record = dict(segment, start=segment['start'] + offset, end=segment['end'] + offset,
+                              chunk=index, language=language)
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        last_chunk = index
+        job.save_progress('running', last_chunk, chunk_seconds)
+
+    if 'srt' in formats:
+        write_srt(job.load_segments(), job.srt_path)
+    if 'jsonl' not in formats and os.path.exists(job.segments_path):
+        # 진행 상태 복구용 파일이므로 완료 후 정리
+        os.remove(job.segments_path)
+
+    job.save_progress('done', last_chunk, chunk_seconds)
+    elapsed = time.time() - started
+    return {'file': job.path, 'status': 'done', 'audio_seconds': audio_seconds, 'elapsed': elapsed}
+
+
+def _init_worker(model_name, num_threads):
+    """워커 프로세스 초기화 - 모델 로드"""
+    global _worker_model
+    import whisper
+
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+    _worker_model = whisper.load_model(model_name, in_memory=True)
+
+
+def _process_file_task(path, relative_path, output_dir, options, chunk_seconds, formats, resume):
+    job = FileJob(path, relative_path, output_dir)
+    return process_file(job, options, chunk_seconds, formats, resume)
+
+
+def build_options(language=None):
+    """배치용 Whisper 옵션 - 앱 설정을 따르되 타임스탬프 보존을 위해 트리밍 비활성화"""
+    options = WhisperHandler._load_whisper_options()
+    options.update({
+        'enable_vad': False,
+        'silence_threshold': 0,
+        'return_segments': True,
+        'condition_on_previous_text': False
+    })
+    if language:
+        options['language'] = None if language == 'auto' else language
+    return options
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="오디오 파일/디렉터리 배치 음성 인식")
+    parser.add_argument('inputs', nargs='+', help="WAV/FLAC 파일 또는 디렉터리")
+    parser.add_argument('--output-dir', default='transcripts', help="결과 저장 디렉터리")
+    parser.add_argument('--model', default=config.get('whisper.model_name', 'base'), help="Whisper 모델")
+    parser.add_argument('--language', default=None, help="인식 언어 (auto: 자동 감지)")
+    parser.add_argument('--format', nargs='+', default=['jsonl', 'srt'], choices=['jsonl', 'srt'],
+                        dest='formats', help="출력 형식")
+    parser.add_argument('--workers', type=int, default=1, help="병렬 워커 프로세스 수")
+    parser.add_argument('--chunk-seconds', type=int, default=300, help="스트리밍 디코딩 청크 길이 (초)")
+    parser.add_argument('--resume', action='store_true', help="이전 진행 상태에서 이어서 처리")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """배치 인식 진입점"""
+    args = parse_args(argv)
+    setup_logging()
+    logger = logging.getLogger(__name__)
+
+    files = find_audio_files(args.inputs)
+    if not files:
+        logger.error("처리할 오디오 파일이 없습니다")
+        return 1
+
+    options = build_options(args.language)
+    os.makedirs(args.output_dir, exist_ok=True)
+    logger.info(f"배치 인식 시작: {len(files)}개 파일, 모델 {args.model}, 워커 {args.workers}개")
+
+    results = []
+    failed = 0
+
+    if args.workers <= 1:
+        _init_worker(args.model, os.cpu_count() or 1)
+        for path, relative_path in files:
+            try:
+                result = _process_file_task(path, relative_path, args.output_dir, options,
+                                            args.chunk_seconds, args.formats, args.resume)
+            except Exception as e:
+                failed += 1
+                result = {'file': path, 'status': 'failed', 'error': str(e)}
+            results.append(result)
+            logger.info(f"[{len(results)}/{len(files)}] {result['status']}: {path}")
+    else:
+        threads = max(1, (os.cpu_count() or 1) // args.workers)
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                 initargs=(args.model, threads)) as executor:
+            futures = {
+                executor.submit(_process_file_task, path, relative_path, args.output_dir, options,
+                                args.chunk_seconds, args.formats, args.resume): path
+                for path, relative_path in files
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    result = {'file': path, 'status': 'failed', 'error': str(e)}
+                results.append(result)
+                logger.info(f"[{len(results)}/{len(files)}] {result['status']}: {path}")
+
+    total_audio = sum(r.get('audio_seconds', 0) for r in results)
+    total_elapsed = sum(r.get('elapsed', 0) for r in results)
+    logger.info(
+        f"배치 인식 완료 - 성공: {len(results) - failed}, 실패: {failed}, "
+        f"오디오: {total_audio / 60:.1f}분, 처리시간 합계: {total_elapsed / 60:.1f}분"
+    )
+
+    return 0 if failed == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+클립보드 백엔드 모듈
+
+Linux에서 pyperclip은 복사/붙여넣기마다 xclip/xsel 프로세스를 실행합니다.
+QtClipboardBackend는 QClipboard로 프로세스 안에서 처리하고, 변경 알림
+(dataChanged)과 클립보드 소유권으로 복사를 확인합니다. Qt 클립보드를 쓸 수
+없는 환경에서는 PyperclipBackend를 사용합니다.
+
+복사 확인은 고정 대기 없이 timeout(초) 안에서 이벤트/재시도로 처리하고,
+내용 비교는 길이와 해시로 합니다.
+"""
+
+import hashlib
+import logging
+import time
+
+import pyperclip
+from PyQt6.QtCore import QObject, QThread, QEventLoop, QTimer
+from PyQt6.QtGui import QGuiApplication, QClipboard
+
+
+def _digest(text):
+    return hashlib.md5(text.encode('utf-8')).digest()
+
+
+def _same_text(actual, expected):
+    """길이를 먼저 비교하고 같을 때만 해시 비교"""
+    return actual is not None and len(actual) == len(expected) and _digest(actual) == _digest(expected)
+
+
+class PyperclipBackend:
+    """pyperclip 기반 백엔드 (외부 프로세스 사용)"""
+
+    name = 'pyperclip'
+
+    def copy(self, text):
+        pyperclip.copy(text)
+
+    def paste(self):
+        return pyperclip.paste()
+
+    def verify(self, expected_text, timeout=0.2):
+        """즉시 확인하고, 반영이 늦으면 timeout까지 간격을 늘려가며 재확인"""
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while True:
+            if _same_text(self.paste(), expected_text):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay *= 2
+
+
+class QtClipboardBackend(QObject):
+    """QClipboard 기반 프로세스 내 백엔드
+
+    QClipboard는 GUI 스레드에서만 사용할 수 있으므로 다른 스레드에서 호출되면
+    fallback 백엔드로 처리합니다. 확인 대기 중에는 중첩 이벤트 루프가 다른
+    이벤트(단축키 등)를 처리하므로, 그 사이에 들어온 복사는 대기가 끝난 뒤
+    적용합니다.
+    """
+
+    name = 'qt'
+
+    def __init__(self, fallback=None):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.fallback = fallback or PyperclipBackend()
+        self.clipboard = QGuiApplication.clipboard()
+        self.clipboard.dataChanged.connect(self._on_data_changed)
+        self._changed_since_copy = False
+        self._copied_digest = None
+        self._verifying = False
+        self._queued_text = None  # 확인 대기 중 요청된 복사 (마지막 요청만 유지)
+
+    def copy(self, text):
+        if not self._on_gui_thread():
+            self.fallback.copy(text)
+            return
+
+        if self._verifying:
+            # 확인 중인 복사의 변경 알림과 섞이지 않도록 대기가 끝난 뒤 설정
+            self.logger.debug("클립보드 확인 대기 중 - 복사 예약")
+            self._queued_text = text
+            return
+
+        self._copied_digest = _digest(text)
+        self._changed_since_copy = False
+        self.clipboard.setText(text, QClipboard.Mode.Clipboard)
+
+    def paste(self):
+        if not self._on_gui_thread():
+            return self.fallback.paste()
+        return self.clipboard.text(QClipboard.Mode.Clipboard)
+
+    def verify(self, expected_text, timeout=0.2):
+        """setText 이후 변경 알림을 기다려(최대 timeout) 확인
+
+        클립보드를 아직 소유하고 있으면 내용이 우리가 설정한 그대로이므로
+        다시 읽지 않고 해시만 비교합니다. 변경 알림이 오지 않으면 다시 읽어
+        비교합니다.
+        """
+        if not self._on_gui_thread():
+            return self.fallback.verify(expected_text, timeout)
+
+        if self._verifying:
+            # 대기 중 이벤트에서 호출된 확인 - 예약된 복사인지만 확인
+            return self._queued_text is not None and _same_text(self._queued_text, expected_text)
+
+        if not self._changed_since_copy:
+            self._wait_for_change(timeout)
+
+        if self._changed_since_copy and self.clipboard.ownsClipboard():
+            verified = self._copied_digest == _digest(expected_text)
+        else:
+            # 알림을 보내지 않는 플랫폼이거나 소유권을 알 수 없음/다른 프로그램이 가져감
+            verified = _same_text(self.clipboard.text(QClipboard.Mode.Clipboard), expected_text)
+
+        # 확인이 끝난 뒤 대기 중에 예약된 복사 적용
+        if self._queued_text is not None:
+            text, self._queued_text = self._queued_text, None
+            self.copy(text)
+        return verified
+
+    def _wait_for_change(self, timeout):
+        """dataChanged 또는 timeout까지 이벤트 루프 실행"""
+        loop = QEventLoop()
+        self.clipboard.dataChanged.connect(loop.quit)
+        QTimer.singleShot(int(timeout * 1000), loop.quit)
+        self._verifying = True
+        try:
+            loop.exec()
+        finally:
+            self._verifying = False
+            self.clipboard.dataChanged.disconnect(loop.quit)
+
+    def _on_data_changed(self):
+        self._changed_since_copy = True
+
+    def _on_gui_thread(self):
+        return QThread.currentThread() == self.thread()
+
+
+def create_clipboard_backend(name='auto'):
+    """설정된 클립보드 백엔드 생성
+
+    auto: QApplication이 있으면 Qt 백엔드, 없거나 Wayland면 pyperclip
+    (Wayland에서는 포커스가 없는 창이 클립보드를 설정할 수 없음)
+    """
+    logger = logging.getLogger(__name__)
+    app = QGuiApplication.instance()
+
+    if name == 'pyperclip':
+        return PyperclipBackend()
+
+    if app is None:
+        if name == 'qt':
+            logger.warning("QApplication이 없어 pyperclip 클립보드 백엔드를 사용합니다")
+        return PyperclipBackend()
+
+    if name == 'auto' and QGuiApplication.platformName() == 'wayland':
+        return PyperclipBackend()
+
+    return QtClipboardBackend()
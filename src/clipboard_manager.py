@@ -3,18 +3,33 @@
 """
 
 import logging
-import pyperclip
 import time
 import re
 import hashlib
 import threading
+import heapq
+import bisect
+import io
+import itertools
+from collections import Counter
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
-from datetime import datetime, timedelta
+from datetime import datetime
 from config import config
-import json
+from tracing import tracer
+from metrics import metrics
+from event_log import event_log
+from history_journal import HistoryJournal, ensure_epoch, expired_index
+from history_database import HistoryDatabase
+from clipboard_backend import create_clipboard_backend
+from fuzzy_index import FuzzyIndex
+from history_io import (iter_history_items, write_history_items, open_history_file, wrap_stream,
+                        detect_format, detect_compression)
 import os
 
 
+HISTORY_RETENTION_SECONDS = 30 * 24 * 60 * 60  # 30일
+
+
 class ClipboardManager(QObject):
     text_copied = pyqtSignal(str, dict)  # 텍스트, 메타데이터
     clipboard_backup_created = pyqtSignal(str)  # 백업 생성
@@ -22,7 +37,7 @@ class ClipboardManager(QObject):
     history_updated = pyqtSignal(int)  # 히스토리 업데이트
     copy_failed = pyqtSignal(str)  # 복사 실패
     
-    def __init__(self, history_file=None, max_history=None):
+    def __init__(self, history_file=None, max_history=None, autoload=True):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         
@@ -33,8 +48,16 @@ class ClipboardManager(QObject):
         self.backup_enabled = config.get('clipboard.backup_previous', True)
         self.history_enabled = config.get('clipboard.history_enabled', True)
         
+        # 클립보드 백엔드 (Qt 프로세스 내 처리, pyperclip 대체)
+        self.backend = create_clipboard_backend(config.get('clipboard.backend', 'auto'))
+        self.verify_timeout = config.get('clipboard.verify_timeout_ms', 200) / 1000
+        
         # 내부 상태
-        self.history = []
+        self.history = []  # 최신 항목이 앞
+        self.history_characters = 0  # 히스토리 글자 수 합계 (증분 집계)
+        self.source_counts = Counter()  # 소스별 항목 수 (증분 집계)
+        self.history_keys = Counter()  # (해시, 시각) 중복 확인 인덱스 (증분 유지)
+        self.fuzzy_index = FuzzyIndex()  # 유사도 검색용 trigram 인덱스 (증분 유지)
         self.backup_stack = []  # 백업 스택
         self.last_copied_hash = None  # 중복 방지
         self.copy_lock = threading.Lock()  # 동시 접근 방지
@@ -48,8 +71,12 @@ class ClipboardManager(QObject):
             'session_start': datetime.now().isoformat()
         }
         
-        # 초기화
-        self.load_history()
+        # 히스토리 저장소 (journal: 추가 전용 저널, sqlite: 전문 검색 DB)
+        self.store = self._create_history_store()
+        
+        # 초기화 (autoload=False면 호출자가 load_history()를 별도 스레드 등에서 호출)
+        if autoload:
+            self.load_history()
         self.setup_monitoring()
     
     def copy_text(self, text, source="manual", metadata=None):
@@ -66,6 +93,9 @@ class ClipboardManager(QObject):
             self.copy_failed.emit(error_msg)
             return False
         
+        workflow_id = metadata.get('workflow_id') if metadata else None
+        copy_time = verify_time = None
+        
         try:
             with self.copy_lock:
                 # 통계 업데이트
@@ -83,19 +113,27 @@ class ClipboardManager(QObject):
                 # 이전 클립보드 백업
                 previous_content = None
                 if self.backup_enabled:
-                    previous_content = self.get_clipboard_content()
-                    if previous_content and previous_content != cleaned_text:
-                        self._backup_clipboard(previous_content)
+                    with tracer.span('clipboard_backup', workflow_id):
+                        previous_content = self.get_clipboard_content()
+                        if previous_content and previous_content != cleaned_text:
+                            self._backup_clipboard(previous_content)
                 
                 # 복사 실행
                 start_time = time.time()
-                pyperclip.copy(cleaned_text)
+                with tracer.span('clipboard_write', workflow_id, length=len(cleaned_text)):
+                    self.backend.copy(cleaned_text)
                 copy_time = time.time() - start_time
-                
-                # 복사 확인
-                if not self._verify_copy(cleaned_text):
-                    raise Exception("복사 후 확인 실패")
-                
+                metrics.observe('clipboard_copy_seconds', copy_time)
+            
+            # 복사 확인 - 변경 알림을 기다리는 동안 다른 복사가 막히지 않도록 잠금 밖에서 수행
+            verify_start = time.time()
+            with tracer.span('clipboard_verify', workflow_id):
+                verified = self._verify_copy(cleaned_text)
+            verify_time = time.time() - verify_start
+            if not verified:
+                raise Exception("복사 후 확인 실패")
+            
+            with self.copy_lock:
                 # 메타데이터 준비
                 copy_metadata = {
                     'source': source,
@@ -110,7 +148,8 @@ class ClipboardManager(QObject):
                 
                 # 히스토리 추가
                 if self.history_enabled:
-                    self.add_to_history(cleaned_text, previous_content, copy_metadata)
+                    with tracer.span('clipboard_history', workflow_id):
+                        self.add_to_history(cleaned_text, previous_content, copy_metadata)
                 
                 # 통계 업데이트
                 self.stats['successful_copies'] += 1
@@ -119,6 +158,8 @@ class ClipboardManager(QObject):
                 
                 text_preview = cleaned_text[:50] + ('...' if len(cleaned_text) > 50 else '')
                 self.logger.info(f"클립보드 복사 성공: '{text_preview}'")
+                event_log.emit('clipboard_copy', workflow_id, length=len(cleaned_text), copy_seconds=copy_time,
+                               verify_seconds=verify_time, success=True)
                 self.text_copied.emit(cleaned_text, copy_metadata)
                 
                 return True
@@ -127,13 +168,15 @@ class ClipboardManager(QObject):
             self.stats['failed_copies'] += 1
             error_msg = f"클립보드 복사 실패: {e}"
             self.logger.error(error_msg)
+            event_log.emit('clipboard_copy', workflow_id, length=len(text), copy_seconds=copy_time,
+                           verify_seconds=verify_time, success=False)
             self.copy_failed.emit(error_msg)
             return False
     
     def get_clipboard_content(self):
         """현재 클립보드 내용 가져오기"""
         try:
-            return pyperclip.paste()
+            return self.backend.paste()
         except Exception as e:
             self.logger.error(f"클립보드 내용 가져오기 실패: {e}")
             return ""
@@ -150,9 +193,11 @@ class ClipboardManager(QObject):
                 self.logger.debug("중복된 항목으로 히스토리 추가 생략")
                 return
             
+            now = time.time()
             history_item = {
                 'text': new_text,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': datetime.fromtimestamp(now).isoformat(),
+                'epoch': now,  # 정렬/만료 계산용 숫자 시각
                 'hash': text_hash,
                 'length': len(new_text),
                 'source': metadata.get('source', 'unknown') if metadata else 'unknown',
@@ -169,15 +214,20 @@ class ClipboardManager(QObject):
             
             # 최신 항목을 맨 앞에 추가
             self.history.insert(0, history_item)
+            self._count_history_item(history_item)
             
             # 최대 개수 제한
             if len(self.history) > self.max_history:
                 removed_items = self.history[self.max_history:]
                 self.history = self.history[:self.max_history]
+                for item in removed_items:
+                    self._count_history_item(item, -1)
                 self.logger.debug(f"{len(removed_items)}개 오래된 항목 제거")
             
-            # 파일에 저장 (비동기)
-            self._save_history_async()
+            # 저널에 추가 (쓰기 스레드에서 기록)
+            self.store.append(history_item, self.max_history)
+            if self.store.needs_compaction():
+                self.store.compact(self.history)
             
             # 시그널 발송
             self.history_updated.emit(len(self.history))
@@ -187,17 +237,28 @@ class ClipboardManager(QObject):
         except Exception as e:
             self.logger.error(f"히스토리 추가 실패: {e}")
     
-    def get_history(self, limit=None):
-        """히스토리 목록 반환"""
-        if limit:
-            return self.history[:limit]
-        return self.history.copy()
+    def get_history(self, limit=None, offset=0, **filters):
+        """히스토리 목록 반환 (최신순)
+        
+        filters: since, until (datetime 또는 ISO 문자열), language, min_confidence, source
+        SQLite 저장소에서는 메모리에 없는 오래된 항목도 페이지 단위로 조회합니다.
+        """
+        filters = {key: value for key, value in filters.items() if value is not None}
+        end = offset + limit if limit else None
+        
+        if isinstance(self.store, HistoryDatabase):
+            if filters or end is None or end > len(self.history):
+                return self.store.query(limit=limit, offset=offset, **filters)
+        
+        items = [item for item in self.history if self._matches_filters(item, **filters)] if filters else self.history
+        return items[offset:end]
     
     def clear_history(self):
         """히스토리 초기화"""
         try:
             self.history = []
-            self.save_history()
+            self._reset_history_totals()
+            self.store.clear()
             self.logger.info("히스토리가 초기화되었습니다")
             
         except Exception as e:
@@ -232,7 +293,7 @@ class ClipboardManager(QObject):
                     self.logger.warning("이전 내용이 없습니다")
             
             if restored_text:
-                pyperclip.copy(restored_text)
+                self.backend.copy(restored_text)
                 self.clipboard_restored.emit(restored_text)
                 self.logger.info(f"클립보드 복원 성공: '{restored_text[:50]}{'...' if len(restored_text) > 50 else ''}'")
                 return True
@@ -249,7 +310,7 @@ class ClipboardManager(QObject):
         try:
             if 0 <= index < len(self.history):
                 text = self.history[index]['text']
-                pyperclip.copy(text)
+                self.backend.copy(text)
                 self.logger.info(f"히스토리 항목이 클립보드로 복사됨: {text[:50]}...")
                 return True
             else:
@@ -260,15 +321,31 @@ class ClipboardManager(QObject):
         
         return False
     
-    def search_history(self, keyword):
-        """히스토리에서 키워드 검색"""
+    def search_history(self, keyword, prefix=False, limit=None, **filters):
+        """히스토리에서 키워드 검색 - (메모리 히스토리 인덱스, 항목) 목록 반환
+        
+        prefix=True면 단어 접두어로 검색합니다. SQLite 저장소에서는 전문 검색
+        인덱스를 사용하며, 메모리 히스토리에 없는 항목의 인덱스는 None입니다.
+        """
         try:
+            filters = {key: value for key, value in filters.items() if value is not None}
+            
+            if isinstance(self.store, HistoryDatabase):
+                positions = {item.get('hash'): i for i, item in reversed(list(enumerate(self.history)))}
+                return [(positions.get(item.get('hash')), item)
+                        for item in self.store.search(keyword, prefix=prefix, limit=limit, **filters)]
+            
             keyword = keyword.lower()
+            pattern = re.compile(r'(^|\s)' + re.escape(keyword)) if prefix else None
             results = []
             
             for i, item in enumerate(self.history):
-                if keyword in item['text'].lower():
+                text = item['text'].lower()
+                matched = pattern.search(text) if prefix else keyword in text
+                if matched and self._matches_filters(item, **filters):
                     results.append((i, item))
+                    if limit and len(results) >= limit:
+                        break
             
             return results
             
@@ -276,30 +353,83 @@ class ClipboardManager(QObject):
             self.logger.error(f"히스토리 검색 실패: {e}")
             return []
     
+    def fuzzy_search_history(self, query, limit=10, min_score=0.3):
+        """철자 차이를 허용하는 유사도 검색 - (히스토리 인덱스, 항목, 점수) 목록 (점수순)
+        
+        한글은 자모 단위로 비교하므로 '됬다'로 '됐다'가 포함된 항목도 찾습니다.
+        메모리 히스토리만 대상으로 합니다.
+        """
+        try:
+            return [(self._history_position(item), item, score)
+                    for item, score in self.fuzzy_index.search(query, limit, min_score)]
+            
+        except Exception as e:
+            self.logger.error(f"히스토리 유사도 검색 실패: {e}")
+            return []
+    
+    def _history_position(self, item):
+        """항목의 히스토리 인덱스 (epoch 이진 탐색 후 같은 시각 항목 중에서 확인)"""
+        index = bisect.bisect_left(self.history, -item['epoch'], key=lambda entry: -entry['epoch'])
+        while index < len(self.history):
+            if self.history[index] is item:
+                return index
+            index += 1
+        return None
+    
     def save_history(self):
-        """히스토리를 파일에 저장"""
+        """히스토리 저장 (기록 완료까지 대기)
+        
+        SQLite 저장소는 항목을 추가할 때마다 기록하고 메모리 창보다 많은 항목을
+        보관하므로 대기 중인 기록만 마칩니다. 저널 저장소는 메모리 창 전체를
+        스냅샷으로 저장합니다.
+        """
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, ensure_ascii=False, indent=2)
-                
+            if isinstance(self.store, HistoryDatabase):
+                self.store.flush()
+            else:
+                self.store.compact(self.history, wait=True)
+            
         except Exception as e:
             self.logger.error(f"히스토리 저장 실패: {e}")
     
     def load_history(self):
         """파일에서 히스토리 로드"""
         try:
-            if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.history = json.load(f)
-                    
+            self.history = self.store.load(self.max_history)
+            for item in self.history:
+                ensure_epoch(item)
+            self._reset_history_totals()
+            if self.history:
                 self.logger.info(f"히스토리 로드됨: {len(self.history)}개 항목")
             else:
-                self.history = []
                 self.logger.info("새로운 히스토리 파일 생성")
                 
         except Exception as e:
             self.logger.error(f"히스토리 로드 실패: {e}")
             self.history = []
+            self._reset_history_totals()
+    
+    def _create_history_store(self):
+        """설정된 히스토리 저장소 생성"""
+        compact_threshold = config.get('clipboard.journal_compact_records', 200)
+        
+        if config.get('clipboard.history_backend', 'journal') == 'sqlite':
+            db_path = config.get('clipboard.history_db', None) or os.path.splitext(self.history_file)[0] + '.db'
+            try:
+                store = HistoryDatabase(db_path)
+                
+                # 기존 JSON 히스토리를 처음 한 번 DB로 옮김
+                if store.count() == 0 and os.path.exists(self.history_file):
+                    legacy_items = HistoryJournal(self.history_file).load()
+                    store.append_many(reversed(legacy_items))
+                    self.logger.info(f"기존 히스토리 {len(legacy_items)}개 항목을 SQLite로 이전")
+                
+                return store
+                
+            except Exception as e:
+                self.logger.error(f"SQLite 히스토리 저장소 열기 실패, 저널 저장소 사용: {e}")
+        
+        return HistoryJournal(self.history_file, compact_threshold=compact_threshold)
     
     def setup_monitoring(self):
         """클립보드 모니터링 설정"""
@@ -341,6 +471,48 @@ class ClipboardManager(QObject):
             self.logger.warning(f"텍스트 정리 실패: {e}")
             return text.strip()
     
+    def _reset_history_totals(self):
+        """히스토리 집계값과 인덱스 전체 재계산 (로드/가져오기/초기화 시에만)"""
+        self.history_characters = sum(len(item['text']) for item in self.history)
+        self.source_counts = Counter(item.get('source', 'unknown') for item in self.history)
+        self.history_keys = Counter(self._history_key(item) for item in self.history)
+        self.fuzzy_index.clear()
+        self.fuzzy_index.add_many((id(item), item['text'], item) for item in self.history)
+    
+    def _count_history_item(self, item, sign=1):
+        """항목 추가(sign=1)/제거(sign=-1)를 집계값과 인덱스에 반영"""
+        self.history_characters += sign * len(item['text'])
+        if sign > 0:
+            self.fuzzy_index.add(id(item), item['text'], item)
+        else:
+            self.fuzzy_index.remove(id(item))
+        for counter, key in ((self.source_counts, item.get('source', 'unknown')),
+                             (self.history_keys, self._history_key(item))):
+            counter[key] += sign
+            if counter[key] <= 0:
+                del counter[key]
+    
+    @staticmethod
+    def _history_key(item):
+        """같은 기록인지 판단하는 키 (텍스트 해시, 시각)"""
+        return (item.get('hash'), item['timestamp'])
+    
+    @staticmethod
+    def _matches_filters(item, since=None, until=None, language=None, min_confidence=None, source=None):
+        """메모리 히스토리 항목 필터 (HistoryDatabase.query와 같은 조건)"""
+        timestamp = item.get('timestamp', '')
+        if since is not None and timestamp < (since if isinstance(since, str) else since.isoformat()):
+            return False
+        if until is not None and timestamp >= (until if isinstance(until, str) else until.isoformat()):
+            return False
+        if language is not None and item.get('language') != language:
+            return False
+        if min_confidence is not None and (item.get('confidence') is None or item['confidence'] < min_confidence):
+            return False
+        if source is not None and item.get('source') != source:
+            return False
+        return True
+    
     def _get_text_hash(self, text):
         """텍스트 해시 생성"""
         return hashlib.md5(text.encode('utf-8')).hexdigest()[:16]
@@ -376,41 +548,28 @@ class ClipboardManager(QObject):
     def _verify_copy(self, expected_text):
         """복사 결과 확인"""
         try:
-            # 짧은 대기 후 확인
-            time.sleep(0.01)
-            actual_text = pyperclip.paste()
-            return actual_text == expected_text
+            return self.backend.verify(expected_text, timeout=self.verify_timeout)
         except:
             return False
     
-    def _save_history_async(self):
-        """비동기 히스토리 저장"""
-        def save_worker():
-            try:
-                self.save_history()
-            except Exception as e:
-                self.logger.error(f"비동기 히스토리 저장 실패: {e}")
-        
-        thread = threading.Thread(target=save_worker, daemon=True)
-        thread.start()
-    
     def _cleanup_old_items(self):
         """오래된 항목 정리"""
         try:
-            if not self.history:
-                return
-            
-            # 30일 이상 된 항목 제거
-            cutoff_date = datetime.now() - timedelta(days=30)
-            
-            original_count = len(self.history)
-            self.history = [item for item in self.history 
-                          if datetime.fromisoformat(item['timestamp']) > cutoff_date]
-            
-            removed_count = original_count - len(self.history)
-            if removed_count > 0:
-                self.logger.info(f"{removed_count}개 오래된 항목 정리")
-                self._save_history_async()
+            # 30일 이상 된 항목 제거 - 히스토리는 최신 항목이 앞이므로
+            # 이진 탐색으로 경계를 찾아 뒤쪽만 잘라냄
+            cutoff = time.time() - HISTORY_RETENTION_SECONDS
+            
+            index = expired_index(self.history, cutoff)
+            removed_items = self.history[index:]
+            if removed_items:
+                del self.history[index:]
+                for item in removed_items:
+                    self._count_history_item(item, -1)
+                self.logger.info(f"{len(removed_items)}개 오래된 항목 정리")
+            
+            # DB는 메모리 창 밖의 항목도 인덱스 범위로 삭제, 저널은 만료 레코드만 추가
+            if removed_items or isinstance(self.store, HistoryDatabase):
+                self.store.expire_before(cutoff)
             
             # 백업 스택 정리 (10개 이상이면)
             if len(self.backup_stack) > 10:
@@ -445,79 +604,158 @@ class ClipboardManager(QObject):
         """백업 히스토리 반환"""
         return self.backup_stack.copy()
     
-    def export_history(self, format="json", limit=None):
-        """히스토리 내보내기"""
+    def export_history(self, format="json", limit=None, **filters):
+        """히스토리를 문자열로 내보내기 (큰 히스토리는 export_history_to 사용)
+        
+        filters: since, until, language, min_confidence, source
+        """
         try:
-            items = self.history[:limit] if limit else self.history
-            
-            if format == "json":
-                return json.dumps(items, ensure_ascii=False, indent=2)
-            elif format == "txt":
-                lines = []
-                for item in items:
-                    timestamp = item['timestamp']
-                    text = item['text']
-                    lines.append(f"[{timestamp}] {text}")
-                return "\n".join(lines)
-            elif format == "csv":
-                import csv
-                import io
-                output = io.StringIO()
-                writer = csv.writer(output)
-                writer.writerow(['timestamp', 'text', 'length', 'source'])
-                for item in items:
-                    writer.writerow([
-                        item['timestamp'],
-                        item['text'],
-                        item.get('length', len(item['text'])),
-                        item.get('source', 'unknown')
-                    ])
-                return output.getvalue()
+            output = io.StringIO()
+            write_history_items(self._iter_export_items(limit, filters), output, format)
+            return output.getvalue()
+                
+        except Exception as e:
+            self.logger.error(f"히스토리 내보내기 실패: {e}")
+            return None
+    
+    def export_history_to(self, target, format=None, compression=None, limit=None, **filters):
+        """히스토리를 파일 경로 또는 파일 객체에 스트리밍으로 내보내고 항목 수 반환
+        
+        경로는 확장자로 형식(json/jsonl/txt/csv)과 압축(.gz/.zst)을 추정하며 임시 파일에
+        쓴 뒤 교체합니다. 파일 객체는 압축을 지정하면 바이너리, 아니면 텍스트 스트림이어야 합니다.
+        실패하면 None을 반환합니다.
+        """
+        try:
+            items = self._iter_export_items(limit, filters)
+            
+            if hasattr(target, 'write'):
+                format = format or "json"
+                if not compression:
+                    count = write_history_items(items, target, format)
+                else:
+                    with wrap_stream(target, 'w', compression) as stream:
+                        count = write_history_items(items, stream, format)
             else:
-                raise ValueError(f"지원하지 않는 포맷: {format}")
+                format = format or detect_format(target)
+                temp_path = target + '.tmp'
+                try:
+                    with open_history_file(temp_path, 'w', compression or detect_compression(target)) as stream:
+                        count = write_history_items(items, stream, format)
+                    os.replace(temp_path, target)
+                except Exception:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+            
+            self.logger.info(f"히스토리 {count}개 항목 내보내기 완료")
+            return count
                 
         except Exception as e:
             self.logger.error(f"히스토리 내보내기 실패: {e}")
             return None
     
+    def _iter_export_items(self, limit, filters):
+        """내보낼 항목을 최신순으로 하나씩 반환 (SQLite는 커서 스트리밍)"""
+        filters = {key: value for key, value in filters.items() if value is not None}
+        if isinstance(self.store, HistoryDatabase):
+            items = self.store.iter_items(**filters)
+        else:
+            items = (item for item in self.history if self._matches_filters(item, **filters))
+        return itertools.islice(items, limit) if limit else items
+    
     def import_history(self, data, format="json"):
-        """히스토리 가져오기"""
+        """히스토리 가져오기 (json, jsonl, csv)
+        
+        data는 문자열 또는 파일 객체이며 항목 단위로 스트리밍해 읽습니다.
+        저장소에 이미 있는 (해시, 시각) 항목은 건너뛰고, 시각 순으로 병합한 뒤 한 번만
+        저장합니다. 텍스트나 시각이 잘못된 항목은 건너뛰고 개수만 기록합니다.
+        """
         try:
-            if format == "json":
-                imported_items = json.loads(data)
-                # 기존 히스토리와 병합
-                for item in reversed(imported_items):
-                    if 'text' in item and 'timestamp' in item:
-                        self.history.insert(0, item)
-                
-                # 중복 제거 및 정리
-                seen_hashes = set()
-                unique_history = []
-                for item in self.history:
-                    item_hash = item.get('hash') or self._get_text_hash(item['text'])
-                    if item_hash not in seen_hashes:
-                        seen_hashes.add(item_hash)
-                        unique_history.append(item)
-                
-                self.history = unique_history[:self.max_history]
-                self.save_history()
-                self.logger.info(f"{len(imported_items)}개 항목 가져오기 완료")
+            stream = data if hasattr(data, 'read') else io.StringIO(data)
+            skipped = []
+            items = self._iter_imported_items(iter_history_items(stream, format), skipped)
+            
+            if isinstance(self.store, HistoryDatabase):
+                # DB의 (hash, timestamp) 고유 인덱스로 중복을 거르며 한 트랜잭션으로 추가
+                imported_count = self.store.append_many(items)
+                self.history = self.store.load(self.max_history)
+                self._reset_history_totals()
+                self._log_import(imported_count, skipped)
                 return True
-            else:
-                raise ValueError(f"지원하지 않는 포맷: {format}")
+            
+            # 저널 저장소는 메모리 창(max_history)만 저장하므로(추가 레코드마다 max_items로
+            # 자르고 압축 시 self.history를 기록) 증분 유지되는 history_keys로 중복 확인
+            new_items = []
+            seen_keys = set()
+            descending = ascending = True
+            for item in items:
+                key = self._history_key(item)
+                if key in self.history_keys or key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                if new_items:
+                    descending = descending and new_items[-1]['epoch'] >= item['epoch']
+                    ascending = ascending and new_items[-1]['epoch'] <= item['epoch']
+                new_items.append(item)
+            
+            # 내보낸 파일은 이미 정렬되어 있으므로 대부분 정렬 없이 선형 병합
+            if not descending:
+                if ascending:
+                    new_items.reverse()
+                else:
+                    new_items.sort(key=lambda item: item['epoch'], reverse=True)
+            
+            merged = heapq.merge(self.history, new_items, key=lambda item: item['epoch'], reverse=True)
+            self.history = list(itertools.islice(merged, self.max_history))
+            self._reset_history_totals()
+            self.save_history()
+            self._log_import(len(new_items), skipped)
+            return True
                 
         except Exception as e:
             self.logger.error(f"히스토리 가져오기 실패: {e}")
             return False
     
+    def import_history_file(self, path, format=None):
+        """파일에서 히스토리 가져오기 (형식은 확장자로 추정, .gz 지원)"""
+        try:
+            with open_history_file(path) as stream:
+                return self.import_history(stream, format or detect_format(path))
+        except OSError as e:
+            self.logger.error(f"히스토리 파일 열기 실패: {e}")
+            return False
+    
+    def _iter_imported_items(self, items, skipped):
+        """가져올 항목 준비 - 텍스트/시각이 잘못된 항목은 skipped에 추가하고 건너뜀"""
+        for item in items:
+            try:
+                yield self._prepare_imported_item(item)
+            except (KeyError, TypeError, ValueError) as e:
+                skipped.append(e)
+    
+    def _log_import(self, imported_count, skipped):
+        if skipped:
+            self.logger.warning(f"잘못된 항목 {len(skipped)}개 건너뜀 (첫 오류: {skipped[0]!r})")
+        self.logger.info(f"{imported_count}개 항목 가져오기 완료")
+    
+    def _prepare_imported_item(self, item):
+        """가져온 항목에 해시/epoch/길이 채우기"""
+        item.setdefault('hash', self._get_text_hash(item['text']))
+        item.setdefault('length', len(item['text']))
+        ensure_epoch(item)
+        return item
+    
+    def close(self):
+        """타이머 중지 및 대기 중인 히스토리 기록 완료"""
+        if hasattr(self, 'cleanup_timer'):
+            self.cleanup_timer.stop()
+        if hasattr(self, 'store'):
+            self.store.close()
+    
     def __del__(self):
         """소멸자 - 리소스 정리"""
         try:
-            if hasattr(self, 'cleanup_timer'):
-                self.cleanup_timer.stop()
-            # 최종 저장
-            if hasattr(self, 'history') and self.history:
-                self.save_history()
+            self.close()
         except:
             pass
     
@@ -527,21 +765,17 @@ class ClipboardManager(QObject):
             stats = self.stats.copy()
             
             if self.history:
-                # 히스토리 통계
+                # 히스토리 통계 (증분 집계값 사용)
                 total_items = len(self.history)
-                total_chars = sum(len(item['text']) for item in self.history)
+                total_chars = self.history_characters
                 avg_chars = total_chars // total_items if total_items > 0 else 0
                 
-                # 날짜 범위
-                timestamps = [datetime.fromisoformat(item['timestamp']) for item in self.history]
-                latest_date = max(timestamps).isoformat() if timestamps else None
-                oldest_date = min(timestamps).isoformat() if timestamps else None
+                # 날짜 범위 - 히스토리는 최신 항목이 앞
+                latest_date = self.history[0]['timestamp']
+                oldest_date = self.history[-1]['timestamp']
                 
                 # 소스별 통계
-                source_counts = {}
-                for item in self.history:
-                    source = item.get('source', 'unknown')
-                    source_counts[source] = source_counts.get(source, 0) + 1
+                source_counts = dict(self.source_counts)
                 
                 # 통계 병합
                 stats.update({
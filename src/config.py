@@ -2,12 +2,89 @@
 설정 관리 및 상수 정의 모듈
 """
 
+import atexit
+import copy
 import json
+import keyword
 import os
 import logging
+import threading
+import time
 from typing import Dict, Any, Optional
 
 
+_MISSING = object()
+
+
+class SettingsSection:
+    """불변 설정 묶음 - 필드는 섹션별로 생성되는 하위 클래스의 __slots__로 정의
+    
+    한 번 만들어진 스냅샷은 바뀌지 않으므로 Qt 스레드가 아닌 곳(오디오 콜백, 워커
+    스레드)에서도 잠금 없이 읽을 수 있습니다.
+    """
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"설정 스냅샷은 변경할 수 없습니다: {name}")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"설정 스냅샷은 변경할 수 없습니다: {name}")
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            name: value.as_dict() if isinstance(value, SettingsSection) else value
+            for name, value in ((name, getattr(self, name)) for name in self.__slots__)
+        }
+
+
+_section_classes = {}  # (이름, 필드) -> SettingsSection 하위 클래스
+
+
+def _section_class(name: str, fields: tuple) -> type:
+    cls = _section_classes.get((name, fields))
+    if cls is None:
+        class_name = ''.join(part.title() for part in name.split('_')) + 'Settings'
+        cls = type(class_name, (SettingsSection,), {'__slots__': fields})
+        _section_classes[(name, fields)] = cls
+    return cls
+
+
+def _freeze(name: str, values: Dict[str, Any], defaults: Any) -> SettingsSection:
+    """설정 딕셔너리를 불변 섹션 객체로 변환 (기본값이 실수면 정수 값도 실수로 통일)"""
+    defaults = defaults if isinstance(defaults, dict) else {}
+    fields = tuple(key for key in values
+                   if isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key))
+    section = object.__new__(_section_class(name, fields))
+    
+    for key in fields:
+        value = values[key]
+        default = defaults.get(key)
+        if isinstance(value, dict):
+            value = _freeze(key, value, default)
+        elif isinstance(value, list):
+            value = tuple(value)
+        elif isinstance(default, float) and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        object.__setattr__(section, key, value)
+    
+    return section
+
+
+def _lookup(settings: Dict[str, Any], keys: tuple) -> Any:
+    value = settings
+    try:
+        for key in keys:
+            value = value[key]
+    except (KeyError, TypeError, IndexError):
+        return _MISSING
+    return value
+
+
 class Config:
     """설정 관리 클래스"""
     
@@ -16,10 +93,14 @@ class Config:
         "audio": {
             "sample_rate": 16000,
             "channels": 1,
-            "dtype": "float32",
+            "dtype": "float32",  # 녹음 형식 (float32 / int16: 메모리 절반, 전처리에서 float32로 변환)
             "device_index": None,
+            "device_id": None,  # 선호 장치 식별자 ("호스트 API|이름", 장치 번호보다 우선)
             "silence_threshold": 0.01,
-            "remove_silence": True
+            "remove_silence": True,
+            "device_cache_file": "config/device_cache.json",
+            "hotplug_interval": 2.0,  # 장치 연결/해제 감지 주기 (초, 0이면 사용 안 함)
+            "hotplug_poll_interval": 30.0  # /proc/asound가 없는 플랫폼의 PortAudio 장치 목록 비교 주기 (초)
         },
         "whisper": {
             "model_name": "base",
@@ -44,20 +125,52 @@ class Config:
             "auto_copy": True,
             "history_enabled": True,
             "max_history": 50,
-            "backup_previous": True
+            "backup_previous": True,
+            "backend": "auto",  # auto, qt, pyperclip
+            "verify_timeout_ms": 200,
+            "journal_compact_records": 200,
+            "history_backend": "journal",  # journal 또는 sqlite
+            "history_db": None  # sqlite 경로 (기본: 히스토리 파일명.db)
         },
         "logging": {
             "level": "INFO",
             "file_enabled": True,
             "console_enabled": True,
             "max_file_size": 10485760,  # 10MB
-            "backup_count": 5
+            "backup_count": 5,
+            "async_enabled": True,  # 전용 스레드에서 파일/콘솔 기록
+            "queue_size": 10000,  # 로그 큐 크기 (가득 차면 버리고 개수 기록)
+            "rate_limit_interval": 1.0,  # 같은 위치 로그 빈도 제한 구간 (초, 0이면 사용 안 함)
+            "rate_limit_burst": 5  # 구간당 같은 위치에서 허용할 로그 수
         },
         "advanced": {
             "gpu_acceleration": False,
             "thread_pool_size": 4,
             "audio_buffer_size": 1024,
-            "auto_start": False
+            "auto_start": False,
+            "settings_save_delay": 1.0,  # 설정 저장 지연 (초, 연속 변경을 한 번에 기록, 0이면 즉시 저장)
+            "settings_watch_interval": 1.0  # 설정 파일 변경 감지 주기 (초, 0이면 사용 안 함)
+        },
+        "tracing": {
+            "enabled": True,
+            "trace_file": None,  # 워크플로우별 JSONL 기록 경로
+            "chrome_trace_file": None  # 종료 시 Chrome trace 내보내기 경로
+        },
+        "events": {
+            "enabled": True,
+            "file": "events.jsonl",  # 구조화 이벤트 로그 경로 (analyze_events.py로 분석)
+            "max_file_size": 10485760  # 초과 시 .1 파일로 교체
+        },
+        "metrics": {
+            "enabled": False,
+            "host": "127.0.0.1",
+            "port": 9464
+        },
+        "service": {
+            "enabled": False,
+            "socket_path": None,
+            "max_queue": 32,
+            "chunk_seconds": 30
         }
     }
     
@@ -65,88 +178,325 @@ class Config:
         self.config_file = config_file
         self.settings = {}
         self.logger = logging.getLogger(__name__)
+        self.snapshot_version = 0
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
+        self._settings_lock = threading.RLock()  # settings 변경과 저장용 복사 사이 동기화
+        self._key_paths = {}  # 점 표기 경로 -> 키 튜플 (매번 split하지 않도록)
+        
+        # 지연 저장 상태 (save_settings 요청을 모아 저장 스레드에서 기록)
+        self.save_delay = self.DEFAULT_SETTINGS['advanced']['settings_save_delay']
+        self.save_count = 0
+        self.save_error = None  # 마지막 저장 실패 메시지 (성공하면 None)
+        self._save_condition = threading.Condition()
+        self._save_due = None  # 예약된 저장 시각 (monotonic)
+        self._save_thread = None
+        self._write_lock = threading.Lock()
+        
+        # 설정 파일 감시 (외부에서 수정하면 다시 읽고 구독자에게 변경 내용 전달)
+        self.reload_count = 0
+        self._subscribers = []  # (콜백, 경로 접두어 튜플 또는 None)
+        self._file_signature = None  # 마지막으로 읽거나 쓴 파일의 (mtime_ns, 크기)
+        self._file_settings = {}  # 마지막으로 읽거나 쓴 파일 내용 (기본값 병합, 재로드 비교 기준)
+        self._watch_stop = threading.Event()
+        self._watch_thread = None
         
         self.load_settings()
+        self.save_delay = self.get('advanced.settings_save_delay', self.save_delay)
+    
+    @property
+    def snapshot(self):
+        """현재 설정의 불변 스냅샷 (예: config.snapshot.audio.silence_threshold)
+        
+        load_settings/set/set_section/reset_to_default 때마다 새로 만들어 교체하므로
+        읽는 쪽은 한 번 받은 스냅샷을 일관된 상태로 사용할 수 있습니다.
+        """
+        return self._snapshot
+    
+    def _rebuild_snapshot(self) -> None:
+        with self._snapshot_lock:
+            self.snapshot_version += 1
+            self._snapshot = _freeze('root', self.settings, self.DEFAULT_SETTINGS)
     
     def load_settings(self) -> None:
         """설정 파일 로드"""
         try:
             if os.path.exists(self.config_file):
+                self._file_signature = self._read_file_signature()
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     self.settings = json.load(f)
                     
                 # 기본값과 병합 (누락된 설정 추가)
                 self.settings = self._merge_settings(self.DEFAULT_SETTINGS, self.settings)
+                self._file_settings = copy.deepcopy(self.settings)
                 
                 self.logger.info(f"설정 파일 로드됨: {self.config_file}")
             else:
                 self.logger.info("설정 파일이 없습니다. 기본값을 사용합니다.")
-                self.settings = self.DEFAULT_SETTINGS.copy()
+                self.settings = copy.deepcopy(self.DEFAULT_SETTINGS)
+                self._rebuild_snapshot()
                 self.save_settings()  # 기본 설정 파일 생성
                 
         except Exception as e:
             self.logger.error(f"설정 파일 로드 실패: {e}")
-            self.settings = self.DEFAULT_SETTINGS.copy()
+            self.settings = copy.deepcopy(self.DEFAULT_SETTINGS)
+        
+        self._rebuild_snapshot()
     
-    def save_settings(self) -> bool:
-        """설정 파일 저장"""
-        try:
-            # 디렉터리 생성
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
+    def save_settings(self, immediate: bool = False) -> bool:
+        """설정 파일 저장 예약
+        
+        연속된 변경은 save_delay초 동안 모아 저장 스레드에서 한 번만 기록합니다.
+        이때 반환값 True는 저장이 예약되었다는 뜻일 뿐이며, 저장 스레드의 실패는
+        로그로 남기고 save_error에 기록합니다. 저장 결과를 사용자에게 알려야 하는
+        경로는 immediate=True로 호출하세요 (호출한 스레드에서 바로 기록하고 결과 반환).
+        지연이 0이어도 바로 기록합니다.
+        """
+        if immediate or not self.save_delay or self.save_delay <= 0:
+            with self._save_condition:
+                self._save_due = None
+            return self._write_settings()
+        
+        with self._save_condition:
+            self._save_due = time.monotonic() + self.save_delay
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._save_loop, name='settings-writer', daemon=True)
+                self._save_thread.start()
+                atexit.register(self.flush_settings)
+            self._save_condition.notify()
+        return True
+    
+    def flush_settings(self) -> bool:
+        """예약된 저장이 있으면 즉시 기록 (종료 시 호출)"""
+        with self._save_condition:
+            pending = self._save_due is not None
+            self._save_due = None
+        return self._write_settings() if pending else True
+    
+    @property
+    def save_pending(self) -> bool:
+        return self._save_due is not None
+    
+    def _save_loop(self) -> None:
+        while True:
+            with self._save_condition:
+                while self._save_due is None:
+                    self._save_condition.wait()
+                remaining = self._save_due - time.monotonic()
+                if remaining > 0:
+                    self._save_condition.wait(remaining)
+                    continue
+                self._save_due = None
+            self._write_settings()
+    
+    def _write_settings(self) -> bool:
+        """현재 설정을 임시 파일에 기록한 뒤 교체 (기록 중 종료되어도 기존 파일 유지)
+        
+        스냅샷은 식별자가 아닌 키를 빼고 목록/숫자 타입을 바꾸므로 저장에는
+        settings 원본을 잠금 안에서 복사해 사용합니다.
+        """
+        with self._write_lock:
+            temp_path = self.config_file + '.tmp'
+            try:
+                with self._settings_lock:
+                    settings = copy.deepcopy(self.settings)
+                data = json.dumps(settings, ensure_ascii=False, indent=2)
                 
-            self.logger.info(f"설정 파일 저장됨: {self.config_file}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"설정 파일 저장 실패: {e}")
+                # 디렉터리 생성
+                directory = os.path.dirname(self.config_file)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.config_file)
+                self._file_signature = self._read_file_signature()  # 직접 쓴 변경은 다시 읽지 않음
+                self._file_settings = settings
+                
+                self.save_count += 1
+                self.save_error = None
+                self.logger.info(f"설정 파일 저장됨: {self.config_file}")
+                return True
+                
+            except Exception as e:
+                self.save_error = str(e)
+                self.logger.error(f"설정 파일 저장 실패: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                return False
+    
+    def subscribe(self, callback, prefixes=None):
+        """설정 파일 재로드 시 호출될 콜백 등록
+        
+        콜백은 {'섹션.키': (이전 값, 새 값)} 형태의 변경 내용을 받습니다. prefixes를
+        주면 해당 경로(예: 'whisper', 'audio.silence_threshold')의 변경만 전달합니다.
+        콜백은 감시 스레드에서 호출되므로 Qt 객체는 시그널로 넘겨 처리해야 합니다.
+        """
+        self._subscribers.append((callback, tuple(prefixes) if prefixes else None))
+        return callback
+    
+    def unsubscribe(self, callback) -> None:
+        self._subscribers = [entry for entry in self._subscribers if entry[0] is not callback]
+    
+    def start_watching(self, interval: Optional[float] = None) -> bool:
+        """설정 파일 변경 감시 스레드 시작"""
+        if interval is None:
+            interval = self.get('advanced.settings_watch_interval', 1.0)
+        if not interval or interval <= 0 or self._watch_thread is not None:
             return False
+        
+        self._watch_stop.clear()
+        self._watch_thread = threading.Thread(target=self._watch_loop, args=(interval,),
+                                              name='settings-watcher', daemon=True)
+        self._watch_thread.start()
+        return True
     
-    def get(self, key_path: str, default: Any = None) -> Any:
-        """점 표기법으로 설정값 가져오기 (예: 'audio.sample_rate')"""
+    def stop_watching(self, timeout: float = 1.0) -> None:
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout)
+            self._watch_thread = None
+    
+    def check_for_changes(self) -> Dict[str, tuple]:
+        """파일이 외부에서 바뀌었으면 다시 읽고 변경 내용 반환 (바뀌지 않았으면 빈 딕셔너리)"""
+        with self._write_lock:
+            signature = self._read_file_signature()
+            if signature is None or signature == self._file_signature:
+                return {}
+            self._file_signature = signature
+        return self.reload_settings()
+    
+    def reload_settings(self) -> Dict[str, tuple]:
+        """설정 파일을 다시 읽어 바뀐 값만 적용하고 구독자에게 변경 내용 전달
+        
+        비교 기준은 마지막으로 읽거나 쓴 파일 내용이므로, 아직 저장하지 않은
+        set() 값은 파일에서 같은 경로가 바뀌지 않는 한 그대로 유지됩니다.
+        """
         try:
-            keys = key_path.split('.')
-            value = self.settings
-            
-            for key in keys:
-                value = value[key]
-                
-            return value
-            
-        except (KeyError, TypeError):
-            if default is not None:
-                return default
-            
-            # 기본값에서 찾기
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if not isinstance(loaded, dict):
+                raise ValueError("설정 파일 최상위 값이 객체가 아닙니다")
+        except Exception as e:
+            self.logger.warning(f"설정 파일 재로드 실패, 기존 설정 유지: {e}")
+            return {}
+        
+        settings = self._merge_settings(self.DEFAULT_SETTINGS, loaded)
+        file_changes = self._diff_settings(self._file_settings, settings)
+        self._file_settings = settings
+        
+        changes = {}
+        with self._settings_lock:
+            for path in file_changes:
+                keys = tuple(path.split('.'))
+                old_value = _lookup(self.settings, keys)
+                new_value = _lookup(settings, keys)
+                if old_value == new_value:
+                    continue
+                self._assign(self.settings, keys, new_value)
+                changes[path] = (None if old_value is _MISSING else old_value,
+                                 None if new_value is _MISSING else new_value)
+            if not changes:
+                return {}
+            self._rebuild_snapshot()
+        
+        self.reload_count += 1
+        self.logger.info(f"설정 파일 변경 적용: {', '.join(sorted(changes))}")
+        
+        for callback, prefixes in list(self._subscribers):
+            if prefixes is None:
+                relevant = changes
+            else:
+                relevant = {path: change for path, change in changes.items()
+                            if any(path == prefix or path.startswith(prefix + '.') for prefix in prefixes)}
+            if not relevant:
+                continue
             try:
-                keys = key_path.split('.')
-                value = self.DEFAULT_SETTINGS
-                
-                for key in keys:
-                    value = value[key]
-                    
-                return value
-                
-            except (KeyError, TypeError):
-                return None
+                callback(relevant)
+            except Exception as e:
+                self.logger.error(f"설정 변경 알림 처리 실패: {e}")
+        
+        return changes
+    
+    def _watch_loop(self, interval: float) -> None:
+        while not self._watch_stop.wait(interval):
+            self.check_for_changes()
+    
+    def _read_file_signature(self):
+        try:
+            stat = os.stat(self.config_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _assign(settings: Dict[str, Any], keys: tuple, value: Any) -> None:
+        """키 경로에 값 설정 (value가 _MISSING이면 키 삭제)"""
+        current = settings
+        for key in keys[:-1]:
+            if not isinstance(current.get(key), dict):
+                current[key] = {}
+            current = current[key]
+        if value is _MISSING:
+            current.pop(keys[-1], None)
+        else:
+            current[keys[-1]] = copy.deepcopy(value)
+    
+    @staticmethod
+    def _diff_settings(old: Dict[str, Any], new: Dict[str, Any], prefix: str = '') -> Dict[str, tuple]:
+        """두 설정의 말단 값 비교 - {'섹션.키': (이전 값, 새 값)}"""
+        changes = {}
+        for key in old.keys() | new.keys():
+            path = f"{prefix}{key}"
+            old_value = old.get(key)
+            new_value = new.get(key)
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                changes.update(Config._diff_settings(old_value, new_value, path + '.'))
+            elif old_value != new_value:
+                changes[path] = (old_value, new_value)
+        return changes
+    
+    def get(self, key_path: str, default: Any = _MISSING) -> Any:
+        """점 표기법으로 설정값 가져오기 (예: 'audio.sample_rate')
+        
+        값이 없으면 default를 반환하고(None 포함), default를 주지 않았으면
+        DEFAULT_SETTINGS에서 찾습니다.
+        """
+        keys = self._key_paths.get(key_path)
+        if keys is None:
+            keys = self._key_paths[key_path] = tuple(key_path.split('.'))
+        
+        value = _lookup(self.settings, keys)
+        if value is not _MISSING:
+            return value
+        if default is not _MISSING:
+            return default
+        
+        # 기본값에서 찾기
+        value = _lookup(self.DEFAULT_SETTINGS, keys)
+        return None if value is _MISSING else value
     
     def set(self, key_path: str, value: Any) -> bool:
         """점 표기법으로 설정값 설정"""
         try:
             keys = key_path.split('.')
-            current = self.settings
-            
-            # 마지막 키를 제외한 모든 키로 이동
-            for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-            
-            # 마지막 키에 값 설정
-            current[keys[-1]] = value
-            
+            with self._settings_lock:
+                current = self.settings
+                
+                # 마지막 키를 제외한 모든 키로 이동
+                for key in keys[:-1]:
+                    if key not in current:
+                        current[key] = {}
+                    current = current[key]
+                
+                # 마지막 키에 값 설정
+                current[keys[-1]] = value
+                
+                self._rebuild_snapshot()
             return True
             
         except Exception as e:
@@ -160,7 +510,9 @@ class Config:
     def set_section(self, section: str, values: Dict[str, Any]) -> bool:
         """설정 섹션 전체 설정"""
         try:
-            self.settings[section] = values
+            with self._settings_lock:
+                self.settings[section] = values
+                self._rebuild_snapshot()
             return True
         except Exception as e:
             self.logger.error(f"설정 섹션 설정 실패 ({section}): {e}")
@@ -169,17 +521,19 @@ class Config:
     def reset_to_default(self, section: Optional[str] = None) -> bool:
         """기본값으로 초기화"""
         try:
-            if section:
-                if section in self.DEFAULT_SETTINGS:
-                    self.settings[section] = self.DEFAULT_SETTINGS[section].copy()
-                    self.logger.info(f"설정 섹션 '{section}'이 기본값으로 초기화됨")
+            with self._settings_lock:
+                if section:
+                    if section in self.DEFAULT_SETTINGS:
+                        self.settings[section] = copy.deepcopy(self.DEFAULT_SETTINGS[section])
+                        self.logger.info(f"설정 섹션 '{section}'이 기본값으로 초기화됨")
+                    else:
+                        self.logger.warning(f"알 수 없는 설정 섹션: {section}")
+                        return False
                 else:
-                    self.logger.warning(f"알 수 없는 설정 섹션: {section}")
-                    return False
-            else:
-                self.settings = self.DEFAULT_SETTINGS.copy()
-                self.logger.info("모든 설정이 기본값으로 초기화됨")
-            
+                    self.settings = copy.deepcopy(self.DEFAULT_SETTINGS)
+                    self.logger.info("모든 설정이 기본값으로 초기화됨")
+                
+                self._rebuild_snapshot()
             return True
             
         except Exception as e:
@@ -188,8 +542,8 @@ class Config:
     
     @staticmethod
     def _merge_settings(default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """기본 설정과 사용자 설정 병합"""
-        result = default.copy()
+        """기본 설정과 사용자 설정 병합 (기본값 딕셔너리는 공유하지 않도록 복사)"""
+        result = copy.deepcopy(default)
         
         for key, value in user.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
@@ -200,8 +554,39 @@ class Config:
         return result
 
 
-# 전역 설정 인스턴스
-config = Config()
+class _LazyConfig:
+    """처음 사용할 때 설정 파일을 읽는 전역 설정 프록시
+    
+    import 시점에 파일 I/O나 기본 설정 파일 생성이 일어나지 않도록
+    Config 생성을 첫 속성 접근까지 미룹니다.
+    """
+    
+    def __init__(self):
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+    
+    def _load(self) -> Config:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = Config()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+    
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+    
+    def __delattr__(self, name):
+        delattr(self._load(), name)
+
+
+# 전역 설정 인스턴스 (지연 로드)
+config = _LazyConfig()
 
 
 # 상수 정의
@@ -270,10 +655,14 @@ def setup_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(Constants.LOG_LEVELS.get(log_level, logging.INFO))
     
-    # 기존 핸들러 제거
+    # 기존 핸들러 제거 (비동기 파이프라인이 있으면 남은 로그를 기록한 뒤 종료)
+    from async_logging import log_pipeline
+    log_pipeline.stop()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
+    handlers = []
+    
     # 파일 핸들러
     if file_enabled:
         from logging.handlers import RotatingFileHandler
@@ -284,16 +673,24 @@ def setup_logging():
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # 콘솔 핸들러
     if console_enabled:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # 비동기 기록: 로그를 남기는 스레드는 큐에 넣기만 하고 전용 스레드가 파일/콘솔에 기록
+    if config.get('logging.async_enabled', True):
+        root_logger.addHandler(log_pipeline.start(
+            handlers,
+            queue_size=config.get('logging.queue_size', 10000),
+            rate_limit_interval=config.get('logging.rate_limit_interval', 1.0),
+            rate_limit_burst=config.get('logging.rate_limit_burst', 5)
+        ))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     logging.info("로깅 시스템이 설정되었습니다")
-
-
-# 애플리케이션 시작 시 로깅 설정
-setup_logging()
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+오디오 장치 호환성 캐시 및 핫플러그 감시 모듈
+
+sd.check_input_settings는 장치마다 스트림을 열어 보는 수준의 검사라서 가상
+장치가 많은(PipeWire 등) 환경에서는 전체 목록 확인에 수백 ms가 걸립니다.
+성공한 검사 결과를 장치 이름/호스트 API 기준 키로 파일에 보관해 다음 실행부터
+다시 검사하지 않고, 백그라운드 감시 스레드가 장치 구성 변경을 감지하면
+호출자에게 알려 목록을 다시 확인하게 합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+
+CACHE_VERSION = 1
+NEGATIVE_TTL = 60.0  # 실패한 검사 결과 재사용 시간 (초)
+
+
+class DeviceCapabilityCache:
+    """장치별 설정 검사 결과 캐시 (JSON 파일에 저장)
+
+    키는 호출자가 정한 장치 식별 문자열(호스트 API, 이름, 채널 수, 기본
+    샘플레이트)이므로 장치 번호가 바뀌어도 재사용되고, 장치 특성이 바뀌면
+    자연스럽게 새 키가 됩니다.
+
+    검사 결과는 True(성공)만 파일에 저장합니다. 실패 결과는 장치가 잠시 다른
+    프로그램에서 사용 중인 경우에도 나오므로 negative_ttl초 동안만 메모리에
+    보관하고 이후 다시 검사합니다.
+    """
+
+    def __init__(self, path=None, negative_ttl=NEGATIVE_TTL):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.negative_ttl = negative_ttl
+        self.devices = {}  # 장치 키 -> {검사 이름: True}
+        self.failures = {}  # (장치 키, 검사 이름) -> (실패 결과, 만료 시각)
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                # 이전 버전이 저장한 실패 결과는 버림
+                self.devices = {key: {check: True for check, result in entry.get('checks', {}).items() if result is True}
+                                for key, entry in data.get('devices', {}).items()}
+                self.logger.debug(f"장치 캐시 로드됨: {len(self.devices)}개 장치")
+        except Exception as e:
+            self.logger.warning(f"장치 캐시 로드 실패, 새로 검사합니다: {e}")
+            self.devices = {}
+
+    def save(self):
+        """변경된 경우에만 임시 파일에 쓴 뒤 교체"""
+        with self._lock:
+            if not self.path or not self.dirty:
+                return False
+            data = {
+                'version': CACHE_VERSION,
+                'saved_at': time.time(),
+                'devices': {key: {'checks': checks} for key, checks in self.devices.items()}
+            }
+            self.dirty = False
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            self.logger.warning(f"장치 캐시 저장 실패: {e}")
+            return False
+
+    def lookup(self, device_key, check, probe):
+        """캐시된 검사 결과 반환 - 없으면 probe()를 실행해 저장 (실패 결과는 잠시만 보관)"""
+        with self._lock:
+            checks = self.devices.get(device_key)
+            if checks is not None and check in checks:
+                self.hits += 1
+                return checks[check]
+            failure = self.failures.get((device_key, check))
+            if failure is not None and failure[1] > time.monotonic():
+                self.hits += 1
+                return failure[0]
+
+        result = probe()
+
+        with self._lock:
+            self.misses += 1
+            if result is True:
+                self.failures.pop((device_key, check), None)
+                self.devices.setdefault(device_key, {})[check] = result
+                self.dirty = True
+            else:
+                self.failures[(device_key, check)] = (result, time.monotonic() + self.negative_ttl)
+        return result
+
+    def invalidate(self, device_key=None):
+        """장치 하나(또는 전체)의 검사 결과 삭제"""
+        with self._lock:
+            if device_key is None:
+                removed = bool(self.devices)
+                self.devices.clear()
+                self.failures.clear()
+            else:
+                removed = self.devices.pop(device_key, None) is not None
+                self.failures = {key: value for key, value in self.failures.items() if key[0] != device_key}
+            self.dirty = self.dirty or removed
+
+    def retain(self, device_keys):
+        """현재 연결된 장치 외의 항목 삭제 (캐시 파일이 계속 커지지 않도록)"""
+        device_keys = set(device_keys)
+        with self._lock:
+            stale = [key for key in self.devices if key not in device_keys]
+            for key in stale:
+                del self.devices[key]
+            self.failures = {key: value for key, value in self.failures.items() if key[0] in device_keys}
+            if stale:
+                self.dirty = True
+        return len(stale)
+
+
+def system_device_signature():
+    """OS 수준 오디오 장치 구성 서명 (알 수 없는 플랫폼이면 None)
+
+    Linux에서는 ALSA 카드 목록과 /dev/snd 장치 노드로 USB 마이크 등의 연결/해제를
+    PortAudio 재초기화 없이 감지합니다. 그 외 플랫폼은 호출자가 PortAudio 장치
+    목록 기반 서명을 대신 사용합니다 (AudioRecorder._portaudio_device_signature).
+    """
+    parts = []
+    try:
+        with open('/proc/asound/cards', 'r', encoding='utf-8', errors='replace') as f:
+            parts.append(f.read())
+    except OSError:
+        pass
+    try:
+        parts.append(','.join(sorted(os.listdir('/dev/snd'))))
+    except OSError:
+        pass
+    return '\n'.join(parts) if parts else None
+
+
+class DeviceHotplugWatcher:
+    """주기적으로 장치 구성 서명을 비교해 변경 시 콜백을 호출하는 감시 스레드
+
+    콜백이 False를 반환하면(예: 녹음 중이라 지금 처리할 수 없음) 다음 주기에
+    다시 호출합니다.
+    """
+
+    def __init__(self, on_change, interval=2.0, signature=system_device_signature):
+        self.logger = logging.getLogger(__name__)
+        self.on_change = on_change
+        self.interval = interval
+        self.signature = signature
+        self.last_signature = None
+        self.changes = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return False
+
+        self.last_signature = self.signature()
+        if self.last_signature is None:
+            self.logger.info("장치 구성 서명을 읽을 수 없어 핫플러그 감시를 사용하지 않습니다")
+            return False
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='device-hotplug', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self):
+        """서명을 한 번 비교하고 변경을 처리했으면 True"""
+        current = self.signature()
+        if current == self.last_signature:
+            return False
+
+        try:
+            handled = self.on_change() is not False
+        except Exception as e:
+            self.logger.error(f"장치 변경 처리 실패: {e}")
+            handled = True  # 같은 변경으로 매 주기 실패하지 않도록
+
+        if handled:
+            self.last_signature = current
+            self.changes += 1
+        return handled
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.poll()
@@ -0,0 +1,180 @@
+"""
+구조화된 이벤트 로그 모듈
+
+사람이 읽는 로그 메시지와 별도로, 녹음/전처리/인식/클립보드 단계의 수치를 정해진
+필드를 가진 이벤트로 JSONL 파일에 기록합니다. 기록은 큐에 넣기만 하고 전용 스레드가
+모아서 쓰므로 호출 스레드는 파일 I/O를 기다리지 않습니다.
+analyze_events.py로 모델별 지연 시간 백분위수와 실시간 배율(RTF) 분포를 계산합니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from config import config
+from tracing import tracer
+
+
+EVENT_LOG_VERSION = 1
+
+# 이벤트 종류별 필드 (누락된 필드는 None으로 기록되어 분석기가 항상 같은 키를 읽음)
+EVENT_FIELDS = {
+    'recording_started': ('device', 'sample_rate', 'channels', 'dtype'),
+    'recording_stopped': ('duration', 'samples', 'blocks', 'xruns', 'sample_rate'),
+    'audio_preprocessed': ('input_samples', 'output_samples', 'sample_rate', 'seconds'),
+    'model_loaded': ('model', 'import_seconds', 'load_seconds'),
+    'transcription': ('model', 'language', 'audio_seconds', 'processing_seconds', 'rtf',
+                      'success', 'text_length', 'error', 'voiced_seconds'),
+    'clipboard_copy': ('length', 'copy_seconds', 'verify_seconds', 'success'),
+}
+
+
+class EventLog:
+    """이벤트를 JSONL 파일에 비동기로 추가 기록하는 기록기
+
+    한 줄이 하나의 이벤트이며 공통 필드(v, ts, event, workflow_id) 뒤에 이벤트별
+    필드가 옵니다. 파일이 max_file_size를 넘으면 .1 파일로 교체합니다.
+    생성자에서 주지 않은 값은 처음 사용할 때 설정에서 읽습니다.
+    """
+
+    def __init__(self, path=None, enabled=None, max_file_size=None, queue_size=10000):
+        self.logger = logging.getLogger(__name__)
+        self._enabled = enabled
+        self._path = path
+        self._max_file_size = max_file_size
+        self._configured = False
+        self.written = 0
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def configure(self):
+        """생성자에서 주지 않은 설정을 설정 파일에서 읽기"""
+        if self._enabled is None:
+            self._enabled = config.get('events.enabled', True)
+        if not self._path:
+            self._path = config.get('events.file', 'events.jsonl')
+        if not self._max_file_size:
+            self._max_file_size = config.get('events.max_file_size', 10485760)
+        self._configured = True
+
+    @property
+    def enabled(self):
+        if not self._configured:
+            self.configure()
+        return self._enabled
+
+    @property
+    def path(self):
+        if not self._configured:
+            self.configure()
+        return self._path
+
+    @property
+    def max_file_size(self):
+        if not self._configured:
+            self.configure()
+        return self._max_file_size
+
+    def emit(self, event, workflow_id=None, **fields):
+        """이벤트 기록 요청 (큐가 가득 차면 버리고 개수만 셈)"""
+        names = EVENT_FIELDS.get(event)
+        if names is None:
+            raise ValueError(f"알 수 없는 이벤트 종류: {event}")
+        if not self.enabled:
+            return
+
+        record = {
+            'v': EVENT_LOG_VERSION,
+            'ts': round(time.time(), 6),
+            'event': event,
+            'workflow_id': workflow_id or tracer.active_id
+        }
+        for name in names:
+            record[name] = fields.pop(name, None)
+        record.update(fields)
+
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=2.0):
+        """대기 중인 이벤트가 모두 기록될 때까지 대기"""
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    @property
+    def stats(self):
+        return {'written': self.written, 'dropped': self.dropped, 'queued': self._queue.qsize()}
+
+    def _ensure_writer(self):
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='event-log', daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < 256:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+                self.written += len(batch)
+            except Exception as e:
+                self.logger.warning(f"이벤트 로그 기록 실패: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.max_file_size and os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_file_size:
+            os.replace(self.path, self.path + '.1')
+
+        lines = ''.join(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n' for record in batch)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+
+def read_events(paths):
+    """JSONL 이벤트 파일들을 순서대로 읽어 이벤트 딕셔너리 생성 (깨진 줄은 건너뜀)"""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and 'event' in record:
+                    yield record
+
+
+# 전역 이벤트 로그 인스턴스
+event_log = EventLog()
@@ -0,0 +1,198 @@
+"""
+히스토리 유사도 검색 모듈 (trigram 인덱스)
+
+음성 인식 결과는 철자가 조금씩 달라지므로(됬다/됐다, 띄어쓰기 등) 정확한 부분
+문자열 검색으로는 찾지 못하는 경우가 많습니다. 텍스트를 정규화한 뒤 3글자
+조각(trigram)으로 역색인을 만들고, 겹치는 조각 비율로 순위를 매깁니다.
+
+한글 음절은 NFD 정규화로 자모(초성/중성/종성)로 분해하므로 받침이나 모음
+하나만 다른 단어도 대부분의 trigram을 공유합니다.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+
+
+_SEPARATORS = re.compile(r'[\W_]+')
+_COMBINING_MARKS = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+
+
+def normalize_text(text):
+    """소문자화, 한글 자모 분해, 발음 구별 기호/문장 부호 제거"""
+    decomposed = unicodedata.normalize('NFD', text.casefold())
+    stripped = _COMBINING_MARKS.sub('', decomposed)
+    return _SEPARATORS.sub(' ', stripped).strip()
+
+
+def text_trigrams(text):
+    """정규화된 텍스트의 trigram 집합 (단어 경계는 공백으로 표시)"""
+    normalized = f" {normalize_text(text)} "
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+class FuzzyIndex:
+    """키 단위로 추가/삭제할 수 있는 trigram 역색인
+
+    trigram마다 문서 번호 비트맵(int)을 두고, 검색 시 검색어 trigram 비트맵을
+    비트 단위 카운터로 더해 문서별 겹침 수를 한꺼번에 계산합니다. 문서 수만큼
+    파이썬 반복을 돌지 않으므로 10만 개 문서에서도 수 ms 안에 검색됩니다.
+    """
+
+    def __init__(self):
+        self.bitmaps = {}  # trigram -> 문서 번호 비트맵
+        self.documents = {}  # 문서 번호 -> (키, 값, trigram 수, 텍스트)
+        self.keys = {}  # 키 -> 문서 번호
+        self.alive = 0  # 현재 문서 비트맵
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self.documents)
+
+    def clear(self):
+        self.bitmaps.clear()
+        self.documents.clear()
+        self.keys.clear()
+        self.alive = 0
+        self._next_id = 0
+
+    def add(self, key, text, value=None):
+        """문서 추가 (같은 키가 있으면 교체)"""
+        if key in self.keys:
+            self.remove(key)
+
+        doc_id = self._next_id
+        self._next_id += 1
+        bit = 1 << doc_id
+        trigrams = text_trigrams(text)
+        for trigram in trigrams:
+            self.bitmaps[trigram] = self.bitmaps.get(trigram, 0) | bit
+
+        self.alive |= bit
+        self.documents[doc_id] = (key, value, len(trigrams), text)
+        self.keys[key] = doc_id
+
+        # 삭제로 비어 있는 번호가 많아지면 비트맵이 불필요하게 길어지므로 번호 재배정
+        if self._next_id > 2 * len(self.documents) + 1024:
+            self._renumber()
+
+    def add_many(self, entries):
+        """(키, 텍스트, 값) 목록을 한 번에 추가 - 비트맵을 trigram마다 한 번만 생성"""
+        positions = defaultdict(list)
+        for key, text, value in entries:
+            if key in self.keys:
+                self.remove(key)
+            doc_id = self._next_id
+            self._next_id += 1
+            trigrams = text_trigrams(text)
+            for trigram in trigrams:
+                positions[trigram].append(doc_id)
+            self.documents[doc_id] = (key, value, len(trigrams), text)
+            self.keys[key] = doc_id
+
+        size = (self._next_id >> 3) + 1
+        for trigram, doc_ids in positions.items():
+            self.bitmaps[trigram] = self.bitmaps.get(trigram, 0) | _bitmap_from_ids(doc_ids, size)
+        self.alive = _bitmap_from_ids(self.documents, size)
+
+    def remove(self, key):
+        doc_id = self.keys.pop(key, None)
+        if doc_id is None:
+            return
+
+        _, _, _, text = self.documents.pop(doc_id)
+        bit = 1 << doc_id
+        for trigram in text_trigrams(text):
+            bitmap = self.bitmaps.get(trigram, 0) & ~bit
+            if bitmap:
+                self.bitmaps[trigram] = bitmap
+            else:
+                self.bitmaps.pop(trigram, None)
+        self.alive &= ~bit
+
+    def search(self, query, limit=10, min_score=0.3):
+        """유사도 순 (값, 점수) 목록
+
+        점수는 검색어 trigram 중 문서에 포함된 비율입니다. 점수가 같으면 Dice
+        계수가 높은(길이가 비슷한) 문서, 그다음 최근 추가된 문서가 앞에 옵니다.
+        """
+        query_trigrams = text_trigrams(query)
+        if not query_trigrams or not self.documents:
+            return []
+
+        total = len(query_trigrams)
+        required = max(1, math.ceil(min_score * total))
+
+        # 비트 단위 카운터: counters[i]는 문서별 겹침 수의 i번째 비트
+        counters = [0] * total.bit_length()
+        for trigram in query_trigrams:
+            carry = self.bitmaps.get(trigram, 0)
+            for level, counter in enumerate(counters):
+                if not carry:
+                    break
+                counters[level] = counter ^ carry
+                carry &= counter
+
+        # 높은 겹침 수부터 내려가며 limit개가 모일 때까지 후보 수집
+        # (같은 겹침 수에서는 최근 문서부터 limit * 4개까지만 비교)
+        candidates = []
+        collected = 0
+        cap = limit * 4 if limit else None
+        for overlap in range(total, required - 1, -1):
+            at_least = self._at_least(counters, overlap)
+            exact = at_least & ~collected
+            collected = at_least
+            for doc_id in _iter_ids_descending(exact, cap):
+                _, value, doc_size, _ = self.documents[doc_id]
+                candidates.append((overlap / total, 2 * overlap / (total + doc_size), doc_id, value))
+            if limit and len(candidates) >= limit:
+                break
+
+        candidates.sort(key=lambda entry: entry[:3], reverse=True)
+        if limit:
+            candidates = candidates[:limit]
+        return [(value, round(score, 3)) for score, _, _, value in candidates]
+
+    def _at_least(self, counters, threshold):
+        """겹침 수가 threshold 이상인 문서 비트맵 (비트 단위 비교)"""
+        greater = 0
+        equal = self.alive
+        for level in range(len(counters) - 1, -1, -1):
+            counter = counters[level]
+            if threshold >> level & 1:
+                equal &= counter
+            else:
+                greater |= equal & counter
+                equal &= ~counter
+        return greater | equal
+
+    def _renumber(self):
+        entries = [(key, text, value) for key, value, _, text in self.documents.values()]
+        self.clear()
+        self.add_many(entries)
+
+
+def _bitmap_from_ids(doc_ids, size):
+    buffer = bytearray(size)
+    for doc_id in doc_ids:
+        buffer[doc_id >> 3] |= 1 << (doc_id & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def _iter_ids_descending(bitmap, cap=None):
+    """비트맵의 문서 번호를 큰 번호(최근 문서)부터 최대 cap개 반환"""
+    if not bitmap:
+        return
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, 'little')
+    count = 0
+    for index in range(len(data) - 1, -1, -1):
+        byte = data[index]
+        if not byte:
+            continue
+        for bit in range(7, -1, -1):
+            if byte >> bit & 1:
+                yield (index << 3) | bit
+                count += 1
+                if cap and count >= cap:
+                    return
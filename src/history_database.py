@@ -0,0 +1,233 @@
+"""
+SQLite 기반 클립보드 히스토리 저장소
+
+수십만 개의 받아쓰기 결과를 보관할 수 있도록 히스토리를 SQLite에 저장합니다.
+FTS5 trigram 인덱스로 부분 문자열/접두어 검색을 처리하고, 날짜/언어/신뢰도
+필터와 페이지 단위 조회를 지원합니다. FTS5를 쓸 수 없는 SQLite에서는 LIKE
+검색으로 대체합니다.
+
+HistoryJournal과 같은 저장소 인터페이스(load/append/compact/clear/flush/close)를
+제공하므로 ClipboardManager에서 설정으로 선택할 수 있습니다.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    hash TEXT,
+    text TEXT NOT NULL,
+    source TEXT,
+    language TEXT,
+    confidence REAL,
+    data TEXT NOT NULL,
+    UNIQUE (hash, timestamp)
+);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+CREATE INDEX IF NOT EXISTS history_language ON history (language, timestamp);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    text, content='history', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS history_fts_insert AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS history_fts_delete AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts (history_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+MIN_TRIGRAM_LENGTH = 3  # trigram 인덱스가 처리할 수 있는 최소 검색어 길이
+
+
+def _to_timestamp(value):
+    """datetime 또는 ISO 문자열을 비교용 ISO 문자열로 변환"""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def _escape_like(keyword):
+    return keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class HistoryDatabase:
+    """SQLite/FTS5 히스토리 저장소 (최신 항목이 앞)"""
+
+    def __init__(self, path):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self._lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+        try:
+            self.connection.executescript(FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            self.fts_enabled = False
+            self.logger.warning(f"FTS5 전문 검색을 사용할 수 없어 LIKE 검색으로 대체합니다: {e}")
+
+        self.connection.commit()
+
+    def load(self, limit=None):
+        """최신 항목부터 limit개 반환"""
+        return self.query(limit=limit)
+
+    def append(self, item, max_items=None):
+        """항목 추가 - max_items는 메모리 창 크기이므로 DB에는 전체를 보관"""
+        self.append_many([item])
+
+    def append_many(self, items):
+        """여러 항목을 한 트랜잭션으로 추가 (같은 해시/시각 항목은 무시)"""
+        rows = (self._to_row(item) for item in items)  # executemany가 스트리밍으로 소비
+        with self._lock, self.connection:
+            cursor = self.connection.executemany(
+                "INSERT OR IGNORE INTO history (timestamp, hash, text, source, language, confidence, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return cursor.rowcount
+
+    def compact(self, items, wait=False):
+        """DB는 전체 히스토리를 보관하므로 재작성하지 않고 누락된 항목만 추가
+
+        호출자가 넘기는 items는 메모리 창(max_history)뿐이므로 이것으로 테이블을
+        교체하면 보관된 나머지 항목이 모두 지워집니다.
+        """
+        self.append_many(items)
+
+    def clear(self):
+        """저장된 히스토리 전체 삭제"""
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM history")
+
+    def needs_compaction(self):
+        return False
+
+    def flush(self, timeout=None):
+        return True
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    def expire_before(self, cutoff):
+        """epoch cutoff 이전 항목 삭제 (timestamp 인덱스 범위 삭제)"""
+        return self.delete_before(datetime.fromtimestamp(cutoff))
+
+    def delete_before(self, timestamp):
+        """timestamp 이전 항목 삭제 후 삭제 개수 반환"""
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM history WHERE timestamp < ?", (_to_timestamp(timestamp),)
+            )
+        return cursor.rowcount
+
+    def count(self, **filters):
+        where, params = self._build_filters(**filters)
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM history {where}", params).fetchone()[0]
+
+    def query(self, limit=None, offset=0, **filters):
+        """필터 조건에 맞는 항목을 최신순으로 페이지 단위 조회
+
+        filters: since, until (datetime 또는 ISO 문자열), language, min_confidence, source
+        """
+        where, params = self._build_filters(**filters)
+        sql = f"SELECT data FROM history {where} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        return self._fetch(sql, params + [limit if limit else -1, offset])
+
+    def search(self, keyword, prefix=False, limit=None, offset=0, **filters):
+        """키워드(부분 문자열) 또는 단어 접두어 검색
+
+        3자 이상의 검색어는 trigram 인덱스를 사용하고, 더 짧으면 LIKE로 조회합니다.
+        """
+        where, params = self._build_filters(**filters)
+        conditions = [where[len("WHERE "):]] if where else []
+        pattern = _escape_like(keyword)
+
+        if prefix:
+            conditions.append("(text LIKE ? ESCAPE '\\' OR text LIKE ? ESCAPE '\\')")
+            params += [f"{pattern}%", f"% {pattern}%"]
+        elif self.fts_enabled and len(keyword) >= MIN_TRIGRAM_LENGTH:
+            conditions.append("id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)")
+            params.append('"' + keyword.replace('"', '""') + '"')
+        else:
+            conditions.append("text LIKE ? ESCAPE '\\'")
+            params.append(f"%{pattern}%")
+
+        if prefix and self.fts_enabled and len(keyword) >= MIN_TRIGRAM_LENGTH:
+            # 접두어 후보를 trigram 인덱스로 먼저 좁힘
+            conditions.append("id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)")
+            params.append('"' + keyword.replace('"', '""') + '"')
+
+        sql = (f"SELECT data FROM history WHERE {' AND '.join(conditions)} "
+               f"ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?")
+        return self._fetch(sql, params + [limit if limit else -1, offset])
+
+    def iter_items(self, **filters):
+        """필터 조건에 맞는 전체 항목을 최신순으로 하나씩 반환
+
+        별도 읽기 연결(WAL)에서 커서를 순회하므로 항목 수와 무관하게 메모리가 일정하고
+        쓰기를 막지 않습니다.
+        """
+        where, params = self._build_filters(**filters)
+        connection = sqlite3.connect(self.path)
+        try:
+            rows = connection.execute(f"SELECT data FROM history {where} ORDER BY timestamp DESC, id DESC", params)
+            for (data,) in rows:
+                yield json.loads(data)
+        finally:
+            connection.close()
+
+    def _fetch(self, sql, params):
+        with self._lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    @staticmethod
+    def _build_filters(since=None, until=None, language=None, min_confidence=None, source=None):
+        conditions = []
+        params = []
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(_to_timestamp(until))
+        if language is not None:
+            conditions.append("language = ?")
+            params.append(language)
+        if min_confidence is not None:
+            conditions.append("confidence >= ?")
+            params.append(min_confidence)
+        if source is not None:
+            conditions.append("source = ?")
+            params.append(source)
+
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, params
+
+    @staticmethod
+    def _to_row(item):
+        return (
+            item.get('timestamp') or datetime.now().isoformat(),
+            item.get('hash'),
+            item['text'],
+            item.get('source'),
+            item.get('language'),
+            item.get('confidence'),
+            json.dumps(item, ensure_ascii=False)
+        )
@@ -0,0 +1,188 @@
+"""
+클립보드 히스토리 가져오기/내보내기 입출력 모듈
+
+JSON 배열, JSONL, CSV 히스토리를 한 번에 메모리로 읽지 않고 항목 단위로
+스트리밍하고, 내보내기도 일정 개수씩 나누어 파일/파일 객체에 바로 씁니다.
+gzip과 zstd(zstandard 패키지 설치 시) 압축을 지원합니다.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+
+
+IMPORT_FORMATS = ('json', 'jsonl', 'csv')
+EXPORT_FORMATS = ('json', 'jsonl', 'txt', 'csv')
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd'}
+CSV_FIELDS = ['timestamp', 'text', 'length', 'source', 'language', 'confidence']
+CHUNK_SIZE = 64 * 1024
+WRITE_BATCH_SIZE = 500  # 내보내기 시 한 번에 쓰는 항목 수
+
+
+def detect_compression(path):
+    """파일 확장자로 압축 방식 추정"""
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path)[1].lower())
+
+
+def detect_format(path):
+    """파일 확장자로 형식 추정 (.gz/.zst 압축 확장자는 제외하고 판단)"""
+    name, extension = os.path.splitext(path)
+    if extension.lower() in COMPRESSION_SUFFIXES:
+        name, extension = os.path.splitext(name)
+    extension = extension.lstrip('.').lower()
+    return extension if extension in EXPORT_FORMATS else 'json'
+
+
+def open_history_file(path, mode='r', compression=None):
+    """텍스트 모드로 히스토리 파일 열기 (압축 방식은 지정하지 않으면 확장자로 판단)"""
+    compression = compression or detect_compression(path)
+    if compression is None:
+        return open(path, mode, encoding='utf-8', newline='')
+    if compression == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+
+    fileobj = open(path, mode + 'b')
+    try:
+        return wrap_stream(fileobj, mode, compression, close_fileobj=True)
+    except Exception:
+        fileobj.close()
+        raise
+
+
+def wrap_stream(fileobj, mode, compression, close_fileobj=False):
+    """바이너리 파일 객체를 압축 텍스트 스트림으로 감싸기
+
+    반환된 스트림을 닫으면 압축이 마무리되며, fileobj는 close_fileobj일 때만 닫힙니다.
+    """
+    if compression == 'gzip':
+        binary = gzip.GzipFile(fileobj=fileobj, mode=mode + 'b')
+    elif compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다")
+        if mode == 'r':
+            binary = zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=close_fileobj)
+        else:
+            binary = zstandard.ZstdCompressor().stream_writer(fileobj, closefd=close_fileobj)
+    else:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+
+    return io.TextIOWrapper(binary, encoding='utf-8', newline='')
+
+
+def write_history_items(items, stream, format="json"):
+    """항목을 WRITE_BATCH_SIZE개씩 모아 스트림에 쓰고 쓴 개수 반환
+
+    json은 항목마다 한 줄인 배열, txt는 "[시각] 텍스트" 줄로 씁니다.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 포맷: {format}")
+
+    buffer = io.StringIO()
+    csv_writer = None
+    if format == "csv":
+        csv_writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        csv_writer.writeheader()
+    elif format == "json":
+        buffer.write('[')
+
+    count = 0
+    for item in items:
+        if format == "json":
+            buffer.write(('\n  ' if count == 0 else ',\n  ') + json.dumps(item, ensure_ascii=False))
+        elif format == "jsonl":
+            buffer.write(json.dumps(item, ensure_ascii=False) + '\n')
+        elif format == "txt":
+            buffer.write(('' if count == 0 else '\n') + f"[{item['timestamp']}] {item['text']}")
+        else:
+            csv_writer.writerow(dict(item, length=item.get('length', len(item['text'])),
+                                     source=item.get('source', 'unknown')))
+        count += 1
+
+        if count % WRITE_BATCH_SIZE == 0:
+            stream.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+    if format == "json":
+        buffer.write('\n]' if count else ']')
+    stream.write(buffer.getvalue())
+    return count
+
+
+def iter_history_items(stream, format="json"):
+    """스트림에서 유효한 히스토리 항목(text, timestamp 포함)을 하나씩 반환"""
+    if format == "json":
+        items = _iter_json_array(stream)
+    elif format == "jsonl":
+        items = (json.loads(line) for line in stream if line.strip())
+    elif format == "csv":
+        items = (_normalize_csv_row(row) for row in csv.DictReader(stream))
+    else:
+        raise ValueError(f"지원하지 않는 포맷: {format}")
+
+    for item in items:
+        if isinstance(item, dict) and item.get('text') and item.get('timestamp'):
+            yield item
+
+
+def _normalize_csv_row(row):
+    """CSV 문자열 값을 히스토리 항목 타입으로 변환"""
+    item = {key: value for key, value in row.items() if key and value not in (None, '')}
+    for key, cast in (('length', int), ('confidence', float), ('epoch', float)):
+        if key in item:
+            try:
+                item[key] = cast(item[key])
+            except ValueError:
+                del item[key]
+    return item
+
+
+def _iter_json_array(stream):
+    """최상위 JSON 배열의 원소를 청크 단위로 읽으며 하나씩 디코딩"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        # 공백과 구분자 건너뛰기
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError("JSON 배열 형식이 아닙니다")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # 원소 뒤에 구분자나 배열 끝이 올 때까지 읽어야 숫자 등이 잘리지 않음
+                if end < len(buffer) or eof:
+                    yield item
+                    position = end
+                    continue
+
+        if eof:
+            if started:
+                raise ValueError("JSON 배열이 닫히지 않았습니다")
+            return
+
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            eof = True
+        buffer = buffer[position:] + chunk
+        position = 0
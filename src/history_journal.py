@@ -0,0 +1,234 @@
+"""
+클립보드 히스토리 저널 저장소
+
+복사할 때마다 전체 JSON을 다시 쓰는 대신, 변경 사항을 JSONL 저널 파일에
+한 줄씩 추가합니다. 저널이 일정 크기를 넘으면 전체 스냅샷을 임시 파일에
+쓴 뒤 원자적으로 교체(compaction)하고 저널을 비웁니다.
+
+파일 구성:
+    clipboard_history.json          스냅샷 {"last_seq": N, "items": [...]} (최신 항목이 앞)
+    clipboard_history.json.journal  저널 (줄마다 {"seq": n, "op": ..., ...})
+
+스냅샷에 기록된 last_seq 이하의 저널 레코드는 로드할 때 건너뛰므로
+스냅샷 교체와 저널 비우기 사이에 종료되어도 항목이 중복되지 않습니다.
+"""
+
+import bisect
+import json
+import logging
+import os
+import queue
+import threading
+from datetime import datetime
+
+
+def ensure_epoch(item):
+    """항목에 숫자 epoch 시각이 없으면 ISO timestamp에서 한 번 계산해 저장"""
+    epoch = item.get('epoch')
+    if epoch is None:
+        epoch = item['epoch'] = datetime.fromisoformat(item['timestamp']).timestamp()
+    return epoch
+
+
+def expired_index(items, cutoff):
+    """최신 항목이 앞인 목록에서 epoch가 cutoff 이하인 첫 위치 (이진 탐색)"""
+    return bisect.bisect_left(items, -cutoff, key=lambda item: -item['epoch'])
+
+
+class HistoryJournal:
+    """단일 쓰기 스레드로 저널 추가와 스냅샷 압축을 처리하는 저장소"""
+
+    def __init__(self, path, compact_threshold=200, fsync=False):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        self.seq = 0  # 마지막으로 발급한 레코드 번호
+        self.journal_records = 0  # 현재 저널에 쌓인 레코드 수
+        self.stats = {
+            'appended_records': 0,
+            'write_batches': 0,
+            'compactions': 0,
+            'write_errors': 0
+        }
+
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def load(self, limit=None):
+        """스냅샷과 저널을 읽어 히스토리 목록(최신 항목이 앞) 반환"""
+        items = []
+        last_seq = 0
+
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, list):
+                items = snapshot  # 이전 버전의 전체 JSON 형식
+            else:
+                items = snapshot.get('items', [])
+                last_seq = snapshot.get('last_seq', 0)
+            for item in items:
+                ensure_epoch(item)  # epoch가 없던 이전 항목은 로드 시 한 번 변환
+
+        self.seq = last_seq
+        self.journal_records = 0
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 종료되어 잘린 마지막 줄
+                        self.logger.warning(f"저널 {line_number}번째 줄을 읽을 수 없어 건너뜁니다")
+                        continue
+
+                    self.journal_records += 1
+                    seq = record.get('seq', 0)
+                    self.seq = max(self.seq, seq)
+                    if seq <= last_seq:
+                        continue
+                    items = self._apply(items, record)
+
+        return items[:limit] if limit else items
+
+    def append(self, item, max_items=None):
+        """항목 추가 레코드를 쓰기 대기열에 추가"""
+        self._submit({'op': 'add', 'item': item, 'max_items': max_items})
+
+    def expire_before(self, cutoff):
+        """epoch가 cutoff 이하인 항목 만료 레코드 추가 (스냅샷 재작성 없음)"""
+        self._submit({'op': 'expire', 'before': cutoff})
+
+    def compact(self, items, wait=False):
+        """전체 스냅샷 교체 요청 - wait=True면 파일 교체가 끝날 때까지 대기"""
+        done = threading.Event() if wait else None
+        self._submit({'op': 'compact', 'items': list(items)}, done)
+        if done:
+            done.wait()
+
+    def clear(self):
+        """저장된 히스토리 전체 삭제 (빈 스냅샷으로 교체)"""
+        self.compact([], wait=True)
+
+    def needs_compaction(self):
+        return self.journal_records >= self.compact_threshold
+
+    def flush(self, timeout=None):
+        """대기 중인 레코드가 모두 기록될 때까지 대기"""
+        done = threading.Event()
+        self._submit(None, done)
+        return done.wait(timeout)
+
+    def close(self, timeout=5):
+        """남은 레코드를 기록하고 쓰기 스레드 종료"""
+        with self._lock:
+            writer = self._writer
+            if writer is None:
+                return
+            self._writer = None
+            self._queue.put(('stop', None))
+        writer.join(timeout)
+
+    def _submit(self, record, done=None):
+        with self._lock:
+            if record is not None:
+                # 스냅샷은 직전까지 발급된 레코드 번호를 last_seq로 기록
+                if record['op'] != 'compact':
+                    self.seq += 1
+                record['seq'] = self.seq
+            self._queue.put((record, done))
+
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="history-journal", daemon=True)
+                self._writer.start()
+
+    def _writer_loop(self):
+        """대기열의 레코드를 모아(coalescing) 한 번에 기록"""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            pending = []
+            waiters = []
+            for record, done in batch:
+                if record == 'stop':
+                    stop = True
+                    continue
+                if record is not None:
+                    if record['op'] == 'compact':
+                        # 스냅샷이 앞선 레코드를 모두 포함하므로 버림
+                        pending = [record]
+                    else:
+                        pending.append(record)
+                if done:
+                    waiters.append(done)
+
+            try:
+                self._write_batch(pending)
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                self.logger.error(f"히스토리 저널 기록 실패: {e}")
+
+            for done in waiters:
+                done.set()
+            if stop:
+                break
+
+    def _write_batch(self, records):
+        if not records:
+            return
+
+        if records[0]['op'] == 'compact':
+            self._write_snapshot(records[0]['items'], records[0]['seq'])
+            records = records[1:]
+            if not records:
+                return
+
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        self.journal_records += len(records)
+        self.stats['appended_records'] += len(records)
+        self.stats['write_batches'] += 1
+
+    def _write_snapshot(self, items, last_seq):
+        """임시 파일에 스냅샷을 쓰고 원자적으로 교체한 뒤 저널 비우기"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'last_seq': last_seq, 'items': items}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+        self.journal_records = 0
+        self.stats['compactions'] += 1
+
+    @staticmethod
+    def _apply(items, record):
+        op = record.get('op')
+        if op == 'add':
+            item = record['item']
+            ensure_epoch(item)
+            items.insert(0, item)
+            max_items = record.get('max_items')
+            if max_items and len(items) > max_items:
+                del items[max_items:]
+        elif op == 'expire':
+            del items[expired_index(items, record['before']):]
+        return items
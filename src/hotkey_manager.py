@@ -38,6 +38,7 @@ class HotkeyManager(QObject):
         # 키보드 리스너
         self.listener = None
         self.running = False
+        self.permission_result = None  # preflight_permissions() 결과 (start()에서 한 번 사용)
         self.restart_attempts = 0
         self.max_restart_attempts = 3
         
@@ -45,6 +46,8 @@ class HotkeyManager(QObject):
         self.debounce_time = 0.05  # 50ms
         self.key_repeat_threshold = 0.1  # 100ms
         self.last_hotkey_trigger = 0
+        self.last_trigger_perf = None  # 지연 시간 추적용 (perf_counter)
+        self.last_release_perf = None
         
         # OS 특정 설정
         self.os_type = platform.system().lower()
@@ -115,6 +118,11 @@ class HotkeyManager(QObject):
                 
         return True
     
+    def preflight_permissions(self):
+        """권한 확인을 미리 수행 (xhost 실행 등으로 느릴 수 있어 시작 시 별도 스레드에서 호출)"""
+        self.permission_result = self._check_permissions()
+        return self.permission_result
+    
     def start(self):
         """향상된 단축키 리스너 시작"""
         if self.running:
@@ -125,8 +133,12 @@ class HotkeyManager(QObject):
             self.logger.info("단축키가 비활성화되어 있습니다")
             return False
         
-        # 권한 확인
-        if not self._check_permissions():
+        # 권한 확인 (미리 확인한 결과가 있으면 재사용)
+        permitted = self.permission_result
+        self.permission_result = None
+        if permitted is None:
+            permitted = self._check_permissions()
+        if not permitted:
             error_msg = "단축키 사용을 위한 권한이 부족합니다"
             self.logger.error(error_msg)
             self.permission_required.emit(error_msg)
@@ -270,6 +282,7 @@ class HotkeyManager(QObject):
                     return
                 
                 self.last_hotkey_trigger = current_time
+                self.last_trigger_perf = time.perf_counter()
                 self.is_recording = True
                 
                 self.logger.debug(f"단축키 활성화: {self._combination_to_string(self.currently_pressed)}")
@@ -294,6 +307,7 @@ class HotkeyManager(QObject):
         # 단축키 조합이 더 이상 활성화되지 않으면 녹음 중지
         if self.is_recording and not self._is_hotkey_active():
             self.is_recording = False
+            self.last_release_perf = time.perf_counter()
             self.logger.debug("단축키 비활성화 - 녹음 중지")
             self.recording_stopped.emit()
     
@@ -406,7 +420,9 @@ class HotkeyManager(QObject):
                     config_keys.append(key.char.lower())
             
             config.set('hotkey.combination', config_keys)
-            config.save_settings()
+            saved = config.save_settings(immediate=True)
+            if not saved:
+                self.error_occurred.emit(f"단축키 설정 저장 실패: {config.save_error}")
             
             new_combination_str = self._combination_to_string(self.hotkey_combination)
             self.logger.info(f"단축키 변경: {old_combination_str} -> {new_combination_str}")
@@ -416,7 +432,7 @@ class HotkeyManager(QObject):
             if was_running:
                 self.start()
             
-            return True
+            return saved
             
         except Exception as e:
             error_msg = f"단축키 변경 실패: {e}"
@@ -7,15 +7,26 @@ import sys
 import logging
 import time
 import os
+import importlib
+
+STARTUP_STARTED = time.perf_counter()  # 단계별 시작 시간 측정 기준 (프로세스 초기 import 시점)
+STARTUP_TARGET_SECONDS = 0.5  # 트레이/단축키가 준비될 때까지의 목표 시간
+
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtCore import QCoreApplication, QTimer, pyqtSignal, QObject
 
 from config import setup_logging, config
+from tracing import tracer
+from metrics import metrics, MetricsServer
+from async_logging import log_pipeline
+from event_log import event_log
 from tray_manager import TrayManager
 from hotkey_manager import HotkeyManager
 from audio_recorder import AudioRecorder
 from whisper_handler import WhisperHandler
 from clipboard_manager import ClipboardManager
+from transcription_service import TranscriptionService
+from startup_scheduler import StartupScheduler
 
 
 class SpeechToTextApp(QObject):
@@ -24,12 +35,18 @@ class SpeechToTextApp(QObject):
     app_stopping = pyqtSignal()
     workflow_completed = pyqtSignal(str, dict)  # 텍스트, 메타데이터
     workflow_failed = pyqtSignal(str)  # 에러 메시지
+    settings_reloaded = pyqtSignal(dict)  # 설정 파일 변경 내용 {'섹션.키': (이전 값, 새 값)}
     
     def __init__(self):
         super().__init__()
         setup_logging()
         self.logger = logging.getLogger(__name__)
         
+        # 시작 단계별 소요 시간 (초)
+        self.startup_timings = {}
+        self._startup_mark = STARTUP_STARTED
+        self.mark_startup_phase('bootstrap')
+        
         # 애플리케이션 상태
         self.is_running = False
         self.current_workflow_id = None
@@ -54,97 +71,62 @@ class SpeechToTextApp(QObject):
             'start_time': time.time()
         }
         
+        # 메트릭 엔드포인트
+        self.metrics_server = None
+        
+        # 로컬 음성 인식 서비스 (Unix 소켓)
+        self.transcription_service = None
+        
         # 애플리케이션 초기화
+        self.startup_scheduler = None
         self.initialize_components()
+        self.mark_startup_phase('components')
         self.setup_connections()
         self.setup_error_handling()
+        self.setup_metrics()
+        self.setup_transcription_service()
+        self.setup_settings_watcher()
+        self.mark_startup_phase('setup')
+    
+    def mark_startup_phase(self, name):
+        """직전 단계 이후 경과 시간을 name 단계의 소요 시간으로 기록"""
+        now = time.perf_counter()
+        self.startup_timings[name] = now - self._startup_mark
+        self._startup_mark = now
+        self.logger.info(f"⏱️ 시작 단계 '{name}': {self.startup_timings[name] * 1000:.0f}ms")
     
     def initialize_components(self):
-        """컴포넌트 순차적 초기화"""
+        """컴포넌트 초기화 (의존 관계 기반 병렬 실행)
+        
+        Qt 객체 생성은 메인 스레드에서 트레이 -> 단축키 -> 클립보드 -> 오디오 ->
+        Whisper 순서로 하고, 단축키 권한 확인, 히스토리 로드, 오디오 장치 탐색,
+        whisper/torch import는 스레드 풀에서 겹쳐 실행합니다. 모델 로딩 자체는
+        이벤트 루프가 시작된 뒤 백그라운드에서 진행합니다.
+        """
         try:
             self.logger.info("컴포넌트 초기화 시작")
-            
-            # 1. 기본 컴포넌트 (전역 시스템과 독립적)
-            self.clipboard_manager = ClipboardManager()
-            self.logger.info("✅ 클립보드 매니저 초기화 완료")
-            
-            # 2. 오디오 컴포넌트
-            if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
-                # 테스트용 더미 AudioRecorder
-                from unittest.mock import MagicMock
-                self.audio_recorder = MagicMock()
-                # 시그널 모킹
-                mock_signal = MagicMock()
-                mock_signal.connect = MagicMock()
-                self.audio_recorder.recording_finished = mock_signal
-                self.audio_recorder.recording_started = mock_signal
-                self.audio_recorder.error_occurred = mock_signal
-                self.logger.info("✅ 오디오 레코더 초기화 완료 (테스트 모드)")
-            else:
-                self.audio_recorder = AudioRecorder()
-                self.logger.info("✅ 오디오 레코더 초기화 완료")
-            
-            # 3. AI 컴포넌트 (시간이 오래 걸릴 수 있음)
-            # 테스트 모드에서는 모델 로딩 스킵
-            if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
-                # 테스트용 더미 WhisperHandler 생성
-                from unittest.mock import MagicMock
-                self.whisper_handler = MagicMock()
-                self.whisper_handler.is_model_loaded.return_value = True
-                self.whisper_handler.is_model_loading.return_value = False
-                self.whisper_handler.get_current_model.return_value = "base"
-                self.whisper_handler.get_statistics.return_value = {"success_rate": 95.0, "average_confidence": 0.85}
-                # 시그널 모킹 (connect 메서드 포함)
-                mock_signal = MagicMock()
-                mock_signal.connect = MagicMock()
-                self.whisper_handler.transcription_completed = mock_signal
-                self.whisper_handler.transcription_started = mock_signal
-                self.whisper_handler.transcription_failed = mock_signal
-                self.whisper_handler.model_loading_started = mock_signal
-                self.whisper_handler.model_loading_completed = mock_signal
-                self.whisper_handler.model_loading_failed = mock_signal
-                self.whisper_handler.language_detected = mock_signal
-                self.logger.info("✅ Whisper 핸들러 초기화 완료 (테스트 모드)")
-            else:
-                self.whisper_handler = WhisperHandler()
-                self.logger.info("✅ Whisper 핸들러 초기화 시작 (모델 로딩 중...)")
-            
-            # 4. 입력 컴포넌트
-            if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
-                # 테스트용 더미 HotkeyManager
-                from unittest.mock import MagicMock
-                self.hotkey_manager = MagicMock()
-                self.hotkey_manager.is_running.return_value = True
-                self.hotkey_manager.is_enabled.return_value = True
-                self.hotkey_manager.get_current_hotkey_string.return_value = "Ctrl+Alt+Space"
-                self.hotkey_manager.get_statistics.return_value = {}
-                # 시그널 모킹
-                mock_signal = MagicMock()
-                mock_signal.connect = MagicMock()
-                self.hotkey_manager.recording_started = mock_signal
-                self.hotkey_manager.recording_stopped = mock_signal
-                self.hotkey_manager.error_occurred = mock_signal
-                self.logger.info("✅ 단축키 매니저 초기화 완료 (테스트 모드)")
-            else:
-                self.hotkey_manager = HotkeyManager()
-                self.logger.info("✅ 단축키 매니저 초기화 완료")
-            
-            # 5. UI 컴포넌트 (마지막)
-            if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
-                # 테스트용 더미 TrayManager
-                from unittest.mock import MagicMock
-                self.tray_manager = MagicMock()
-                # 시그널 모킹
-                mock_signal = MagicMock()
-                mock_signal.connect = MagicMock()
-                self.tray_manager.quit_requested = mock_signal
-                self.tray_manager.settings_requested = mock_signal
-                self.tray_manager.toggle_requested = mock_signal
-                self.tray_manager.status_info_requested = mock_signal
-                self.logger.info("✅ 트레이 매니저 초기화 완료 (테스트 모드)")
-            else:
-                self.tray_manager = TrayManager()
-                self.logger.info("✅ 트레이 매니저 초기화 완료")
+            test_mode = os.environ.get('QT_QPA_PLATFORM') == 'offscreen'
+            
+            scheduler = StartupScheduler(max_workers=config.get('advanced.thread_pool_size', 4))
+            scheduler.add('tray', self._init_tray_manager, main_thread=True)
+            scheduler.add('hotkey', self._init_hotkey_manager, main_thread=True)
+            scheduler.add('hotkey_permissions', lambda: self.hotkey_manager.preflight_permissions(),
+                          depends=('hotkey',))
+            scheduler.add('clipboard', self._init_clipboard_manager, main_thread=True)
+            scheduler.add('clipboard_history', lambda: self.clipboard_manager.load_history(),
+                          depends=('clipboard',))
+            scheduler.add('audio', self._init_audio_recorder, main_thread=True)
+            scheduler.add('audio_device', lambda: self.audio_recorder.setup_audio_device(),
+                          depends=('audio',))
+            scheduler.add('whisper_handler', self._init_whisper_handler, main_thread=True)
+            if not test_mode:
+                # 트레이/단축키 준비 후 import를 미리 시작 (완료는 기다리지 않음)
+                scheduler.add('whisper_import', lambda: importlib.import_module('whisper'),
+                              depends=('tray', 'hotkey'), wait=False, optional=True)
+            
+            scheduler.run()
+            self.startup_scheduler = scheduler
+            self.logger.info(f"⏱️ {scheduler.report()}")
             
             self.logger.info("🎉 모든 컴포넌트 초기화 성공")
             
@@ -152,6 +134,93 @@ class SpeechToTextApp(QObject):
             self.logger.error(f"컴포넌트 초기화 실패: {e}")
             raise
     
+    def _init_tray_manager(self):
+        """UI 컴포넌트 (가장 먼저 준비)"""
+        if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+            # 테스트용 더미 TrayManager
+            from unittest.mock import MagicMock
+            self.tray_manager = MagicMock()
+            # 시그널 모킹
+            mock_signal = MagicMock()
+            mock_signal.connect = MagicMock()
+            self.tray_manager.quit_requested = mock_signal
+            self.tray_manager.settings_requested = mock_signal
+            self.tray_manager.toggle_requested = mock_signal
+            self.tray_manager.status_info_requested = mock_signal
+            self.logger.info("✅ 트레이 매니저 초기화 완료 (테스트 모드)")
+        else:
+            self.tray_manager = TrayManager()
+            self.logger.info("✅ 트레이 매니저 초기화 완료")
+    
+    def _init_hotkey_manager(self):
+        """입력 컴포넌트 (리스너는 run()에서 시작)"""
+        if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+            # 테스트용 더미 HotkeyManager
+            from unittest.mock import MagicMock
+            self.hotkey_manager = MagicMock()
+            self.hotkey_manager.is_running.return_value = True
+            self.hotkey_manager.is_enabled.return_value = True
+            self.hotkey_manager.get_current_hotkey_string.return_value = "Ctrl+Alt+Space"
+            self.hotkey_manager.get_statistics.return_value = {}
+            # 시그널 모킹
+            mock_signal = MagicMock()
+            mock_signal.connect = MagicMock()
+            self.hotkey_manager.recording_started = mock_signal
+            self.hotkey_manager.recording_stopped = mock_signal
+            self.hotkey_manager.error_occurred = mock_signal
+            self.logger.info("✅ 단축키 매니저 초기화 완료 (테스트 모드)")
+        else:
+            self.hotkey_manager = HotkeyManager()
+            self.logger.info("✅ 단축키 매니저 초기화 완료")
+    
+    def _init_clipboard_manager(self):
+        """기본 컴포넌트 (히스토리는 별도 작업에서 로드)"""
+        self.clipboard_manager = ClipboardManager(autoload=False)
+        self.logger.info("✅ 클립보드 매니저 초기화 완료")
+    
+    def _init_audio_recorder(self):
+        """오디오 컴포넌트 (장치 탐색은 별도 작업에서 수행)"""
+        if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+            # 테스트용 더미 AudioRecorder
+            from unittest.mock import MagicMock
+            self.audio_recorder = MagicMock()
+            # 시그널 모킹
+            mock_signal = MagicMock()
+            mock_signal.connect = MagicMock()
+            self.audio_recorder.recording_finished = mock_signal
+            self.audio_recorder.recording_started = mock_signal
+            self.audio_recorder.error_occurred = mock_signal
+            self.logger.info("✅ 오디오 레코더 초기화 완료 (테스트 모드)")
+        else:
+            self.audio_recorder = AudioRecorder(probe_device=False)
+            self.logger.info("✅ 오디오 레코더 초기화 완료")
+    
+    def _init_whisper_handler(self):
+        """AI 컴포넌트 (모델 로딩은 run()에서 이벤트 루프 시작 후)"""
+        # 테스트 모드에서는 모델 로딩 스킵
+        if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+            # 테스트용 더미 WhisperHandler 생성
+            from unittest.mock import MagicMock
+            self.whisper_handler = MagicMock()
+            self.whisper_handler.is_model_loaded.return_value = True
+            self.whisper_handler.is_model_loading.return_value = False
+            self.whisper_handler.get_current_model.return_value = "base"
+            self.whisper_handler.get_statistics.return_value = {"success_rate": 95.0, "average_confidence": 0.85}
+            # 시그널 모킹 (connect 메서드 포함)
+            mock_signal = MagicMock()
+            mock_signal.connect = MagicMock()
+            self.whisper_handler.transcription_completed = mock_signal
+            self.whisper_handler.transcription_started = mock_signal
+            self.whisper_handler.transcription_failed = mock_signal
+            self.whisper_handler.model_loading_started = mock_signal
+            self.whisper_handler.model_loading_completed = mock_signal
+            self.whisper_handler.model_loading_failed = mock_signal
+            self.whisper_handler.language_detected = mock_signal
+            self.logger.info("✅ Whisper 핸들러 초기화 완료 (테스트 모드)")
+        else:
+            self.whisper_handler = WhisperHandler(autoload=False)
+            self.logger.info("✅ Whisper 핸들러 초기화 완료 (모델은 시작 후 로딩)")
+    
     def setup_connections(self):
         """전체 시스템 시그널 연결"""
         # === 주요 워크플로우 ===
@@ -228,6 +297,10 @@ class SpeechToTextApp(QObject):
             self.current_workflow_id = str(int(time.time() * 1000))  # 고유 ID
             self.stats['total_recordings'] += 1
             
+            # 단계별 지연 시간 추적 시작 (단축키 감지 -> 슬롯 호출까지 포함)
+            tracer.begin(self.current_workflow_id, model=config.snapshot.whisper.model_name)
+            tracer.add_span('hotkey_dispatch', getattr(self.hotkey_manager, 'last_trigger_perf', None))
+            
             self.logger.info(f"🎤 음성 녹음 시작 (ID: {self.current_workflow_id})")
             self.audio_recorder.start_recording()
             
@@ -242,19 +315,21 @@ class SpeechToTextApp(QObject):
                 return
                 
             self.logger.info(f"📽 음성 녹음 종료 (ID: {self.current_workflow_id})")
+            tracer.add_span('hotkey_release_dispatch', getattr(self.hotkey_manager, 'last_release_perf', None))
             self.audio_recorder.stop_recording()
             
         except Exception as e:
             self.handle_system_error(f"녹음 종료 실패: {e}")
     
     def process_audio(self, audio_data):
-        """오디오 인식 처리"""
+        """오디오 인식 처리 (AudioBuffer 핸들을 복사 없이 Whisper로 전달)"""
         try:
-            if not audio_data or len(audio_data) == 0:
+            if audio_data is None or len(audio_data) == 0:
                 self.handle_workflow_error("빈 오디오 데이터")
                 return
             
-            audio_length = len(audio_data) / 16000  # 오디오 길이 (초)
+            sample_rate = getattr(audio_data, 'sample_rate', 16000)
+            audio_length = len(audio_data) / sample_rate  # 오디오 길이 (초)
             self.logger.info(f"🎧 음성 인식 시작 - 길이: {audio_length:.2f}초 (ID: {self.current_workflow_id})")
             
             # 메타데이터 준비
@@ -264,7 +339,11 @@ class SpeechToTextApp(QObject):
                 'timestamp': time.time()
             }
             
-            self.whisper_handler.transcribe_audio(audio_data, custom_options={'source': 'voice_recording'})
+            self.whisper_handler.transcribe_audio(
+                audio_data,
+                sample_rate=sample_rate,
+                custom_options={'source': 'voice_recording', 'workflow_id': self.current_workflow_id}
+            )
             
         except Exception as e:
             self.handle_system_error(f"오디오 처리 실패: {e}")
@@ -276,6 +355,8 @@ class SpeechToTextApp(QObject):
                 self.handle_workflow_error("빈 인식 결과")
                 return
             
+            tracer.add_span('result_dispatch', metadata.get('completed_at'), workflow_id=self.current_workflow_id)
+            
             # 메타데이터 확장
             copy_metadata = {
                 'workflow_id': self.current_workflow_id,
@@ -308,6 +389,81 @@ class SpeechToTextApp(QObject):
         
         self.logger.info("🚑 에러 처리 시스템 설정 완료")
     
+    def setup_metrics(self):
+        """각 컴포넌트의 stats 딕셔너리를 메트릭 소스로 등록하고 엔드포인트 시작"""
+        metrics.register_source(
+            'app',
+            lambda: dict(self.stats, error_count=self.error_count),
+            counters=('total_recordings', 'successful_transcriptions', 'failed_transcriptions')
+        )
+        metrics.register_source(
+            'whisper',
+            lambda: dict(self.whisper_handler.stats, model_loaded=self.whisper_handler.is_model_loaded()),
+            counters=('total_transcriptions', 'successful_transcriptions', 'failed_transcriptions',
+                      'total_processing_time')
+        )
+        metrics.register_source(
+            'clipboard',
+            lambda: self.clipboard_manager.stats,
+            counters=('total_copies', 'successful_copies', 'failed_copies', 'total_characters')
+        )
+        metrics.register_source(
+            'audio',
+            lambda: {'xrun_count': self.audio_recorder.xrun_count},
+            counters=('xrun_count',)
+        )
+        metrics.register_source(
+            'hotkey',
+            lambda: {'error_count': self.hotkey_manager.error_count,
+                     'restart_attempts': self.hotkey_manager.restart_attempts}
+        )
+        metrics.register_source(
+            'logging',
+            lambda: log_pipeline.stats,
+            counters=('dropped', 'suppressed')
+        )
+        metrics.register_source(
+            'events',
+            lambda: event_log.stats,
+            counters=('written', 'dropped')
+        )
+        
+        if config.get('metrics.enabled', False):
+            self.metrics_server = MetricsServer(metrics)
+            self.metrics_server.start()
+    
+    def setup_transcription_service(self):
+        """상주 모델을 다른 프로세스와 공유하는 소켓 서비스 시작"""
+        if not config.get('service.enabled', False):
+            return
+        
+        self.transcription_service = TranscriptionService(lambda: self.whisper_handler.model)
+        if self.transcription_service.start():
+            metrics.register_source(
+                'service',
+                lambda: dict(self.transcription_service.stats, queued=self.transcription_service.jobs.qsize()),
+                counters=('requests', 'completed', 'failed', 'rejected', 'audio_seconds', 'processing_time')
+            )
+        else:
+            self.transcription_service = None
+    
+    def setup_settings_watcher(self):
+        """settings.json을 감시해 재시작 없이 변경된 설정 적용"""
+        # 구독 콜백은 감시 스레드에서 호출되므로 시그널로 메인 스레드에 전달
+        config.subscribe(self.settings_reloaded.emit)
+        self.settings_reloaded.connect(self.handle_settings_reloaded)
+        config.start_watching()
+    
+    def handle_settings_reloaded(self, changes):
+        """설정 파일 변경을 각 컴포넌트에 전달"""
+        self.logger.info(f"⚙️ 설정 파일 변경 감지: {len(changes)}개 항목")
+        
+        if self.whisper_handler and any(path.startswith(('whisper.', 'audio.silence_threshold')) for path in changes):
+            self.whisper_handler.apply_settings(changes)
+        
+        if self.audio_recorder and any(path.startswith('audio.') for path in changes):
+            self.audio_recorder.apply_settings(changes)
+    
     def handle_workflow_success(self, text, metadata):
         """전체 워크플로우 성공 처리"""
         try:
@@ -334,6 +490,9 @@ class SpeechToTextApp(QObject):
             # 시그널 발송
             self.workflow_completed.emit(text, metadata)
             
+            # 단계별 시간 기록 종료
+            tracer.end(workflow_id)
+            
             # 상태 초기화
             self.current_workflow_id = None
             
@@ -357,6 +516,7 @@ class SpeechToTextApp(QObject):
         
         # 상태 초기화
         self.tray_manager.set_status('idle', '오류 발생')
+        tracer.end(self.current_workflow_id, status='failed')
         self.current_workflow_id = None
         
         # 시그널 발송
@@ -391,6 +551,9 @@ class SpeechToTextApp(QObject):
     
     def handle_model_loaded(self, model_name):
         self.logger.info(f"✅ {model_name} 모델 로딩 완료")
+        if 'model_ready' not in self.startup_timings:
+            self.startup_timings['model_ready'] = time.perf_counter() - STARTUP_STARTED
+            self.logger.info(f"⏱️ 프로세스 시작 후 모델 준비까지: {self.startup_timings['model_ready']:.2f}초")
         self.tray_manager.set_status('idle', f'{model_name} 모델 준비완료')
         self.tray_manager.show_message(
             "✅ 모델 로딩 완료",
@@ -475,7 +638,7 @@ class SpeechToTextApp(QObject):
             f"<p><b>성공률:</b> {stats['success_rate']:.1f}%</p>"
             f"<hr>"
             f"<p><b>모델:</b> {self.whisper_handler.get_current_model()}</p>"
-            f"<p><b>언어:</b> {config.get('whisper.language', 'ko')}</p>"
+            f"<p><b>언어:</b> {config.snapshot.whisper.language}</p>"
             f"<p><b>자동복사:</b> {'\u2705' if self.clipboard_manager.auto_copy_enabled else '\u274c'}</p>"
         )
         msg.setTextFormat(1)  # RichText
@@ -550,10 +713,29 @@ class SpeechToTextApp(QObject):
             
             if self.audio_recorder:
                 self.audio_recorder.stop_recording()
+                self.audio_recorder.close()
             
             if self.tray_manager:
                 self.tray_manager.hide()
             
+            if self.clipboard_manager:
+                self.clipboard_manager.close()
+            
+            if self.metrics_server:
+                self.metrics_server.stop()
+            
+            if self.transcription_service:
+                self.transcription_service.stop()
+            
+            # 설정 파일 감시 중지 및 지연 중인 설정 저장 기록
+            config.stop_watching()
+            config.flush_settings()
+            
+            # 워크플로우 트레이스 내보내기
+            chrome_trace_file = config.get('tracing.chrome_trace_file', None)
+            if chrome_trace_file:
+                tracer.export_chrome_trace(chrome_trace_file)
+            
             # 통계 로깅
             stats = self.get_app_statistics()
             self.logger.info(
@@ -574,11 +756,6 @@ class SpeechToTextApp(QObject):
         try:
             self.logger.info("🚀 음성 받아쓰기 프로그램 시작")
             
-            # 시스템 상태 최종 확인
-            if not self.whisper_handler.is_model_loaded() and not self.whisper_handler.is_model_loading():
-                self.logger.warning("모델이 로드되지 않음 - 재로드 시도")
-                self.whisper_handler.force_reload_model()
-            
             # 단축키 시스템 시작
             if not self.hotkey_manager.start():
                 self.logger.error("단축키 시스템 시작 실패")
@@ -586,6 +763,10 @@ class SpeechToTextApp(QObject):
             
             self.is_running = True
             self.app_started.emit()
+            self.mark_startup_phase('hotkey_start')
+            
+            # 트레이가 표시되고 이벤트 루프가 돌기 시작하면 모델 로딩
+            QTimer.singleShot(0, self.start_background_loading)
             
             # 트레이 UI 시작
             return self.tray_manager.show()
@@ -593,6 +774,23 @@ class SpeechToTextApp(QObject):
         except Exception as e:
             self.logger.critical(f"애플리케이션 시작 실패: {e}")
             return 1
+    
+    def start_background_loading(self):
+        """이벤트 루프 시작 후 호출 - 시작 시간 기록 및 Whisper 모델 백그라운드 로딩"""
+        try:
+            self.mark_startup_phase('tray_show')
+            interactive = time.perf_counter() - STARTUP_STARTED
+            phases = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.startup_timings.items())
+            self.startup_timings['interactive'] = interactive
+            
+            log = self.logger.warning if interactive > STARTUP_TARGET_SECONDS else self.logger.info
+            log(f"⏱️ 사용 가능 상태까지 {interactive * 1000:.0f}ms ({phases})")
+            
+            if not self.whisper_handler.is_model_loaded() and not self.whisper_handler.is_model_loading():
+                self.whisper_handler.load_model_async()
+            
+        except Exception as e:
+            self.handle_system_error(f"모델 백그라운드 로딩 시작 실패: {e}")
 
 
 def main():
@@ -646,5 +844,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # 헤드리스 배치 모드: python main.py batch <파일/디렉터리...>
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from batch_transcribe import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    
     exit_code = main()
     sys.exit(exit_code)
\ No newline at end of file
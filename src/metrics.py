@@ -0,0 +1,207 @@
+"""
+Prometheus 형식 메트릭 수집 및 로컬 HTTP 엔드포인트 모듈
+"""
+
+import bisect
+import logging
+import math
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from config import config
+
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 실시간 배율(RTF) 버킷 - 처리시간 / 오디오 길이
+RTF_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 4.0)
+
+
+class Histogram:
+    """관측값 누적 히스토그램
+
+    observe()는 관측값을 바로 버킷에 반영하므로 스크랩하지 않아도 메모리가
+    늘지 않습니다. 반영은 짧은 잠금 안에서 수행해 여러 스레드에서 호출할 수
+    있습니다.
+    """
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        """관측값을 버킷에 반영 (숫자가 아니거나 NaN이면 무시)"""
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return
+        if math.isnan(value):
+            return
+
+        index = bisect.bisect_left(self.buckets, value)  # value <= bound인 첫 버킷
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            self.bucket_counts[index] += 1
+
+    def render(self, prefix):
+        with self._lock:
+            bucket_counts = list(self.bucket_counts)
+            count, total = self.count, self.sum
+
+        name = f"{prefix}{self.name}"
+        lines = [f"# HELP {name} {self.help_text}", f"# TYPE {name} histogram"]
+
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{name}_sum {total}")
+        lines.append(f"{name}_count {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리
+
+    카운터/게이지는 각 매니저의 기존 stats 딕셔너리를 스크랩 시점에 읽어오고
+    (register_source), 분포가 필요한 값만 observe()로 히스토그램에 기록합니다.
+    """
+
+    def __init__(self, prefix="speech_to_text_"):
+        self.logger = logging.getLogger(__name__)
+        self.prefix = prefix
+        self.sources = {}
+        self.histograms = {
+            'recording_seconds': Histogram('recording_seconds', "녹음 길이 (초)"),
+            'transcription_seconds': Histogram('transcription_seconds', "음성 인식 처리 시간 (초)"),
+            'real_time_factor': Histogram('real_time_factor', "처리 시간 / 오디오 길이", RTF_BUCKETS),
+            'model_load_seconds': Histogram('model_load_seconds', "Whisper 모델 로딩 시간 (초)"),
+            'clipboard_copy_seconds': Histogram('clipboard_copy_seconds', "클립보드 복사 시간 (초)")
+        }
+
+    def register_source(self, name, collect, counters=()):
+        """stats 딕셔너리를 반환하는 수집 함수 등록
+
+        counters에 포함된 키는 counter 타입으로, 나머지 숫자 값은 gauge로 노출합니다.
+        """
+        self.sources[name] = (collect, frozenset(counters))
+
+    def unregister_source(self, name):
+        self.sources.pop(name, None)
+
+    def observe(self, name, value):
+        """히스토그램 관측값 기록 (등록되지 않은 이름은 무시)"""
+        histogram = self.histograms.get(name)
+        if histogram is not None and value is not None:
+            histogram.observe(value)
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4) 생성"""
+        lines = []
+
+        for source_name, (collect, counters) in sorted(self.sources.items()):
+            try:
+                stats = dict(collect() or {})
+            except Exception as e:
+                self.logger.warning(f"메트릭 수집 실패 ({source_name}): {e}")
+                continue
+
+            for key, value in sorted(stats.items()):
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)):
+                    continue
+
+                metric_type = 'counter' if key in counters else 'gauge'
+                name = f"{self.prefix}{source_name}_{key}"
+                if metric_type == 'counter' and not name.endswith('_total'):
+                    name += '_total'
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.append(f"{name} {value}")
+
+        for histogram in self.histograms.values():
+            lines.extend(histogram.render(self.prefix))
+
+        return '\n'.join(lines) + '\n'
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """/metrics 요청 처리기"""
+
+    registry = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크랩마다 콘솔에 출력하지 않음
+        logging.getLogger(__name__).debug(format % args)
+
+
+class MetricsServer:
+    """localhost 전용 메트릭 HTTP 서버
+
+    단일 스레드 HTTPServer를 사용하므로 스크랩 요청은 한 번에 하나씩 처리됩니다.
+    """
+
+    def __init__(self, registry, host=None, port=None):
+        self.logger = logging.getLogger(__name__)
+        self.registry = registry
+        self.host = host or config.get('metrics.host', '127.0.0.1')
+        self.port = port if port is not None else config.get('metrics.port', 9464)
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        if self.httpd is not None:
+            return True
+
+        try:
+            handler = type('MetricsRequestHandler', (_MetricsRequestHandler,), {'registry': self.registry})
+            self.httpd = HTTPServer((self.host, self.port), handler)
+            self.port = self.httpd.server_address[1]
+
+            self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+            self.thread.start()
+
+            self.logger.info(f"메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+            return True
+
+        except OSError as e:
+            self.logger.error(f"메트릭 서버 시작 실패: {e}")
+            self.httpd = None
+            return False
+
+    def stop(self):
+        """서버 중지"""
+        if self.httpd is None:
+            return
+
+        try:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+        except Exception as e:
+            self.logger.warning(f"메트릭 서버 종료 중 오류: {e}")
+        finally:
+            self.httpd = None
+            self.thread = None
+
+
+# 전역 메트릭 레지스트리
+metrics = MetricsRegistry()
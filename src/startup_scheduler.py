@@ -0,0 +1,186 @@
+"""
+시작 단계 병렬 초기화 스케줄러
+
+컴포넌트 초기화를 의존 관계가 있는 작업으로 나누어 실행합니다. Qt 객체 생성처럼
+메인 스레드에서 해야 하는 작업은 등록 순서대로 메인 스레드에서 실행하고, 장치
+탐색, 히스토리 로드, 모듈 import처럼 Qt와 무관한 작업은 스레드 풀에서 동시에
+실행합니다. 실행이 끝나면 작업별 소요 시간과 전체 시작 시간을 결정한 임계
+경로(critical path)를 보고합니다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class StartupTask:
+    """스케줄러 작업 (실행 결과와 시각 기록)"""
+
+    def __init__(self, name, func, depends=(), main_thread=False, wait=True, optional=False):
+        self.name = name
+        self.func = func
+        self.depends = tuple(depends)
+        self.main_thread = main_thread
+        self.wait = wait  # False면 run()이 완료를 기다리지 않음
+        self.optional = optional  # True면 실패해도 run()이 예외를 발생시키지 않음
+        self.started = None
+        self.finished = None
+        self.thread_name = None
+        self.previous = None  # 직전에 메인 스레드에서 실행된 작업 (메인 스레드 작업만)
+        self.result = None
+        self.error = None
+
+    @property
+    def done(self):
+        return self.finished is not None
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class StartupScheduler:
+    """의존 관계 기반 초기화 작업 스케줄러"""
+
+    def __init__(self, max_workers=4):
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.tasks = {}  # 이름 -> StartupTask (등록 순서 유지)
+        self.started = None
+        self.finished = None
+        self._last_main_task = None
+
+    def add(self, name, func, depends=(), main_thread=False, wait=True, optional=False):
+        """작업 등록 - 의존 작업은 먼저 등록되어 있어야 함 (순환 의존 방지)"""
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업: {name}")
+        for dependency in depends:
+            if dependency not in self.tasks:
+                raise ValueError(f"알 수 없는 의존 작업: {dependency}")
+
+        task = StartupTask(name, func, depends, main_thread, wait, optional)
+        self.tasks[name] = task
+        return task
+
+    def run(self):
+        """모든 작업 실행 후 작업별 결과 딕셔너리 반환
+
+        wait=False 작업은 시작만 하고 완료를 기다리지 않습니다. 필수 작업이
+        실패하면 나머지 작업을 마친 뒤 첫 번째 예외를 다시 발생시킵니다.
+        """
+        self.started = time.perf_counter()
+        pending = dict(self.tasks)
+        futures = {}  # future -> 워커 작업
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='startup')
+
+        try:
+            while True:
+                ready = [task for task in pending.values()
+                         if all(self.tasks[name].done for name in task.depends)]
+
+                # 워커 작업을 먼저 제출해야 메인 스레드 작업과 겹쳐 실행됨
+                main_task = None
+                skipped = False
+                for task in ready:
+                    failed = next((name for name in task.depends if self.tasks[name].error is not None), None)
+                    if failed is not None:
+                        del pending[task.name]
+                        task.started = task.finished = time.perf_counter()
+                        task.error = RuntimeError(f"의존 작업 실패: {failed}")
+                        skipped = True
+                    elif not task.main_thread:
+                        del pending[task.name]
+                        futures[executor.submit(self._execute, task)] = task
+                    elif main_task is None:
+                        main_task = task
+
+                if main_task is not None:
+                    del pending[main_task.name]
+                    main_task.previous = self._last_main_task
+                    self._last_main_task = main_task
+                    self._execute(main_task)
+                    continue
+                if skipped:
+                    continue
+
+                running = {future for future in futures if not future.done()}
+                if pending:
+                    # 남은 작업은 실행 중인 작업(기다리지 않는 작업 포함)의 완료를 기다림
+                    if not running:
+                        break
+                    wait(running, return_when=FIRST_COMPLETED)
+                    continue
+
+                awaited = [future for future in running if futures[future].wait]
+                if not awaited:
+                    break
+                wait(awaited, return_when=FIRST_COMPLETED)
+
+        finally:
+            executor.shutdown(wait=False)  # 기다리지 않는 작업은 계속 실행
+            self.finished = time.perf_counter()
+
+        for task in self.tasks.values():
+            if task.error is not None and not task.optional and task.wait:
+                raise task.error
+
+        return {name: task.result for name, task in self.tasks.items() if task.done}
+
+    def critical_path(self):
+        """전체 시작 시간을 결정한 작업 경로 (가장 늦게 끝난 대기 작업에서 역추적)
+
+        메인 스레드 작업은 직전 메인 스레드 작업이 끝나야 시작할 수 있으므로 이를
+        의존 작업과 함께 선행 작업으로 봅니다.
+        """
+        finished = [task for task in self.tasks.values() if task.wait and task.done]
+        if not finished:
+            return []
+
+        path = [max(finished, key=lambda task: task.finished)]
+        while True:
+            predecessors = [self.tasks[name] for name in path[-1].depends]
+            if path[-1].previous is not None:
+                predecessors.append(path[-1].previous)
+            if not predecessors:
+                break
+            path.append(max(predecessors, key=lambda task: task.finished))
+        return list(reversed(path))
+
+    def report(self):
+        """작업별 소요 시간과 임계 경로 보고서 문자열"""
+        if self.started is None:
+            return "시작 작업이 실행되지 않았습니다"
+
+        total = (self.finished or time.perf_counter()) - self.started
+        serial = sum(task.duration for task in self.tasks.values() if task.wait)
+        lines = [
+            f"시작 작업 {len(self.tasks)}개: {total * 1000:.0f}ms (순차 실행 시 {serial * 1000:.0f}ms)",
+            "임계 경로: " + " → ".join(f"{task.name} {task.duration * 1000:.0f}ms" for task in self.critical_path())
+        ]
+
+        for task in self.tasks.values():
+            if not task.done:
+                status = "진행 중"
+            elif task.error is not None:
+                status = f"실패 ({task.error})"
+            else:
+                status = f"{task.duration * 1000:.0f}ms"
+            offset = f"+{(task.started - self.started) * 1000:.0f}ms" if task.started is not None else "-"
+            lines.append(f"  - {task.name}: {status} [{task.thread_name or '-'}, 시작 {offset}]")
+
+        return "\n".join(lines)
+
+    def _execute(self, task):
+        task.thread_name = threading.current_thread().name
+        task.started = time.perf_counter()
+        try:
+            task.result = task.func()
+        except Exception as e:
+            task.error = e
+            log = self.logger.warning if task.optional else self.logger.error
+            log(f"시작 작업 '{task.name}' 실패: {e}")
+        finally:
+            task.finished = time.perf_counter()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+비동기 로깅 파이프라인 테스트 스크립트
+"""
+
+import sys
+import os
+import logging
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from async_logging import AsyncLogPipeline
+
+
+class _SlowHandler(logging.Handler):
+    """느린 디스크를 흉내내는 핸들러 (기록한 메시지 보관)"""
+
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+        self.thread_names = set()
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.thread_names.add(threading.current_thread().name)
+        self.messages.append(record.getMessage())
+
+
+def _create_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+def test_non_blocking():
+    """느린 핸들러에서도 로그 호출이 기다리지 않는지 테스트"""
+    print("=== 비동기 기록 테스트 ===")
+
+    try:
+        target = _SlowHandler(delay=0.01)
+        pipeline = AsyncLogPipeline()
+        logger = _create_logger('test_async_logging.block', pipeline.start([target], rate_limit_interval=0))
+
+        started = time.perf_counter()
+        for i in range(20):
+            logger.info(f"메시지 {i}")
+        elapsed = time.perf_counter() - started
+
+        pipeline.stop()
+        if elapsed > 0.05:
+            print(f"❌ 로그 호출이 기록을 기다림: {elapsed * 1000:.1f}ms")
+            return False
+        if len(target.messages) != 20 or threading.current_thread().name in target.thread_names:
+            print(f"❌ 종료 시 남은 로그 기록 실패: {len(target.messages)}건")
+            return False
+
+        print(f"✅ 20건 호출 {elapsed * 1000:.1f}ms, 기록 스레드에서 모두 기록")
+        return True
+
+    except Exception as e:
+        print(f"❌ 비동기 기록 테스트 실패: {e}")
+        return False
+
+def test_rate_limit():
+    """호출 위치별 빈도 제한 테스트"""
+    print("\n=== 빈도 제한 테스트 ===")
+
+    try:
+        target = _SlowHandler()
+        pipeline = AsyncLogPipeline()
+        logger = _create_logger('test_async_logging.rate',
+                                pipeline.start([target], rate_limit_interval=0.2, rate_limit_burst=3))
+
+        for _ in range(100):
+            logger.warning("오디오 스트림 상태: input overflow")
+        logger.info("다른 위치 로그")
+        time.sleep(0.25)
+        logger.warning("구간 이후 로그")
+        for _ in range(10):
+            logger.warning("오디오 스트림 상태: input overflow")
+
+        pipeline.stop()
+        repeated = [m for m in target.messages if m.startswith("오디오 스트림 상태")]
+        if len(repeated) != 3 + 3 or "다른 위치 로그" not in target.messages:
+            print(f"❌ 빈도 제한 결과 오류: {len(repeated)}건")
+            return False
+        if pipeline.stats['suppressed'] != 97 + 7:
+            print(f"❌ 생략 수 오류: {pipeline.stats['suppressed']}")
+            return False
+
+        print(f"✅ 반복 로그 {len(repeated)}건만 기록, {pipeline.stats['suppressed']}건 생략")
+        return True
+
+    except Exception as e:
+        print(f"❌ 빈도 제한 테스트 실패: {e}")
+        return False
+
+def test_overflow():
+    """큐가 가득 찼을 때 버린 개수 기록 테스트"""
+    print("\n=== 큐 초과 테스트 ===")
+
+    try:
+        target = _SlowHandler(delay=0.01)
+        pipeline = AsyncLogPipeline()
+        logger = _create_logger('test_async_logging.overflow',
+                                pipeline.start([target], queue_size=5, rate_limit_interval=0))
+
+        for i in range(50):
+            logger.info(f"메시지 {i}")
+        dropped = pipeline.stats['dropped']
+        logger.info("마지막 메시지")
+        pipeline.stop()
+
+        if dropped == 0:
+            print("❌ 초과된 로그가 버려지지 않음")
+            return False
+        if not any("기록하지 못했습니다" in m for m in target.messages):
+            print("❌ 버린 로그 경고가 기록되지 않음")
+            return False
+
+        print(f"✅ 큐 초과로 {dropped}건 버림, 경고 기록")
+        return True
+
+    except Exception as e:
+        print(f"❌ 큐 초과 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("비동기 로깅 테스트 시작\n")
+
+    test_results = [
+        ("비동기 기록", test_non_blocking()),
+        ("빈도 제한", test_rate_limit()),
+        ("큐 초과", test_overflow())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -54,6 +54,7 @@ def test_recording():
         print("⏹️ 녹음 중지됨")
     
     def on_recording_finished(audio_data):
+        audio_data = np.asarray(audio_data)  # AudioBuffer -> numpy 뷰
         test_data['recording_count'] += 1
         duration = len(audio_data) / 16000  # 16kHz 가정
         print(f"✅ 녹음 완료: {len(audio_data)} 샘플, {duration:.2f}초")
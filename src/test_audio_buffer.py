@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+공유 메모리 오디오 버퍼 테스트 스크립트
+"""
+
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio_buffer import AudioBuffer
+
+def test_from_frames():
+    """프레임 병합 테스트"""
+    print("=== 프레임 병합 테스트 ===")
+
+    try:
+        frames = [np.full((1024, 1), i, dtype=np.float32) for i in range(4)]
+        buffer = AudioBuffer.from_frames(frames, 16000)
+
+        expected = np.concatenate(frames, axis=0).flatten()
+        if len(buffer) == len(expected) and np.array_equal(np.asarray(buffer), expected):
+            print(f"✅ 병합 결과 일치: {len(buffer)} 샘플")
+        else:
+            print("❌ 병합 결과 불일치")
+            return False
+
+        buffer.release()
+        print("✅ 프레임 병합 테스트 통과")
+        return True
+
+    except Exception as e:
+        print(f"❌ 프레임 병합 테스트 실패: {e}")
+        return False
+
+def test_zero_copy_trim():
+    """복사 없는 구간 축소 테스트"""
+    print("\n=== 구간 축소 테스트 ===")
+
+    try:
+        buffer = AudioBuffer.from_array(np.arange(100, dtype=np.float32), 16000)
+        base_view = buffer.array
+
+        buffer.trim(10, 60)
+        trimmed = buffer.array
+
+        if len(buffer) != 50 or trimmed[0] != 10 or trimmed[-1] != 59:
+            print(f"❌ 잘못된 구간: {trimmed[0]}..{trimmed[-1]}")
+            return False
+
+        if not np.shares_memory(base_view, trimmed):
+            print("❌ 구간 축소 시 데이터가 복사됨")
+            return False
+
+        del base_view, trimmed
+        buffer.release()
+        print("✅ 구간 축소 테스트 통과")
+        return True
+
+    except Exception as e:
+        print(f"❌ 구간 축소 테스트 실패: {e}")
+        return False
+
+def test_attach_descriptor():
+    """descriptor를 통한 공유 메모리 연결 테스트"""
+    print("\n=== 공유 메모리 연결 테스트 ===")
+
+    try:
+        buffer = AudioBuffer.from_array(np.linspace(-1, 1, 1600, dtype=np.float32), 16000)
+        if not buffer.is_shared:
+            print("⚠️ 공유 메모리를 사용할 수 없는 환경 - 생략")
+            buffer.release()
+            return True
+
+        buffer.trim(100, 1100)
+        attached = AudioBuffer.attach(buffer.descriptor())
+
+        if not np.array_equal(attached.array, buffer.array):
+            print("❌ 연결된 버퍼 내용 불일치")
+            return False
+
+        # 한쪽에서 쓰면 다른 쪽에서 보여야 함
+        buffer.array[0] = 0.5
+        if attached.array[0] != np.float32(0.5):
+            print("❌ 메모리가 공유되지 않음")
+            return False
+
+        attached.release()
+        buffer.release()
+        print("✅ 공유 메모리 연결 테스트 통과")
+        return True
+
+    except Exception as e:
+        print(f"❌ 공유 메모리 연결 테스트 실패: {e}")
+        return False
+
+def import_audio_recorder(fake_sd):
+    """실제 sounddevice(PortAudio) 없이 audio_recorder import
+
+    아직 import되지 않았으면 sounddevice 자리에 fake_sd를 넣고 import한 뒤 제거합니다
+    (patch.dict(sys.modules)는 블록 안에서 import된 numpy 등도 지우므로 쓰지 않음).
+    """
+    stubbed = 'sounddevice' not in sys.modules
+    if stubbed:
+        sys.modules['sounddevice'] = fake_sd
+    try:
+        import audio_recorder
+    finally:
+        if stubbed:
+            del sys.modules['sounddevice']
+    return audio_recorder
+
+def test_int16_capture():
+    """int16 녹음 후 전처리 단계 float32 변환 테스트"""
+    print("\n=== int16 녹음 변환 테스트 ===")
+
+    try:
+        import tempfile
+        from unittest.mock import patch, MagicMock
+        from PyQt6.QtCore import QCoreApplication
+        from config import config
+
+        fake_sd = MagicMock()
+        audio_recorder = import_audio_recorder(fake_sd)
+
+        app = QCoreApplication.instance() or QCoreApplication([])
+
+        signal = (np.sin(np.linspace(0, 200 * np.pi, 16000)) * 0.5).astype(np.float32)
+        frames = [(signal[i:i + 1024] * 32767).astype(np.int16).reshape(-1, 1) for i in range(0, len(signal), 1024)]
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch.object(audio_recorder, 'sd', fake_sd), \
+                patch.dict(config.settings, {'audio': {
+                    'dtype': 'int16',
+                    'remove_silence': False,
+                    'device_cache_file': os.path.join(temp_dir, "device_cache.json"),
+                    'hotplug_interval': 0
+                }}):
+            recorder = audio_recorder.AudioRecorder(probe_device=False)
+
+            # 레벨은 float32 녹음과 같은 범위로 환산되어야 함
+            recorder.is_recording = True
+            recorder.audio_callback(frames[0], 1024, None, None)
+            recorder.is_recording = False
+            recorder.audio_data.clear()
+            expected_level = np.sqrt(np.mean(signal[:1024] ** 2))
+            if abs(recorder.current_audio_level - expected_level) > 1e-3:
+                print(f"❌ 레벨 환산 오류: {recorder.current_audio_level:.4f} != {expected_level:.4f}")
+                return False
+            print(f"✅ int16 레벨 환산: {recorder.current_audio_level:.4f}")
+
+            buffer = AudioBuffer.from_frames(frames, 16000, recorder.dtype)
+            if buffer.array.nbytes != len(signal) * 2:
+                print(f"❌ int16 버퍼 크기 오류: {buffer.array.nbytes}")
+                return False
+
+            processed = recorder.process_buffer_for_whisper(buffer)
+            if processed is None or processed.array.dtype != np.float32 or not buffer.released:
+                print("❌ float32 변환 또는 원본 버퍼 해제 실패")
+                return False
+
+            reference = signal / np.abs(signal).max()
+            error = np.abs(processed.array - reference).max()
+            processed.release()
+            if error > 1e-3:
+                print(f"❌ 변환 결과 오차 초과: {error:.5f}")
+                return False
+
+        # int16은 설정했을 때만 사용하고 기본값은 float32 유지
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch.object(audio_recorder, 'sd', fake_sd), \
+                patch.dict(config.settings, {'audio': {
+                    'device_cache_file': os.path.join(temp_dir, "device_cache.json"),
+                    'hotplug_interval': 0
+                }}):
+            recorder = audio_recorder.AudioRecorder(probe_device=False)
+            if recorder.dtype != np.float32 or config.get('audio.dtype') != 'float32':
+                print(f"❌ 기본 녹음 형식이 float32가 아님: {np.dtype(recorder.dtype).name}")
+                return False
+        print("✅ 기본 녹음 형식 float32 유지")
+
+        print(f"✅ int16 녹음 변환 테스트 통과 (최대 오차 {error:.5f})")
+        return True
+
+    except Exception as e:
+        print(f"❌ int16 녹음 변환 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("오디오 버퍼 테스트 시작\n")
+
+    test_results = [
+        ("프레임 병합", test_from_frames()),
+        ("구간 축소", test_zero_copy_trim()),
+        ("공유 메모리 연결", test_attach_descriptor()),
+        ("int16 녹음 변환", test_int16_capture())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
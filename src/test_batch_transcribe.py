@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+배치 음성 인식 기능 테스트 스크립트
+"""
+
+import sys
+import os
+import wave
+import tempfile
+import numpy as np
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_srt_timestamp():
+    """SRT 타임스탬프 변환 테스트"""
+    print("=== SRT 타임스탬프 테스트 ===")
+
+    try:
+        from batch_transcribe import format_srt_timestamp
+
+        test_cases = [
+            (0, "00:00:00,000"),
+            (1.5, "00:00:01,500"),
+            (3725.042, "01:02:05,042")
+        ]
+
+        for seconds, expected in test_cases:
+            result = format_srt_timestamp(seconds)
+            if result != expected:
+                print(f"❌ {seconds}초: 예상 {expected}, 실제 {result}")
+                return False
+            print(f"✅ {seconds}초 -> {result}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ SRT 타임스탬프 테스트 실패: {e}")
+        return False
+
+def test_stream_chunks():
+    """WAV 스트리밍 디코딩 테스트"""
+    print("\n=== 스트리밍 디코딩 테스트 ===")
+
+    try:
+        from batch_transcribe import stream_audio_chunks
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.wav")
+            samples = (np.sin(np.arange(44100 * 5) * 0.05) * 10000).astype(np.int16)
+            with wave.open(path, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(44100)
+                wav_file.writeframes(samples.tobytes())
+
+            chunks = list(stream_audio_chunks(path, chunk_seconds=2))
+            lengths = [len(audio) for _, audio in chunks]
+            if [index for index, _ in chunks] != [0, 1, 2] or lengths[0] != 32000:
+                print(f"❌ 청크 분할 오류: {lengths}")
+                return False
+            print(f"✅ 16kHz 청크 길이: {lengths}")
+
+            # 이어서 처리 시 시작 청크부터 디코딩
+            resumed = list(stream_audio_chunks(path, chunk_seconds=2, start_chunk=2))
+            if [index for index, _ in resumed] != [2]:
+                print("❌ 시작 청크 지정 오류")
+                return False
+            print("✅ 시작 청크 지정 확인")
+
+            # soundfile이 없으면 24비트 WAV는 명확한 오류로 거부
+            path_24 = os.path.join(temp_dir, "test24.wav")
+            with wave.open(path_24, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(3)
+                wav_file.setframerate(16000)
+                wav_file.writeframes(b'\x00' * 3 * 16000)
+            with patch.dict(sys.modules, {'soundfile': None}):
+                try:
+                    list(stream_audio_chunks(path_24, chunk_seconds=2))
+                    print("❌ 24비트 WAV가 거부되지 않음")
+                    return False
+                except RuntimeError as e:
+                    if 'soundfile' not in str(e):
+                        print(f"❌ 24비트 WAV 오류 메시지 불명확: {e}")
+                        return False
+            print("✅ soundfile 없이 24비트 WAV 거부")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 스트리밍 디코딩 테스트 실패: {e}")
+        return False
+
+def test_output_paths():
+    """입력 경로별 출력 경로 충돌 방지 테스트"""
+    print("\n=== 출력 경로 테스트 ===")
+
+    try:
+        from batch_transcribe import find_audio_files, FileJob
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            roots = [os.path.join(temp_dir, name) for name in ("a", "b")]
+            for root in roots:
+                os.makedirs(os.path.join(root, "sub"))
+                for name in ("same.wav", os.path.join("sub", "only_" + os.path.basename(root) + ".wav")):
+                    with open(os.path.join(root, name), 'wb') as f:
+                        f.write(b'RIFF')
+
+            # 단일 입력은 기존 상대 경로 그대로 사용
+            single = find_audio_files([roots[0]])
+            if [relative for _, relative in single] != ["same.wav", os.path.join("sub", "only_a.wav")]:
+                print(f"❌ 단일 입력 상대 경로 변경됨: {single}")
+                return False
+            print("✅ 단일 입력 상대 경로 유지")
+
+            files = find_audio_files(roots)
+            relatives = [relative for _, relative in files]
+            output_dir = os.path.join(temp_dir, "out")
+            jobs = [FileJob(path, relative, output_dir) for path, relative in files]
+            if len(set(relatives)) != 4 or len({job.progress_path for job in jobs}) != 4:
+                print(f"❌ 출력 경로 충돌: {relatives}")
+                return False
+            if os.path.join("sub", "only_b.wav") not in relatives:
+                print(f"❌ 충돌 없는 파일 경로 변경됨: {relatives}")
+                return False
+            print(f"✅ 같은 상대 경로도 출력 분리: {sorted(relatives)}")
+
+            # 다른 파일의 진행 상태는 이어서 처리하지 않음
+            first, second = [job for job in jobs if job.path.endswith("same.wav")]
+            os.makedirs(os.path.dirname(first.progress_path), exist_ok=True)
+            first.save_progress('running', 3, 30)
+            second.progress_path = first.progress_path
+            if first.load_progress(30) is None or second.load_progress(30) is not None:
+                print("❌ 다른 파일의 진행 상태를 사용함")
+                return False
+            print("✅ 진행 상태는 같은 원본 파일에만 적용")
+
+            # 청크 길이가 바뀌면 청크 번호로 계산한 시각이 달라지므로 처음부터 처리
+            if first.load_progress(60) is not None:
+                print("❌ 청크 길이가 다른 진행 상태를 사용함")
+                return False
+            print("✅ 청크 길이가 다르면 이어서 처리하지 않음")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 출력 경로 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("배치 음성 인식 테스트 시작\n")
+
+    test_results = [
+        ("SRT 타임스탬프", test_srt_timestamp()),
+        ("스트리밍 디코딩", test_stream_chunks()),
+        ("출력 경로", test_output_paths())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -400,7 +400,16 @@ def test_statistics():
         else:
             print("❌ 성공률 계산 오류")
             return False
-        
+
+        # 증분 집계값이 히스토리 내용과 일치하는지 확인
+        history = clipboard_manager.get_history()
+        expected_chars = sum(len(item['text']) for item in history)
+        if stats['history_characters'] == expected_chars and sum(stats['source_distribution'].values()) == len(history):
+            print(f"✅ 증분 집계 일치: {expected_chars}자")
+        else:
+            print(f"❌ 증분 집계 불일치: {stats['history_characters']} != {expected_chars}")
+            return False
+
         print("✅ 통계 기능 테스트 통과")
         return True
         
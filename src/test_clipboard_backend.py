@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+클립보드 백엔드 테스트 스크립트
+"""
+
+import sys
+import os
+from PyQt6.QtWidgets import QApplication
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_backend_selection():
+    """설정에 따른 백엔드 선택 테스트"""
+    print("=== 백엔드 선택 테스트 ===")
+
+    try:
+        from clipboard_backend import create_clipboard_backend
+
+        test_cases = [
+            ('auto', 'qt'),
+            ('qt', 'qt'),
+            ('pyperclip', 'pyperclip')
+        ]
+
+        for name, expected in test_cases:
+            backend = create_clipboard_backend(name)
+            if backend.name != expected:
+                print(f"❌ {name}: 예상 {expected}, 실제 {backend.name}")
+                return False
+            print(f"✅ {name} -> {backend.name}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 백엔드 선택 테스트 실패: {e}")
+        return False
+
+def test_qt_copy_verify():
+    """Qt 백엔드 복사 및 변경 알림 확인 테스트"""
+    print("\n=== Qt 클립보드 복사/확인 테스트 ===")
+
+    try:
+        from clipboard_backend import QtClipboardBackend
+
+        backend = QtClipboardBackend()
+        text = "프로세스 안에서 복사된 텍스트"
+        backend.copy(text)
+
+        if backend.paste() != text:
+            print(f"❌ 붙여넣기 결과 불일치: {backend.paste()}")
+            return False
+        print("✅ 복사/붙여넣기 일치")
+
+        if not backend.verify(text):
+            print("❌ 변경 알림 기반 확인 실패")
+            return False
+        print("✅ 변경 알림 기반 확인 성공")
+
+        if backend.verify("다른 텍스트"):
+            print("❌ 다른 텍스트가 확인됨")
+            return False
+        print("✅ 다른 텍스트는 확인 실패")
+
+        # 변경 알림이 오지 않으면 timeout 후 다시 읽어 비교
+        import time
+        backend._changed_since_copy = False
+        start_time = time.time()
+        verified = backend.verify(text, timeout=0.05)
+        elapsed = time.time() - start_time
+        if not verified or elapsed > 0.5:
+            print(f"❌ 변경 알림 대기 제한 오류: {verified}, {elapsed:.3f}초")
+            return False
+        backend._changed_since_copy = False
+        if backend.verify("다른 텍스트", timeout=0.05):
+            print("❌ 알림 없이 다른 텍스트가 확인됨")
+            return False
+        print(f"✅ 변경 알림 없으면 {elapsed:.3f}초 후 다시 읽어 확인")
+
+        # 확인 대기 중(중첩 이벤트 루프)에 들어온 복사는 대기가 끝난 뒤 적용
+        from PyQt6.QtCore import QTimer
+        backend._changed_since_copy = False
+        nested = []
+        QTimer.singleShot(0, lambda: (backend.copy("대기 중 복사"), nested.append(backend.verify("대기 중 복사"))))
+        if not backend.verify(text, timeout=0.05) or backend.paste() != "대기 중 복사" or nested != [True]:
+            print(f"❌ 확인 대기 중 복사 처리 오류: {backend.paste()!r}, {nested}")
+            return False
+        print("✅ 확인 대기 중 복사는 대기 후 적용")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Qt 클립보드 복사/확인 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("클립보드 백엔드 테스트 시작\n")
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication([])
+
+    test_results = [
+        ("백엔드 선택", test_backend_selection()),
+        ("Qt 클립보드 복사/확인", test_qt_copy_verify())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+설정 관리 테스트 스크립트
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import Config
+
+def _create_config(temp_dir, settings=None):
+    path = os.path.join(temp_dir, "settings.json")
+    if settings is not None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(settings, f)
+    return Config(path)
+
+def test_get_defaults():
+    """설정값 조회 및 기본값 처리 테스트"""
+    print("=== 설정값 조회 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _create_config(temp_dir, {'audio': {'sample_rate': 44100}})
+
+            cases = [
+                ("저장된 값", config.get('audio.sample_rate', 16000), 44100),
+                ("기본 설정 병합", config.get('audio.channels'), 1),
+                ("없는 키 - False 기본값", config.get('audio.missing', False), False),
+                ("없는 키 - 0 기본값", config.get('audio.missing', 0), 0),
+                ("없는 키 - None 기본값", config.get('whisper.model_name.extra', None), None),
+                ("기본값 미지정", config.get('audio.missing'), None)
+            ]
+            for name, actual, expected in cases:
+                if actual != expected or type(actual) is not type(expected):
+                    print(f"❌ {name}: 예상 {expected!r}, 실제 {actual!r}")
+                    return False
+                print(f"✅ {name}: {actual!r}")
+
+            # set()이 DEFAULT_SETTINGS를 바꾸지 않아야 함
+            config.set('whisper.model_name', 'small')
+            if Config.DEFAULT_SETTINGS['whisper']['model_name'] != 'base':
+                print("❌ 설정 변경이 기본값을 변경함")
+                return False
+            print("✅ 설정 변경이 기본값에 영향 없음")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 설정값 조회 테스트 실패: {e}")
+        return False
+
+def test_snapshot():
+    """불변 설정 스냅샷 테스트"""
+    print("\n=== 설정 스냅샷 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _create_config(temp_dir, {'audio': {'silence_threshold': 0}})
+
+            snapshot = config.snapshot
+            if snapshot.audio.silence_threshold != 0.0 or not isinstance(snapshot.audio.silence_threshold, float):
+                print(f"❌ 타입 변환 실패: {snapshot.audio.silence_threshold!r}")
+                return False
+            if snapshot.hotkey.combination != ('ctrl', 'alt', 'space'):
+                print("❌ 목록 값 변환 실패")
+                return False
+            print(f"✅ 스냅샷 읽기: {snapshot.audio.silence_threshold!r}, {snapshot.hotkey.combination}")
+
+            try:
+                snapshot.audio.silence_threshold = 0.5
+                print("❌ 스냅샷이 변경됨")
+                return False
+            except AttributeError:
+                pass
+            if hasattr(snapshot.audio, '__dict__'):
+                print("❌ __slots__가 적용되지 않음")
+                return False
+            print("✅ 스냅샷 변경 불가 (__slots__)")
+
+            # set() 후 새 스냅샷으로 교체되고 기존 스냅샷은 그대로 유지
+            version = config.snapshot_version
+            config.set('audio.silence_threshold', 0.05)
+            if config.snapshot.audio.silence_threshold != 0.05 or snapshot.audio.silence_threshold != 0.0:
+                print("❌ 스냅샷 재생성 오류")
+                return False
+            if config.snapshot_version != version + 1:
+                print("❌ 스냅샷 버전 오류")
+                return False
+            print("✅ set() 후 스냅샷 재생성, 이전 스냅샷 유지")
+
+            # 다른 스레드에서 읽는 동안 설정 변경
+            errors = []
+
+            def reader():
+                for _ in range(2000):
+                    current = config.snapshot
+                    if current.whisper.beam_size not in (5, 1):
+                        errors.append(current.whisper.beam_size)
+
+            threads = [threading.Thread(target=reader) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for i in range(200):
+                config.set('whisper.beam_size', 1 if i % 2 else 5)
+            for thread in threads:
+                thread.join()
+            if errors:
+                print(f"❌ 스레드에서 잘못된 값 읽음: {errors[:3]}")
+                return False
+            print("✅ 다른 스레드에서 일관된 스냅샷 읽기")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 설정 스냅샷 테스트 실패: {e}")
+        return False
+
+def test_debounced_save():
+    """지연/원자적 설정 저장 테스트"""
+    print("\n=== 설정 저장 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _create_config(temp_dir, {})
+            config.save_delay = 0.1
+            path = config.config_file
+
+            # 연속 변경은 한 번만 기록되고, 호출 스레드는 기록을 기다리지 않음
+            started = time.perf_counter()
+            for i in range(20):
+                config.set('audio.silence_threshold', i / 100)
+                config.save_settings()
+            elapsed = time.perf_counter() - started
+            if config.save_count != 0 or not config.save_pending:
+                print("❌ 저장이 지연되지 않음")
+                return False
+
+            deadline = time.monotonic() + 2
+            while config.save_pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if config.save_count != 1 or saved['audio']['silence_threshold'] != 0.19:
+                print(f"❌ 지연 저장 결과 오류: {config.save_count}회, {saved['audio']['silence_threshold']}")
+                return False
+            print(f"✅ 변경 20회 → 저장 1회 (호출 {elapsed * 1000:.1f}ms)")
+
+            # 종료 시 예약된 저장 즉시 기록
+            config.save_delay = 60
+            config.set('whisper.model_name', 'small')
+            config.save_settings()
+            config.flush_settings()
+            with open(path, 'r', encoding='utf-8') as f:
+                if json.load(f)['whisper']['model_name'] != 'small' or config.save_pending:
+                    print("❌ 종료 시 저장 실패")
+                    return False
+            print("✅ flush_settings()로 예약된 저장 즉시 기록")
+
+            # 스냅샷에 담기지 않는 값(식별자가 아닌 키, 정수/목록 타입)도 그대로 저장
+            config.set('ui.window-geometry', [10, 20])
+            config.set('audio.silence_threshold', 0)
+            config.save_settings(immediate=True)
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved['ui'].get('window-geometry') != [10, 20] or type(saved['audio']['silence_threshold']) is not int:
+                print(f"❌ 저장 시 설정 값 손실: {saved['ui'].get('window-geometry')!r}")
+                return False
+            print("✅ 스냅샷이 아닌 원본 설정 저장")
+
+            # 기록 중 실패해도 기존 파일 유지
+            with patch('config.os.replace', side_effect=OSError("disk full")):
+                config.set('whisper.model_name', 'tiny')
+                if config.save_settings(immediate=True):
+                    print("❌ 저장 실패가 보고되지 않음")
+                    return False
+            with open(path, 'r', encoding='utf-8') as f:
+                if json.load(f)['whisper']['model_name'] != 'small' or os.path.exists(path + '.tmp'):
+                    print("❌ 저장 실패 시 기존 파일 손상 또는 임시 파일 남음")
+                    return False
+            print("✅ 저장 실패 시 기존 파일 유지")
+
+            # 저장 스레드의 실패도 save_error로 확인 가능하고, 다음 저장에 성공하면 지워짐
+            config.save_delay = 0.05
+            with patch('config.os.replace', side_effect=OSError("disk full")):
+                config.save_settings()
+                deadline = time.monotonic() + 2
+                while config.save_pending and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                time.sleep(0.05)
+            if config.save_error != "disk full":
+                print(f"❌ 지연 저장 실패가 기록되지 않음: {config.save_error!r}")
+                return False
+            if not config.save_settings(immediate=True) or config.save_error is not None:
+                print("❌ 저장 성공 후 오류 상태가 남음")
+                return False
+            print("✅ 지연 저장 실패를 save_error로 보고")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 설정 저장 테스트 실패: {e}")
+        return False
+
+def test_live_reload():
+    """설정 파일 변경 감지 및 변경 알림 테스트"""
+    print("\n=== 설정 재로드 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _create_config(temp_dir, {})
+            config.save_delay = 0
+            path = config.config_file
+            received = {'all': [], 'whisper': []}
+            config.subscribe(received['all'].append)
+            config.subscribe(received['whisper'].append, prefixes=['whisper'])
+
+            # 앱에서 저장한 변경은 다시 읽지 않음
+            config.set('audio.silence_threshold', 0.02)
+            config.save_settings()
+            if config.check_for_changes() or received['all']:
+                print("❌ 직접 저장한 파일을 외부 변경으로 인식")
+                return False
+            print("✅ 직접 저장한 변경은 무시")
+
+            # 아직 저장하지 않은 값은 외부 변경으로 되돌리지 않음
+            config.set('audio.device_index', 3)
+
+            # 외부 편집기에서 값 변경
+            with open(path, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+            settings['audio']['silence_threshold'] = 0.05
+            settings['whisper']['beam_size'] = 1
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f)
+
+            changes = config.check_for_changes()
+            expected = {'audio.silence_threshold': (0.02, 0.05), 'whisper.beam_size': (5, 1)}
+            if changes != expected or config.snapshot.audio.silence_threshold != 0.05:
+                print(f"❌ 변경 내용 오류: {changes}")
+                return False
+            if received['all'] != [expected] or received['whisper'] != [{'whisper.beam_size': (5, 1)}]:
+                print(f"❌ 구독자 알림 오류: {received}")
+                return False
+            print(f"✅ 변경 감지 및 경로별 알림: {sorted(changes)}")
+            if config.get('audio.device_index') != 3:
+                print("❌ 저장하지 않은 설정값이 재로드로 되돌아감")
+                return False
+            print("✅ 저장하지 않은 설정값 유지")
+
+            # 편집 중 깨진 파일은 무시하고 기존 설정 유지
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('{"audio": ')
+            if config.check_for_changes() or config.get('audio.silence_threshold') != 0.05:
+                print("❌ 깨진 설정 파일 처리 오류")
+                return False
+            print("✅ 깨진 설정 파일은 무시")
+
+            # 감시 스레드가 변경을 감지
+            settings['whisper']['model_name'] = 'small'
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f)
+            config.start_watching(0.02)
+            deadline = time.monotonic() + 2
+            while config.get('whisper.model_name') != 'small' and time.monotonic() < deadline:
+                time.sleep(0.01)
+            config.stop_watching()
+            if config.get('whisper.model_name') != 'small':
+                print("❌ 감시 스레드가 변경을 감지하지 못함")
+                return False
+            print("✅ 감시 스레드에서 변경 적용")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 설정 재로드 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("설정 관리 테스트 시작\n")
+
+    test_results = [
+        ("설정값 조회", test_get_defaults()),
+        ("설정 스냅샷", test_snapshot()),
+        ("설정 저장", test_debounced_save()),
+        ("설정 재로드", test_live_reload())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+오디오 장치 호환성 캐시 및 핫플러그 감시 테스트 스크립트
+"""
+
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_capability_cache():
+    """검사 결과 캐시 및 파일 저장 테스트"""
+    print("=== 장치 캐시 테스트 ===")
+
+    try:
+        from device_cache import DeviceCapabilityCache
+
+        probes = []
+
+        def probe(result):
+            def run():
+                probes.append(result)
+                return result
+            return run
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "config", "device_cache.json")
+            cache = DeviceCapabilityCache(path)
+            cache.lookup("ALSA|Mic A", "compatible", probe(True))
+            cache.lookup("ALSA|Mic A", "compatible", probe(False))
+            cache.lookup("ALSA|Mic B", "1ch/16000Hz/float32", probe("Invalid sample rate"))
+            if probes != [True, "Invalid sample rate"] or not cache.save():
+                print(f"❌ 캐시 조회/저장 오류: {probes}")
+                return False
+            print("✅ 같은 장치/검사는 한 번만 실행")
+
+            # 다음 실행에서는 성공 결과만 검사 없이 재사용
+            reloaded = DeviceCapabilityCache(path)
+            result = reloaded.lookup("ALSA|Mic A", "compatible", probe(False))
+            if result is not True or len(probes) != 2 or reloaded.hits != 1:
+                print(f"❌ 저장된 결과 재사용 실패: {result}")
+                return False
+            print("✅ 파일에서 성공한 검사 결과 재사용")
+
+            # 실패 결과(장치 사용 중 등)는 저장하지 않고 잠시만 재사용
+            result = reloaded.lookup("ALSA|Mic B", "1ch/16000Hz/float32", probe("Device busy"))
+            again = reloaded.lookup("ALSA|Mic B", "1ch/16000Hz/float32", probe(True))
+            if result != "Device busy" or again != "Device busy" or probes[2:] != ["Device busy"]:
+                print(f"❌ 실패 결과 처리 오류: {probes}")
+                return False
+            reloaded.failures = {key: (value, 0) for key, (value, _) in reloaded.failures.items()}  # 만료
+            if reloaded.lookup("ALSA|Mic B", "1ch/16000Hz/float32", probe(True)) is not True:
+                print("❌ 만료된 실패 결과로 다시 검사하지 않음")
+                return False
+            print("✅ 실패 결과는 파일에 저장하지 않고 만료 후 다시 검사")
+            reloaded.save()
+            reloaded = DeviceCapabilityCache(path)
+
+            if reloaded.save():
+                print("❌ 변경 없이 다시 저장됨")
+                return False
+
+            removed = reloaded.retain(["ALSA|Mic A"])
+            reloaded.invalidate("ALSA|Mic A")
+            reloaded.save()
+            if removed != 1 or DeviceCapabilityCache(path).devices:
+                print("❌ 연결 해제 장치 정리 실패")
+                return False
+            print("✅ 연결되지 않은 장치와 무효화된 장치 제거")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 장치 캐시 테스트 실패: {e}")
+        return False
+
+def test_hotplug_watcher():
+    """장치 구성 변경 감지 테스트"""
+    print("\n=== 핫플러그 감시 테스트 ===")
+
+    try:
+        from device_cache import DeviceHotplugWatcher
+
+        state = {'signature': "card0", 'busy': False, 'calls': 0}
+
+        def on_change():
+            state['calls'] += 1
+            return not state['busy']
+
+        watcher = DeviceHotplugWatcher(on_change, interval=60, signature=lambda: state['signature'])
+        watcher.last_signature = state['signature']
+
+        if watcher.poll():
+            print("❌ 변경 없이 콜백 호출")
+            return False
+
+        state['signature'] = "card0\ncard1"
+        state['busy'] = True
+        if watcher.poll() or state['calls'] != 1:
+            print("❌ 처리하지 못한 변경이 완료로 기록됨")
+            return False
+        print("✅ 녹음 중 등 처리할 수 없으면 다음 주기에 재시도")
+
+        state['busy'] = False
+        if not watcher.poll() or watcher.poll() or watcher.changes != 1:
+            print("❌ 변경 처리 결과 오류")
+            return False
+        print("✅ 장치 변경 1회 감지 후 같은 구성에서는 재호출 없음")
+
+        unsupported = DeviceHotplugWatcher(on_change, signature=lambda: None)
+        if unsupported.start():
+            print("❌ 서명을 읽을 수 없는 환경에서 감시 시작")
+            return False
+        print("✅ 지원하지 않는 환경에서는 감시 비활성")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 핫플러그 감시 테스트 실패: {e}")
+        return False
+
+def import_audio_recorder(fake_sd):
+    """실제 sounddevice(PortAudio) 없이 audio_recorder import
+
+    아직 import되지 않았으면 sounddevice 자리에 fake_sd를 넣고 import한 뒤 제거합니다
+    (patch.dict(sys.modules)는 블록 안에서 import된 numpy 등도 지우므로 쓰지 않음).
+    """
+    stubbed = 'sounddevice' not in sys.modules
+    if stubbed:
+        sys.modules['sounddevice'] = fake_sd
+    try:
+        import audio_recorder
+    finally:
+        if stubbed:
+            del sys.modules['sounddevice']
+    return audio_recorder
+
+def create_fake_sounddevice(devices, broken):
+    """장치 목록을 바꿀 수 있는 sounddevice 대체 객체"""
+    from unittest.mock import MagicMock
+
+    fake = MagicMock()
+    fake.default.device = [0, None]
+    fake.query_hostapis.return_value = {'name': 'ALSA'}
+    fake.query_devices.side_effect = lambda device=None, kind=None: (
+        [dict(d, index=i) for i, d in enumerate(devices)] if device is None and kind is None
+        else dict(devices[0 if kind == 'input' else device], index=0 if kind == 'input' else device)
+    )
+
+    def open_stream(device=None, **kwargs):
+        if devices[device]['name'] in broken:
+            raise RuntimeError("Device unavailable")
+        return MagicMock()
+
+    fake.InputStream.side_effect = open_stream
+    return fake
+
+def test_device_failover():
+    """선호 장치 식별자 재탐색 및 대체 장치 전환 테스트"""
+    print("\n=== 장치 대체 전환 테스트 ===")
+
+    try:
+        from unittest.mock import patch
+        from PyQt6.QtCore import QCoreApplication
+        from config import config
+
+        app = QCoreApplication.instance() or QCoreApplication([])
+
+        mic = lambda name, rate=48000.0: {'name': name, 'hostapi': 0, 'max_input_channels': 1,
+                                          'default_samplerate': rate}
+        devices = [mic("Built-in"), mic("USB Headset", 44100.0)]
+        broken = set()
+        fake_sd = create_fake_sounddevice(devices, broken)
+
+        audio_recorder = import_audio_recorder(fake_sd)
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch.object(audio_recorder, 'sd', fake_sd), \
+                patch.object(config, 'save_settings'), \
+                patch.dict(config.settings, {'audio': {
+                    'device_cache_file': os.path.join(temp_dir, "device_cache.json"),
+                    'hotplug_interval': 0
+                }}):
+            recorder = audio_recorder.AudioRecorder()
+            if not recorder.set_device(1) or recorder.fallback_device[3] != "Built-in":
+                print("❌ 선호 장치 지정 또는 대체 장치 검증 실패")
+                return False
+            print(f"✅ 선호 장치 {recorder.active_device_id}, 대체 장치 미리 검증")
+
+            # 장치가 다시 연결되며 번호가 바뀌어도 식별자로 찾음
+            devices.insert(0, mic("HDMI"))
+            recorder.resolve_device()
+            if recorder.device_index != 2 or recorder.active_device_id != "ALSA|USB Headset":
+                print(f"❌ 식별자 기반 재탐색 실패: {recorder.device_index}")
+                return False
+            print("✅ 장치 번호가 바뀌어도 식별자로 선호 장치 재탐색")
+
+            # 장치가 사라졌는데 아직 감시 주기가 오지 않은 경우 검사 없이 대체 장치로 전환
+            broken.add("USB Headset")
+            fallback_id = recorder.fallback_device[2]
+            fake_sd.check_input_settings.reset_mock()
+            with patch.object(audio_recorder.threading, 'Thread'):
+                started = recorder.start_recording()
+            if not started or recorder.active_device_id != fallback_id or fake_sd.check_input_settings.called:
+                print("❌ 대체 장치 전환 실패")
+                return False
+            print("✅ 녹음 시작 시 장치 검사 없이 대체 장치로 전환")
+
+            # 녹음 중 장치 재설정은 열린 스트림의 장치/샘플레이트를 바꾸지 않고 다음 녹음에 적용
+            broken.discard("USB Headset")
+            stream_rate = recorder.stream_sample_rate
+            if recorder._on_devices_changed() or fake_sd._terminate.called:
+                print("❌ 녹음 중 PortAudio 재초기화")
+                return False
+            recorder.resolve_device()
+            if (recorder.active_device_id != fallback_id or recorder.stream_sample_rate != stream_rate
+                    or recorder.pending_device[2] != "ALSA|USB Headset"):
+                print(f"❌ 녹음 중 사용 장치 변경: {recorder.active_device_id}, {recorder.pending_device}")
+                return False
+            pending_rate = recorder.pending_device[1]
+            recorder.cleanup_recording()
+            recorder.is_recording = False
+            if not recorder.start_recording() or recorder.active_device_id != "ALSA|USB Headset" \
+                    or recorder.stream_sample_rate != pending_rate:
+                print("❌ 다음 녹음에서 재설정된 장치 미적용")
+                return False
+            print("✅ 녹음 중 재설정은 다음 녹음 시작 시 적용")
+
+            # 녹음을 멈췄지만 스트림을 아직 닫지 않은 동안에도 재초기화하지 않음
+            recorder.is_recording = False
+            if recorder._on_devices_changed() or fake_sd._terminate.called:
+                print("❌ 스트림이 열린 상태에서 PortAudio 재초기화")
+                return False
+            recorder.cleanup_recording()
+            if not recorder._on_devices_changed() or not fake_sd._terminate.called:
+                print("❌ 스트림을 닫은 뒤 장치 변경 처리 안 됨")
+                return False
+            print("✅ 열린 스트림이 없을 때만 PortAudio 재초기화")
+
+            # /proc/asound가 없는 플랫폼은 재초기화한 PortAudio 장치 목록으로 변경 감지
+            signature = recorder._portaudio_device_signature()
+            fake_sd._terminate.reset_mock()
+            if recorder._portaudio_device_signature() != signature or not fake_sd._terminate.called:
+                print("❌ 장치 목록 서명 오류")
+                return False
+            devices.append(mic("Webcam"))
+            recorder.is_recording = True
+            fake_sd._terminate.reset_mock()
+            if recorder._portaudio_device_signature() != signature or fake_sd._terminate.called:
+                print("❌ 녹음 중 장치 목록 서명을 위해 재초기화")
+                return False
+            recorder.is_recording = False
+            if recorder._portaudio_device_signature() == signature:
+                print("❌ 장치 목록 변경 미감지")
+                return False
+            print("✅ PortAudio 장치 목록 서명으로 변경 감지 (녹음 중 제외)")
+
+            # 설정 파일에서 장치를 null(시스템 기본)로 되돌리면 적용, 삭제된 키는 무시
+            run_now = lambda target, daemon=None: SimpleNamespace(start=target)
+            threshold = recorder.silence_threshold
+            config.settings['audio']['device_index'] = None
+            with patch.object(audio_recorder.threading, 'Thread', run_now):
+                recorder.apply_settings({'audio.device_index': (2, None), 'audio.silence_threshold': (0.5, None)})
+            if recorder.preferred_device_id is not None or recorder.active_device_id == "ALSA|USB Headset" \
+                    or config.get('audio.device_id') is not None:
+                print(f"❌ null 장치 설정 미적용: {recorder.active_device_id}")
+                return False
+            if recorder.silence_threshold != threshold:
+                print("❌ 삭제된 설정 키가 적용됨")
+                return False
+            print(f"✅ 장치 설정 null 적용 (시스템 기본 {recorder.active_device_id}), 삭제된 키 무시")
+            recorder.close()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 장치 대체 전환 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("장치 캐시 테스트 시작\n")
+
+    test_results = [
+        ("장치 캐시", test_capability_cache()),
+        ("핫플러그 감시", test_hotplug_watcher()),
+        ("장치 대체 전환", test_device_failover())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+구조화 이벤트 로그 및 분석기 테스트 스크립트
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from event_log import EventLog, read_events
+import analyze_events
+
+def test_emit_and_read():
+    """이벤트 기록 및 읽기 테스트"""
+    print("=== 이벤트 기록 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "events.jsonl")
+            log = EventLog(path, enabled=True)
+
+            log.emit('recording_started', device="ALSA|Mic", sample_rate=16000, channels=1, dtype='int16')
+            log.emit('clipboard_copy', 'wf-1', length=12, copy_seconds=0.002, success=True)
+            if not log.flush():
+                print("❌ 대기 중인 이벤트 기록 시간 초과")
+                return False
+
+            events = list(read_events([path]))
+            if [event['event'] for event in events] != ['recording_started', 'clipboard_copy']:
+                print(f"❌ 기록된 이벤트 불일치: {events}")
+                return False
+            if events[1]['workflow_id'] != 'wf-1' or 'verify_seconds' not in events[1]:
+                print("❌ 공통 필드 또는 누락 필드 기록 오류")
+                return False
+            print(f"✅ 이벤트 {len(events)}개 기록, 누락 필드는 None으로 기록")
+
+            try:
+                log.emit('unknown_event')
+                print("❌ 알 수 없는 이벤트가 허용됨")
+                return False
+            except ValueError:
+                print("✅ 알 수 없는 이벤트 종류 거부")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 이벤트 기록 테스트 실패: {e}")
+        return False
+
+def test_analyzer():
+    """모델별 백분위수 및 RTF 분포 분석 테스트"""
+    print("\n=== 이벤트 분석 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "events.jsonl")
+            with open(path, 'w', encoding='utf-8') as f:
+                for i in range(1, 101):
+                    f.write(json.dumps({'event': 'transcription', 'ts': i, 'model': 'base', 'success': True,
+                                        'audio_seconds': 10.0, 'processing_seconds': i / 10,
+                                        'rtf': i / 100}) + '\n')
+                f.write(json.dumps({'event': 'transcription', 'ts': 1, 'model': 'small', 'success': False,
+                                    'audio_seconds': 5.0, 'processing_seconds': None, 'rtf': None}) + '\n')
+                f.write("깨진 줄\n")
+                f.write(json.dumps({'event': 'audio_preprocessed', 'ts': 1, 'seconds': 0.004}) + '\n')
+
+            report = analyze_events.analyze(read_events([path]))
+            base = report['models']['base']
+            if base['transcriptions'] != 100 or abs(base['latency_seconds']['p50'] - 5.05) > 1e-9:
+                print(f"❌ 백분위수 계산 오류: {base['latency_seconds']}")
+                return False
+            if abs(base['rtf']['p99'] - 0.9901) > 1e-9 or base['rtf_histogram']['≤0.05'] != 5:
+                print(f"❌ RTF 분포 계산 오류: {base['rtf']}")
+                return False
+            if report['models']['small']['success_rate'] != 0 or report['stages']['preprocess_seconds']['count'] != 1:
+                print("❌ 실패 모델 또는 단계별 집계 오류")
+                return False
+            print(f"✅ base p50 {base['latency_seconds']['p50']:.2f}s, RTF p99 {base['rtf']['p99']:.4f}")
+
+            filtered = analyze_events.analyze(read_events([path]), model='small')
+            if list(filtered['models']) != ['small']:
+                print("❌ 모델 필터 오류")
+                return False
+
+            text = analyze_events.format_report(report)
+            if "[모델 base]" not in text or analyze_events.main([path, '--json']) != 0:
+                print("❌ 보고서 출력 오류")
+                return False
+            print("✅ 텍스트/JSON 보고서 출력")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 이벤트 분석 테스트 실패: {e}")
+        return False
+
+def test_lazy_config():
+    """import 시 설정 파일을 읽지 않는지 테스트"""
+    print("\n=== 설정 지연 로드 테스트 ===")
+
+    try:
+        import subprocess
+
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        code = ("import config, tracing, metrics, event_log; "
+                "print(config.config._instance is None); "
+                "event_log.event_log.enabled; "
+                "print(config.config._instance is not None)")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src_dir, os.environ.get('PYTHONPATH')])))
+            result = subprocess.run([sys.executable, '-c', code], cwd=temp_dir, env=env,
+                                    capture_output=True, text=True, timeout=60)
+            if result.stdout.split() != ['True', 'True']:
+                print(f"❌ import 시 설정 로드: {result.stdout.strip()} {result.stderr.strip()[-200:]}")
+                return False
+            print("✅ import 시 설정을 읽지 않고 처음 사용할 때 로드")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 설정 지연 로드 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("이벤트 로그 테스트 시작\n")
+
+    test_results = [
+        ("이벤트 기록", test_emit_and_read()),
+        ("이벤트 분석", test_analyzer()),
+        ("설정 지연 로드", test_lazy_config())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
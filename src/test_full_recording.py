@@ -41,6 +41,7 @@ def test_full_audio_system():
         print("⏹️ 녹음 중지 신호 수신")
     
     def on_recording_finished(audio_data):
+        audio_data = np.asarray(audio_data)  # AudioBuffer -> numpy 뷰
         test_state['recordings_completed'] += 1
         duration = len(audio_data) / 16000  # 16kHz 가정
         max_amplitude = np.max(np.abs(audio_data)) if len(audio_data) > 0 else 0
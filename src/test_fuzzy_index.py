@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+히스토리 유사도 검색 인덱스 테스트 스크립트
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_jamo_matching():
+    """한글 자모 분해 기반 오타 허용 검색 테스트"""
+    print("=== 자모 단위 유사도 검색 테스트 ===")
+
+    try:
+        from fuzzy_index import FuzzyIndex, normalize_text
+
+        if normalize_text("Café,  회의!") != normalize_text("cafe 회의"):
+            print("❌ 정규화 결과 불일치")
+            return False
+        print("✅ 대소문자/발음 기호/문장 부호 정규화")
+
+        index = FuzzyIndex()
+        index.add(1, "서버 설정이 완료됐습니다", "설정")
+        index.add(2, "점심 메뉴 추천 부탁드립니다", "점심")
+        index.add(3, "내일 회의 일정 확인", "회의")
+
+        results = index.search("서버 설정 완료됬습니다")
+        if not results or results[0][0] != "설정":
+            print(f"❌ 받침 오타 검색 실패: {results}")
+            return False
+        print(f"✅ '됬/됐' 차이를 허용한 검색: {results[0]}")
+
+        if index.search("전혀 관계없는 문장"):
+            print("❌ 관련 없는 검색어에 결과 반환")
+            return False
+        print("✅ 최소 점수 미만 문서 제외")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 자모 단위 유사도 검색 테스트 실패: {e}")
+        return False
+
+def test_ranking_and_remove():
+    """순위 및 증분 삭제 테스트"""
+    print("\n=== 순위/삭제 테스트 ===")
+
+    try:
+        from fuzzy_index import FuzzyIndex
+
+        index = FuzzyIndex()
+        index.add_many([
+            ("a", "회의록 정리", "a"),
+            ("b", "회의록 정리 후 공유 요청 드립니다", "b"),
+            ("c", "회의 정리", "c"),
+        ])
+
+        values = [value for value, _ in index.search("회의록 정리")]
+        if values[:2] != ["a", "b"]:
+            print(f"❌ 순위 오류: {values}")
+            return False
+        print(f"✅ 겹침 비율과 길이로 순위 결정: {values}")
+
+        index.remove("a")
+        index.add("d", "회의록 정리", "d")
+        values = [value for value, _ in index.search("회의록 정리")]
+        if "a" in values or values[0] != "d" or len(index) != 3:
+            print(f"❌ 삭제/교체 후 검색 오류: {values}")
+            return False
+        print("✅ 삭제한 문서 제외, 새 문서 반영")
+
+        # 삭제를 반복해 문서 번호가 재배정되어도 결과 유지
+        for i in range(3000):
+            index.add(f"tmp{i}", f"임시 항목 {i}")
+            index.remove(f"tmp{i}")
+        values = [value for value, _ in index.search("회의록 정리")]
+        if values[0] != "d" or index._next_id > 2000:
+            print(f"❌ 문서 번호 재배정 후 오류: {values}")
+            return False
+        print("✅ 문서 번호 재배정 후 검색 결과 유지")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 순위/삭제 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("유사도 검색 인덱스 테스트 시작\n")
+
+    test_results = [
+        ("자모 단위 유사도 검색", test_jamo_matching()),
+        ("순위/삭제", test_ranking_and_remove())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
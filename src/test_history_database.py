@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+SQLite 히스토리 저장소 테스트 스크립트
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def create_items(count):
+    """하루 간격의 테스트 항목 생성 (오래된 항목부터)"""
+    start = datetime(2024, 1, 1)
+    items = []
+    for i in range(count):
+        items.append({
+            'text': f"회의록 {i}번째 메모 keyword{i % 10}",
+            'timestamp': (start + timedelta(days=i)).isoformat(),
+            'hash': f"hash{i}",
+            'language': 'ko' if i % 2 == 0 else 'en',
+            'confidence': (i % 10) / 10
+        })
+    return items
+
+def test_paged_query():
+    """페이지 조회 및 필터 테스트"""
+    print("=== 페이지 조회/필터 테스트 ===")
+
+    try:
+        from history_database import HistoryDatabase
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = HistoryDatabase(os.path.join(temp_dir, "history.db"))
+            store.append_many(create_items(100))
+
+            page = store.query(limit=10, offset=10)
+            if len(page) != 10 or page[0]['hash'] != "hash89":
+                print(f"❌ 페이지 조회 오류: {[item['hash'] for item in page]}")
+                return False
+            print("✅ 두 번째 페이지 조회 (최신순)")
+
+            count = store.count(language='ko', min_confidence=0.5, since=datetime(2024, 2, 1))
+            expected = sum(1 for item in create_items(100)
+                           if item['language'] == 'ko' and item['confidence'] >= 0.5
+                           and item['timestamp'] >= datetime(2024, 2, 1).isoformat())
+            if count != expected:
+                print(f"❌ 필터 개수 오류: 예상 {expected}, 실제 {count}")
+                return False
+            print(f"✅ 날짜/언어/신뢰도 필터: {count}개")
+
+            # 같은 항목을 다시 추가해도 중복되지 않음
+            store.append_many(create_items(5))
+            if store.count() != 100:
+                print(f"❌ 중복 항목 추가됨: {store.count()}")
+                return False
+            print("✅ 중복 항목 무시")
+
+            store.close()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 페이지 조회/필터 테스트 실패: {e}")
+        return False
+
+def test_search():
+    """부분 문자열/접두어 검색 테스트"""
+    print("\n=== 전문 검색 테스트 ===")
+
+    try:
+        from history_database import HistoryDatabase
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = HistoryDatabase(os.path.join(temp_dir, "history.db"))
+            store.append_many(create_items(100))
+            print(f"FTS5 사용: {store.fts_enabled}")
+
+            test_cases = [
+                ("keyword3", {}, 10),  # trigram 인덱스
+                ("번째", {}, 100),  # 3자 미만 - LIKE 검색
+                ("KEYWORD3", {}, 10),  # 대소문자 무시
+                ("메모", {'prefix': True}, 100),  # 단어 접두어
+                ("모", {'prefix': True}, 0),
+                ("keyword1", {'language': 'en'}, 10)
+            ]
+
+            for keyword, options, expected in test_cases:
+                results = store.search(keyword, **options)
+                if len(results) != expected:
+                    print(f"❌ '{keyword}' {options}: 예상 {expected}개, 실제 {len(results)}개")
+                    return False
+                print(f"✅ '{keyword}' {options}: {len(results)}개")
+
+            store.close()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 전문 검색 테스트 실패: {e}")
+        return False
+
+def test_manager_keeps_archive():
+    """메모리 창보다 많은 항목이 save_history() 후에도 보관되는지 테스트"""
+    print("\n=== 히스토리 보관 테스트 ===")
+
+    try:
+        from unittest.mock import patch
+        from config import config
+        from clipboard_manager import ClipboardManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            clipboard_settings = dict(config.get('clipboard', {}), history_backend='sqlite',
+                                      history_db=os.path.join(temp_dir, "history.db"))
+            with patch.dict(config.settings, {'clipboard': clipboard_settings}):
+                manager = ClipboardManager(os.path.join(temp_dir, "history.json"), max_history=5)
+            for i in range(12):
+                manager.add_to_history(f"보관 테스트 {i}")
+
+            manager.save_history()
+            if manager.store.count() != 12 or len(manager.history) != 5:
+                print(f"❌ save_history() 후 DB 항목 {manager.store.count()}개 (예상 12개)")
+                return False
+            print(f"✅ save_history() 후 DB {manager.store.count()}개 유지 (메모리 {len(manager.history)}개)")
+
+            manager.clear_history()
+            if manager.store.count() != 0:
+                print("❌ clear_history() 후 DB 항목 남음")
+                return False
+            print("✅ clear_history()로 DB 비움")
+            manager.store.close()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 히스토리 보관 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("SQLite 히스토리 저장소 테스트 시작\n")
+
+    test_results = [
+        ("페이지 조회/필터", test_paged_query()),
+        ("전문 검색", test_search()),
+        ("히스토리 보관", test_manager_keeps_archive())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+히스토리 가져오기/내보내기 입출력 테스트 스크립트
+"""
+
+import sys
+import os
+import io
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def create_items(count):
+    return [{'text': f"항목 {i}", 'timestamp': f"2024-01-01T00:{i:02d}:00", 'confidence': 0.5} for i in range(count)]
+
+def test_streaming_json():
+    """JSON 배열 스트리밍 파싱 테스트"""
+    print("=== JSON 배열 스트리밍 테스트 ===")
+
+    try:
+        import history_io
+        from history_io import iter_history_items
+
+        items = create_items(20) + [{'missing': 'text'}, 42]
+        data = json.dumps(items, ensure_ascii=False, indent=2)
+
+        # 원소가 청크 경계에 걸리도록 아주 작은 청크로 읽기
+        original_chunk_size = history_io.CHUNK_SIZE
+        history_io.CHUNK_SIZE = 7
+        try:
+            parsed = list(iter_history_items(io.StringIO(data), "json"))
+        finally:
+            history_io.CHUNK_SIZE = original_chunk_size
+
+        if parsed != create_items(20):
+            print(f"❌ 파싱 결과 불일치: {len(parsed)}개")
+            return False
+        print(f"✅ 청크 경계와 무관하게 {len(parsed)}개 항목 파싱 (잘못된 항목 제외)")
+
+        try:
+            list(iter_history_items(io.StringIO('[{"text": "a"'), "json"))
+            print("❌ 잘린 JSON이 오류 없이 처리됨")
+            return False
+        except ValueError:
+            print("✅ 잘린 JSON 오류 감지")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ JSON 배열 스트리밍 테스트 실패: {e}")
+        return False
+
+def test_jsonl_csv():
+    """JSONL/CSV 파싱 테스트"""
+    print("\n=== JSONL/CSV 파싱 테스트 ===")
+
+    try:
+        from history_io import iter_history_items, detect_format
+
+        jsonl = "\n".join(json.dumps(item, ensure_ascii=False) for item in create_items(3)) + "\n\n"
+        if list(iter_history_items(io.StringIO(jsonl), "jsonl")) != create_items(3):
+            print("❌ JSONL 파싱 결과 불일치")
+            return False
+        print("✅ JSONL 파싱")
+
+        csv_data = "timestamp,text,length,source,confidence\n2024-01-01T00:00:00,\"안녕, 세계\",6,test,0.9\n"
+        rows = list(iter_history_items(io.StringIO(csv_data), "csv"))
+        if rows != [{'timestamp': "2024-01-01T00:00:00", 'text': "안녕, 세계", 'length': 6,
+                     'source': "test", 'confidence': 0.9}]:
+            print(f"❌ CSV 파싱 결과 불일치: {rows}")
+            return False
+        print("✅ CSV 파싱 및 타입 변환")
+
+        for path, expected in (("a.jsonl.gz", "jsonl"), ("b.CSV", "csv"), ("c.txt.zst", "txt"), ("d.dat", "json")):
+            if detect_format(path) != expected:
+                print(f"❌ 형식 추정 오류: {path}")
+                return False
+        print("✅ 확장자로 형식 추정")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ JSONL/CSV 파싱 테스트 실패: {e}")
+        return False
+
+def test_streaming_export():
+    """배치 단위 내보내기 및 압축 왕복 테스트"""
+    print("\n=== 스트리밍 내보내기 테스트 ===")
+
+    try:
+        import gzip
+        import history_io
+        from history_io import write_history_items, iter_history_items, wrap_stream
+
+        class CountingStream(io.StringIO):
+            writes = 0
+
+            def write(self, data):
+                CountingStream.writes += 1
+                return super().write(data)
+
+        items = create_items(50)
+        original_batch_size = history_io.WRITE_BATCH_SIZE
+        history_io.WRITE_BATCH_SIZE = 10
+        try:
+            for format in ("json", "jsonl", "csv"):
+                CountingStream.writes = 0
+                output = CountingStream()
+                count = write_history_items(iter(items), output, format)
+                parsed = list(iter_history_items(io.StringIO(output.getvalue()), format))
+                if count != 50 or [item['text'] for item in parsed] != [item['text'] for item in items]:
+                    print(f"❌ {format} 왕복 결과 불일치")
+                    return False
+                print(f"✅ {format}: {count}개 항목, {CountingStream.writes}번 쓰기")
+        finally:
+            history_io.WRITE_BATCH_SIZE = original_batch_size
+
+        # 바이너리 파일 객체에 gzip 압축으로 쓰기
+        binary = io.BytesIO()
+        with wrap_stream(binary, 'w', 'gzip') as stream:
+            write_history_items(items, stream, "jsonl")
+        lines = gzip.decompress(binary.getvalue()).decode('utf-8').splitlines()
+        if len(lines) != 50 or binary.closed:
+            print("❌ gzip 스트림 내보내기 오류")
+            return False
+        print("✅ gzip 파일 객체 내보내기 (원본 파일 객체는 열린 상태 유지)")
+
+        if write_history_items([], io.StringIO(), "txt") != 0:
+            print("❌ 빈 히스토리 내보내기 오류")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 스트리밍 내보내기 테스트 실패: {e}")
+        return False
+
+def test_import_dedup_and_bad_rows():
+    """저장소 기준 중복 제거 및 잘못된 항목 건너뛰기 테스트"""
+    print("\n=== 가져오기 중복/오류 항목 테스트 ===")
+
+    try:
+        import tempfile
+        from unittest.mock import patch
+        from clipboard_manager import ClipboardManager
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "history.json")
+            manager = ClipboardManager(path, max_history=20)
+            manager.import_history(json.dumps(create_items(20)), format="json")
+            manager.close()
+
+            # 다시 열면 로드한 항목의 중복 확인 인덱스로 이미 저장된 항목을 거름
+            manager = ClipboardManager(path, max_history=20)
+            rows = create_items(20) + [
+                {'text': "새 항목", 'timestamp': "2024-01-02T00:00:00"},
+                {'text': "시각 오류", 'timestamp': "어제"},
+                {'text': "숫자 시각", 'timestamp': 12345},
+                {'text': "없는 날짜", 'timestamp': "2024-13-01T00:00:00"}
+            ]
+            with patch.object(manager.logger, 'info') as info, patch.object(manager.logger, 'warning') as warning:
+                if not manager.import_history(json.dumps(rows), format="json"):
+                    print("❌ 잘못된 항목 때문에 가져오기 중단")
+                    return False
+
+            messages = [call.args[0] for call in info.call_args_list + warning.call_args_list]
+            if "1개 항목 가져오기 완료" not in messages or not any("잘못된 항목 3개" in m for m in messages):
+                print(f"❌ 가져오기 결과 오류: {messages}")
+                return False
+            texts = [item['text'] for item in manager.get_history()]
+            if texts[0] != "새 항목" or len(texts) != len(set(texts)):
+                print(f"❌ 가져온 히스토리 오류: {texts}")
+                return False
+            print("✅ 저장소에 있던 항목 20개 중복 제외, 잘못된 시각 3개 건너뜀")
+            manager.close()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 가져오기 중복/오류 항목 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("히스토리 입출력 테스트 시작\n")
+
+    test_results = [
+        ("JSON 배열 스트리밍", test_streaming_json()),
+        ("JSONL/CSV 파싱", test_jsonl_csv()),
+        ("스트리밍 내보내기", test_streaming_export()),
+        ("가져오기 중복/오류 항목", test_import_dedup_and_bad_rows())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
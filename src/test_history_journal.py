@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+클립보드 히스토리 저널 테스트 스크립트
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_append_and_reload():
+    """저널 추가 후 다시 로드 테스트"""
+    print("=== 저널 추가/로드 테스트 ===")
+
+    try:
+        from history_journal import HistoryJournal
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "history.json")
+            journal = HistoryJournal(path)
+            for i in range(5):
+                journal.append({'text': f"항목{i}", 'timestamp': f"2024-01-0{i + 1}T00:00:00"}, max_items=3)
+            journal.close()
+
+            with open(journal.journal_path, 'r', encoding='utf-8') as f:
+                line_count = len(f.readlines())
+            if line_count != 5:
+                print(f"❌ 저널 레코드 수 오류: {line_count}")
+                return False
+            print(f"✅ 저널 레코드 {line_count}개 기록")
+
+            # 기록 도중 종료되어 잘린 줄은 무시
+            with open(journal.journal_path, 'a', encoding='utf-8') as f:
+                f.write('{"seq": 6, "op": "ad')
+
+            items = HistoryJournal(path).load()
+            texts = [item['text'] for item in items]
+            if texts != ["항목4", "항목3", "항목2"]:
+                print(f"❌ 로드 결과 오류: {texts}")
+                return False
+            print(f"✅ 최대 개수 적용 후 로드: {texts}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 저널 추가/로드 테스트 실패: {e}")
+        return False
+
+def test_compaction():
+    """스냅샷 압축 및 중복 방지 테스트"""
+    print("\n=== 스냅샷 압축 테스트 ===")
+
+    try:
+        from history_journal import HistoryJournal
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "history.json")
+
+            # 이전 버전 형식(전체 JSON 목록)에서 시작
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([{'text': "기존", 'timestamp': "2024-01-01T00:00:00"}], f)
+
+            journal = HistoryJournal(path)
+            items = journal.load()
+            new_item = {'text': "새 항목", 'timestamp': "2024-01-02T00:00:00"}
+            journal.append(new_item)
+            items.insert(0, new_item)
+            journal.flush()
+
+            # 압축 직전 저널을 남겨두어 교체 후 종료된 상황을 재현
+            with open(journal.journal_path, 'r', encoding='utf-8') as f:
+                stale_journal = f.read()
+            journal.compact(items, wait=True)
+            journal.close()
+
+            with open(journal.journal_path, 'w', encoding='utf-8') as f:
+                f.write(stale_journal)
+
+            texts = [item['text'] for item in HistoryJournal(path).load()]
+            if texts != ["새 항목", "기존"]:
+                print(f"❌ 압축 후 로드 결과 오류: {texts}")
+                return False
+            print(f"✅ 스냅샷 이전 레코드 건너뜀: {texts}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 스냅샷 압축 테스트 실패: {e}")
+        return False
+
+def test_expire():
+    """epoch 기반 만료 레코드 테스트"""
+    print("\n=== 만료 레코드 테스트 ===")
+
+    try:
+        from history_journal import HistoryJournal, expired_index
+
+        items = [{'text': f"항목{i}", 'epoch': 1000 - i * 100} for i in range(10)]
+        index = expired_index(items, 500)
+        if index != 5:
+            print(f"❌ 만료 경계 오류: {index}")
+            return False
+        print(f"✅ 이진 탐색 만료 경계: {index}")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "history.json")
+            journal = HistoryJournal(path)
+            for item in reversed(items):
+                journal.append(item)
+            journal.expire_before(500)
+            journal.close()
+
+            texts = [item['text'] for item in HistoryJournal(path).load()]
+            if texts != [f"항목{i}" for i in range(5)]:
+                print(f"❌ 만료 후 로드 결과 오류: {texts}")
+                return False
+            print(f"✅ 만료 레코드 재적용: {len(texts)}개 남음")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 만료 레코드 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("히스토리 저널 테스트 시작\n")
+
+    test_results = [
+        ("저널 추가/로드", test_append_and_reload()),
+        ("스냅샷 압축", test_compaction()),
+        ("만료 레코드", test_expire())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
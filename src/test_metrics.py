@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+메트릭 엔드포인트 테스트 스크립트
+"""
+
+import sys
+import os
+import threading
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import MetricsRegistry, MetricsServer
+
+def test_render():
+    """Prometheus 텍스트 형식 생성 테스트"""
+    print("=== 메트릭 렌더링 테스트 ===")
+
+    try:
+        registry = MetricsRegistry()
+        stats = {'total_copies': 3, 'failed_copies': 1, 'session_start': '2025-01-01'}
+        registry.register_source('clipboard', lambda: stats, counters=('total_copies', 'failed_copies'))
+
+        for value in (0.02, 0.3, 120):
+            registry.observe('transcription_seconds', value)
+
+        output = registry.render()
+        expected_lines = [
+            "# TYPE speech_to_text_clipboard_total_copies_total counter",
+            "speech_to_text_clipboard_total_copies_total 3",
+            'speech_to_text_transcription_seconds_bucket{le="0.025"} 1',
+            'speech_to_text_transcription_seconds_bucket{le="0.5"} 2',
+            'speech_to_text_transcription_seconds_bucket{le="+Inf"} 3',
+            "speech_to_text_transcription_seconds_count 3"
+        ]
+
+        for line in expected_lines:
+            if line not in output:
+                print(f"❌ 누락된 라인: {line}")
+                return False
+
+        if 'session_start' in output:
+            print("❌ 숫자가 아닌 값이 노출됨")
+            return False
+
+        # 스크랩하지 않아도 관측값을 쌓아두지 않고 바로 버킷에 반영
+        histogram = registry.histograms['real_time_factor']
+
+        def observe_many():
+            for i in range(10000):
+                registry.observe('real_time_factor', (i % 10) / 10)
+
+        threads = [threading.Thread(target=observe_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if histogram.count != 40000 or sum(histogram.bucket_counts) != 40000:
+            print(f"❌ 관측값 반영 오류: {histogram.count}")
+            return False
+        if 'speech_to_text_real_time_factor_bucket{le="0.5"} 24000' not in registry.render():
+            print("❌ 동시 관측 후 버킷 집계 오류")
+            return False
+
+        print("✅ 메트릭 렌더링 테스트 통과")
+        return True
+
+    except Exception as e:
+        print(f"❌ 메트릭 렌더링 테스트 실패: {e}")
+        return False
+
+def test_http_endpoint():
+    """localhost HTTP 엔드포인트 테스트"""
+    print("\n=== HTTP 엔드포인트 테스트 ===")
+
+    server = None
+    try:
+        registry = MetricsRegistry()
+        registry.register_source('app', lambda: {'total_recordings': 7}, counters=('total_recordings',))
+
+        server = MetricsServer(registry, host='127.0.0.1', port=0)
+        if not server.start():
+            print("❌ 서버 시작 실패")
+            return False
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            body = response.read().decode('utf-8')
+
+        if "speech_to_text_app_total_recordings_total 7" not in body:
+            print("❌ 응답에 메트릭 없음")
+            return False
+
+        print("✅ HTTP 엔드포인트 테스트 통과")
+        return True
+
+    except Exception as e:
+        print(f"❌ HTTP 엔드포인트 테스트 실패: {e}")
+        return False
+    finally:
+        if server:
+            server.stop()
+
+def main():
+    """메인 테스트 함수"""
+    print("메트릭 테스트 시작\n")
+
+    test_results = [
+        ("메트릭 렌더링", test_render()),
+        ("HTTP 엔드포인트", test_http_endpoint())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+시작 단계 병렬 초기화 스케줄러 테스트 스크립트
+"""
+
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def test_parallel_execution():
+    """워커 작업 동시 실행 및 의존 순서 테스트"""
+    print("=== 병렬 실행 테스트 ===")
+
+    try:
+        from startup_scheduler import StartupScheduler
+
+        order = []
+        main_thread = threading.current_thread().name
+
+        def step(name, seconds=0.0):
+            def run():
+                time.sleep(seconds)
+                order.append((name, threading.current_thread().name))
+                return name
+            return run
+
+        scheduler = StartupScheduler(max_workers=4)
+        scheduler.add('ui', step('ui'), main_thread=True)
+        scheduler.add('probe', step('probe', 0.2), depends=('ui',))
+        scheduler.add('history', step('history', 0.2), depends=('ui',))
+        scheduler.add('model', step('model', 0.2), depends=('ui',), wait=False)
+        scheduler.add('connect', step('connect'), depends=('probe', 'history'), main_thread=True)
+
+        started = time.perf_counter()
+        results = scheduler.run()
+        elapsed = time.perf_counter() - started
+
+        if elapsed > 0.35:
+            print(f"❌ 워커 작업이 순차 실행됨: {elapsed:.2f}초")
+            return False
+        print(f"✅ 0.2초 작업 두 개를 {elapsed:.2f}초에 완료")
+
+        names = [name for name, _ in order]
+        if names[0] != 'ui' or names.index('connect') < max(names.index('probe'), names.index('history')):
+            print(f"❌ 의존 순서 오류: {names}")
+            return False
+        if dict(order)['connect'] != main_thread or dict(order)['probe'] == main_thread:
+            print(f"❌ 실행 스레드 오류: {order}")
+            return False
+        print("✅ 의존 순서와 메인/워커 스레드 구분")
+
+        if results.get('connect') != 'connect':
+            print(f"❌ 결과 반환 오류: {results}")
+            return False
+
+        path = [task.name for task in scheduler.critical_path()]
+        if path[0] != 'ui' or path[-1] != 'connect' or len(path) != 3:
+            print(f"❌ 임계 경로 오류: {path}")
+            return False
+        print(f"✅ 임계 경로: {' → '.join(path)}")
+        print(scheduler.report())
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 병렬 실행 테스트 실패: {e}")
+        return False
+
+def test_failure_handling():
+    """작업 실패 전파 테스트"""
+    print("\n=== 실패 처리 테스트 ===")
+
+    try:
+        from startup_scheduler import StartupScheduler
+
+        def fail():
+            raise OSError("장치 없음")
+
+        scheduler = StartupScheduler()
+        scheduler.add('optional', fail, optional=True)
+        scheduler.add('after_optional', lambda: 'ok', depends=('optional',), optional=True)
+        scheduler.add('required', fail)
+        scheduler.add('main', lambda: 'ok', main_thread=True)
+
+        try:
+            scheduler.run()
+            print("❌ 필수 작업 실패가 전파되지 않음")
+            return False
+        except OSError:
+            print("✅ 필수 작업 실패 예외 전파")
+
+        if scheduler.tasks['main'].result != 'ok' or scheduler.tasks['after_optional'].error is None:
+            print("❌ 실패 후 작업 처리 오류")
+            return False
+        print("✅ 다른 작업은 완료되고 실패한 작업의 후속 작업은 건너뜀")
+
+        try:
+            scheduler.add('unknown', fail, depends=('missing',))
+            print("❌ 등록되지 않은 의존 작업 허용")
+            return False
+        except ValueError:
+            print("✅ 등록되지 않은 의존 작업 거부")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 실패 처리 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("시작 스케줄러 테스트 시작\n")
+
+    test_results = [
+        ("병렬 실행", test_parallel_execution()),
+        ("실패 처리", test_failure_handling())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
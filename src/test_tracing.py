@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+워크플로우 지연 시간 추적 테스트 스크립트
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tracing import WorkflowTracer
+
+def test_span_recording():
+    """구간 기록 및 단계별 집계 테스트"""
+    print("=== 구간 기록 테스트 ===")
+
+    try:
+        tracer = WorkflowTracer()
+        tracer.enabled = True
+        tracer.trace_file = None
+
+        tracer.begin("wf-1", model="base")
+        with tracer.span('stream_start'):
+            time.sleep(0.01)
+
+        # 워커 스레드에서 바인딩된 ID로 기록
+        def worker():
+            tracer.bind("wf-1")
+            with tracer.span('transcribe'):
+                time.sleep(0.01)
+            tracer.unbind()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        record = tracer.end("wf-1")
+        if set(record['stages']) != {'stream_start', 'transcribe'}:
+            print(f"❌ 단계 누락: {record['stages']}")
+            return False
+
+        if record['total_ms'] < 20:
+            print(f"❌ 전체 시간 계산 오류: {record['total_ms']:.1f}ms")
+            return False
+
+        print(f"✅ 단계별 시간: {record['stages']}")
+        return True
+
+    except Exception as e:
+        print(f"❌ 구간 기록 테스트 실패: {e}")
+        return False
+
+def test_exports():
+    """JSONL / Chrome trace 내보내기 테스트"""
+    print("\n=== 트레이스 내보내기 테스트 ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracer = WorkflowTracer()
+            tracer.enabled = True
+            tracer.trace_file = os.path.join(temp_dir, "trace.jsonl")
+
+            for workflow_id in ("wf-a", "wf-b"):
+                tracer.begin(workflow_id)
+                tracer.add_span('capture', time.perf_counter() - 0.5)
+                tracer.end(workflow_id)
+
+            with open(tracer.trace_file, encoding='utf-8') as f:
+                lines = [json.loads(line) for line in f]
+            if [line['workflow_id'] for line in lines] != ["wf-a", "wf-b"]:
+                print("❌ JSONL 기록 불일치")
+                return False
+            print("✅ JSONL 기록 확인")
+
+            chrome_path = os.path.join(temp_dir, "trace.json")
+            tracer.export_chrome_trace(chrome_path)
+            with open(chrome_path, encoding='utf-8') as f:
+                events = json.load(f)['traceEvents']
+            spans = [e for e in events if e['ph'] == 'X']
+            if len(spans) != 2 or spans[0]['dur'] < 400000:
+                print("❌ Chrome trace 이벤트 불일치")
+                return False
+            print("✅ Chrome trace 확인")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 트레이스 내보내기 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("워크플로우 추적 테스트 시작\n")
+
+    test_results = [
+        ("구간 기록", test_span_recording()),
+        ("트레이스 내보내기", test_exports())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+로컬 음성 인식 서비스 테스트 스크립트
+"""
+
+import sys
+import os
+import json
+import socket
+import tempfile
+import threading
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+class FakeModel:
+    """구간 하나를 돌려주는 테스트용 모델"""
+
+    def __init__(self, delay=None):
+        self.calls = []
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    def transcribe(self, audio, **options):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        if self.delay:
+            self.delay.wait(5)
+        self.calls.append(len(audio))
+        self.active -= 1
+        duration = len(audio) / 16000
+        text = f"청크 {len(self.calls)}"
+        return {
+            'text': text,
+            'language': 'ko',
+            'segments': [{'start': 0.0, 'end': duration, 'text': text, 'avg_logprob': -0.2, 'no_speech_prob': 0.0}]
+        }
+
+def test_stream_transcription():
+    """원시 오디오 요청과 구간 스트리밍 테스트"""
+    print("=== 구간 스트리밍 테스트 ===")
+
+    try:
+        from transcription_service import TranscriptionService, TranscriptionClient
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            socket_path = os.path.join(temp_dir, "service.sock")
+            model = FakeModel()
+            service = TranscriptionService(lambda: model, socket_path=socket_path, chunk_seconds=1)
+            if not service.start():
+                print("❌ 서비스 시작 실패")
+                return False
+
+            try:
+                segments = []
+                audio = (np.sin(np.arange(16000 * 2.5) * 0.05) * 10000).astype(np.int16)
+                result = TranscriptionClient(socket_path, timeout=10).transcribe_audio(
+                    audio, sample_rate=16000, on_segment=segments.append)
+
+                if len(segments) != 3 or segments[1]['start'] != 1.0:
+                    print(f"❌ 구간 스트리밍 오류: {segments}")
+                    return False
+                print(f"✅ 스트리밍 구간 {len(segments)}개 수신")
+
+                if result['text'] != "청크 1 청크 2 청크 3":
+                    print(f"❌ 최종 결과 오류: {result['text']}")
+                    return False
+                print(f"✅ 최종 결과: {result['text']}")
+
+                if os.stat(socket_path).st_mode & 0o777 != 0o600:
+                    print(f"❌ 소켓 권한 오류: {oct(os.stat(socket_path).st_mode & 0o777)}")
+                    return False
+                print("✅ 소켓은 현재 사용자만 접근 가능 (0600)")
+
+                # 잘못된 샘플레이트는 오류 응답 후 같은 연결에서 계속 처리
+                client = TranscriptionClient(socket_path, timeout=10)
+                try:
+                    client.transcribe_audio(audio, sample_rate=0)
+                    print("❌ 잘못된 샘플레이트가 허용됨")
+                    return False
+                except RuntimeError as e:
+                    print(f"✅ 잘못된 샘플레이트 거부: {e}")
+                status = client.status()
+                if status['requests'] != 1 or status['completed'] != 1:
+                    print(f"❌ 서비스 통계 오류: {status}")
+                    return False
+
+                # JSON 객체가 아닌 요청과 잘못된 우선순위도 오류 응답 후 연결 유지
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(10)
+                    sock.connect(socket_path)
+                    sock.sendall(b'[1]\n{"id": "p", "priority": "high", "path": "/nonexistent"}\n{"type": "status"}\n')
+                    with sock.makefile('rb') as reader:
+                        events = [json.loads(reader.readline()) for _ in range(3)]
+                if [event['event'] for event in events] != ['error', 'error', 'status'] or events[1].get('id') != 'p':
+                    print(f"❌ 잘못된 요청 처리 오류: {events}")
+                    return False
+                print(f"✅ 잘못된 요청 거부: {events[0]['message']} / {events[1]['message']}")
+            finally:
+                service.stop()
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 구간 스트리밍 테스트 실패: {e}")
+        return False
+
+def test_priority_queue():
+    """우선순위가 높은 요청이 먼저 처리되는지 테스트"""
+    print("\n=== 우선순위 대기열 테스트 ===")
+
+    try:
+        from transcription_service import TranscriptionService, TranscriptionJob
+
+        release = threading.Event()
+        model = FakeModel(delay=release)
+        service = TranscriptionService(lambda: model, socket_path=os.path.join(tempfile.gettempdir(), "unused.sock"))
+        service.running = True
+        worker = threading.Thread(target=service._worker_loop, daemon=True)
+        worker.start()
+
+        # 요청마다 길이를 달리해 모델 호출 순서로 처리 순서를 확인
+        blocker = TranscriptionJob({'id': 'blocker'}, np.zeros(12000, dtype=np.float32))
+        service.submit(blocker)
+        blocker.events.get()  # queued
+        blocker.events.get()  # started - 추론 스레드가 이 요청에서 대기
+
+        low = TranscriptionJob({'id': 'low'}, np.zeros(16000, dtype=np.float32), priority=0)
+        high = TranscriptionJob({'id': 'high'}, np.zeros(8000, dtype=np.float32), priority=10)
+        service.submit(low)
+        service.submit(high)
+        release.set()
+
+        for job in (blocker, low, high):
+            while job.events.get(timeout=5)['event'] != 'done':
+                pass
+
+        service.running = False
+        service.jobs.put((float('inf'), 0, None))
+
+        if model.calls != [12000, 8000, 16000]:
+            print(f"❌ 처리 순서 오류: {model.calls}")
+            return False
+        print("✅ 높은 우선순위 요청이 먼저 처리됨")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 우선순위 대기열 테스트 실패: {e}")
+        return False
+
+def test_shared_model_serialized():
+    """받아쓰기 워커와 서비스 요청이 같은 모델을 동시에 쓰지 않는지 테스트"""
+    print("\n=== 추론 직렬화 테스트 ===")
+
+    try:
+        import time
+        from transcription_service import TranscriptionService, TranscriptionJob
+        from whisper_handler import WhisperHandler, WhisperWorker
+
+        release = threading.Event()
+        model = FakeModel(delay=release)
+        service = TranscriptionService(lambda: model, socket_path=os.path.join(tempfile.gettempdir(), "unused.sock"))
+
+        # 서비스 요청이 추론 중인 동안 받아쓰기 워커 실행
+        job = TranscriptionJob({'id': 'service'}, np.zeros(16000, dtype=np.float32))
+        service_thread = threading.Thread(target=service._run_job, args=(job,), daemon=True)
+        service_thread.start()
+        while model.active == 0 and service_thread.is_alive():
+            time.sleep(0.01)
+
+        results = []
+        options = dict(WhisperHandler._load_whisper_options(), enable_vad=False, silence_threshold=0)
+        audio = (np.sin(np.arange(16000) * 0.05) * 0.5).astype(np.float32)
+        worker = WhisperWorker(model, audio, 16000, options, lambda *args: results.append(args))
+        worker_thread = threading.Thread(target=worker.run, daemon=True)
+        worker_thread.start()
+        time.sleep(0.2)
+        if model.max_active != 1 or results:
+            print("❌ 서비스 추론 중 받아쓰기 추론이 동시에 실행됨")
+            return False
+
+        release.set()
+        service_thread.join(5)
+        worker_thread.join(5)
+        if len(model.calls) != 2 or model.max_active != 1 or not results or results[0][1]:
+            print(f"❌ 직렬화 후 처리 오류: {model.calls}, {results}")
+            return False
+        print("✅ 같은 모델의 추론이 한 번에 하나씩 실행됨")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 추론 직렬화 테스트 실패: {e}")
+        return False
+
+def main():
+    """메인 테스트 함수"""
+    print("로컬 음성 인식 서비스 테스트 시작\n")
+
+    test_results = [
+        ("구간 스트리밍", test_stream_transcription()),
+        ("우선순위 대기열", test_priority_queue()),
+        ("추론 직렬화", test_shared_model_serialized())
+    ]
+
+    print("\n" + "="*50)
+    passed = 0
+    for test_name, result in test_results:
+        status = "✅ 통과" if result else "❌ 실패"
+        print(f"{test_name}: {status}")
+        if result:
+            passed += 1
+
+    print(f"\n총 {passed}/{len(test_results)} 테스트 통과")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+워크플로우 단계별 지연 시간 추적 모듈
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from config import config
+
+
+class WorkflowTracer:
+    """워크플로우 ID별 구간(span) 기록기
+
+    단축키 감지부터 클립보드 확인까지의 각 단계를 time.perf_counter() 기준으로
+    기록하고, 워크플로우가 끝나면 JSONL 파일로 추가 기록합니다.
+    export_chrome_trace()는 chrome://tracing / Perfetto 형식으로 내보냅니다.
+    enabled/trace_file은 처음 사용할 때 설정에서 읽습니다 (import 시 설정 파일을
+    읽지 않도록).
+    """
+
+    def __init__(self, max_workflows=200):
+        self.logger = logging.getLogger(__name__)
+        self._enabled = None
+        self._trace_file = None
+        self._configured = False
+        self.max_workflows = max_workflows
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._workflows = OrderedDict()  # workflow_id -> 기록 정보
+        self._active_id = None
+
+        # Chrome trace의 ts 기준점 (프로세스 시작 기준 상대 시간)
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+
+    def configure(self):
+        """설정 파일에서 추적 설정 읽기"""
+        self._enabled = config.get('tracing.enabled', True)
+        self._trace_file = config.get('tracing.trace_file', None)
+        self._configured = True
+
+    @property
+    def enabled(self):
+        if not self._configured:
+            self.configure()
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        if not self._configured:
+            self.configure()
+        self._enabled = value
+
+    @property
+    def trace_file(self):
+        if not self._configured:
+            self.configure()
+        return self._trace_file
+
+    @trace_file.setter
+    def trace_file(self, value):
+        if not self._configured:
+            self.configure()
+        self._trace_file = value
+
+    @property
+    def active_id(self):
+        """현재 스레드에 바인딩된 워크플로우 ID (없으면 전역 활성 ID)"""
+        return getattr(self._local, 'workflow_id', None) or self._active_id
+
+    def begin(self, workflow_id, **attrs):
+        """새 워크플로우 시작"""
+        if not self.enabled or not workflow_id:
+            return
+
+        with self._lock:
+            self._workflows[workflow_id] = {
+                'workflow_id': workflow_id,
+                'started_at': self._origin_wall + (time.perf_counter() - self._origin),
+                'attrs': dict(attrs),
+                'spans': [],
+                'status': 'running'
+            }
+            self._active_id = workflow_id
+
+            while len(self._workflows) > self.max_workflows:
+                self._workflows.popitem(last=False)
+
+    def bind(self, workflow_id):
+        """현재 스레드를 워크플로우에 바인딩 (워커 스레드용)"""
+        self._local.workflow_id = workflow_id
+
+    def unbind(self):
+        self._local.workflow_id = None
+
+    def add_span(self, stage, start, end=None, workflow_id=None, **args):
+        """perf_counter 기준 시작/종료 시각으로 구간 기록"""
+        if not self.enabled or not isinstance(start, (int, float)):
+            return
+
+        if end is None:
+            end = time.perf_counter()
+        workflow_id = workflow_id or self.active_id
+
+        with self._lock:
+            workflow = self._workflows.get(workflow_id)
+            if workflow is None:
+                return
+            workflow['spans'].append({
+                'stage': stage,
+                'start': start,
+                'duration': max(0.0, end - start),
+                'thread': threading.current_thread().name,
+                'tid': threading.get_ident(),
+                'args': args
+            })
+
+    @contextmanager
+    def span(self, stage, workflow_id=None, **args):
+        """with 블록 실행 시간을 구간으로 기록"""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(stage, start, time.perf_counter(), workflow_id, **args)
+
+    def end(self, workflow_id=None, status='completed'):
+        """워크플로우 종료 및 JSONL 기록"""
+        if not self.enabled:
+            return None
+
+        workflow_id = workflow_id or self._active_id
+        with self._lock:
+            workflow = self._workflows.get(workflow_id)
+            if workflow is None or workflow['status'] != 'running':
+                return None
+            workflow['status'] = status
+            if self._active_id == workflow_id:
+                self._active_id = None
+            record = self._to_record(workflow)
+
+        breakdown = ', '.join(f"{stage}={ms:.1f}ms" for stage, ms in record['stages'].items())
+        self.logger.debug(f"워크플로우 단계별 시간 (ID: {workflow_id}): {breakdown}")
+
+        if self.trace_file:
+            self._append_jsonl(self.trace_file, record)
+
+        return record
+
+    def get_timeline(self, workflow_id):
+        """워크플로우의 단계별 기록 반환"""
+        with self._lock:
+            workflow = self._workflows.get(workflow_id)
+            return self._to_record(workflow) if workflow else None
+
+    def get_recent(self, limit=None):
+        """최근 워크플로우 기록 목록 반환 (오래된 순)"""
+        with self._lock:
+            records = [self._to_record(w) for w in self._workflows.values()]
+        return records[-limit:] if limit else records
+
+    def export_jsonl(self, path):
+        """보관 중인 모든 워크플로우를 JSONL로 내보내기"""
+        records = self.get_recent()
+        try:
+            self._ensure_parent(path)
+            with open(path, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            return True
+        except Exception as e:
+            self.logger.error(f"트레이스 JSONL 내보내기 실패: {e}")
+            return False
+
+    def export_chrome_trace(self, path):
+        """Chrome trace event 형식으로 내보내기"""
+        events = []
+        pid = os.getpid()
+
+        with self._lock:
+            workflows = list(self._workflows.values())
+            for workflow in workflows:
+                for span in workflow['spans']:
+                    args = {'workflow_id': workflow['workflow_id']}
+                    args.update(span['args'])
+                    events.append({
+                        'name': span['stage'],
+                        'cat': 'workflow',
+                        'ph': 'X',
+                        'ts': (span['start'] - self._origin) * 1e6,
+                        'dur': span['duration'] * 1e6,
+                        'pid': pid,
+                        'tid': span['tid'],
+                        'args': args
+                    })
+                    events.append({
+                        'name': 'thread_name',
+                        'ph': 'M',
+                        'pid': pid,
+                        'tid': span['tid'],
+                        'args': {'name': span['thread']}
+                    })
+
+        try:
+            self._ensure_parent(path)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+            self.logger.info(f"Chrome 트레이스 내보내기 완료: {path} ({len(workflows)}개 워크플로우)")
+            return True
+        except Exception as e:
+            self.logger.error(f"Chrome 트레이스 내보내기 실패: {e}")
+            return False
+
+    def _to_record(self, workflow):
+        """내부 기록을 직렬화 가능한 딕셔너리로 변환"""
+        spans = sorted(workflow['spans'], key=lambda s: s['start'])
+        base = spans[0]['start'] if spans else 0.0
+
+        stages = OrderedDict()
+        for span in spans:
+            stages[span['stage']] = stages.get(span['stage'], 0.0) + span['duration'] * 1000
+
+        total = 0.0
+        if spans:
+            total = (max(s['start'] + s['duration'] for s in spans) - base) * 1000
+
+        return {
+            'workflow_id': workflow['workflow_id'],
+            'started_at': workflow['started_at'],
+            'status': workflow['status'],
+            'attrs': workflow['attrs'],
+            'total_ms': total,
+            'stages': dict(stages),
+            'spans': [{
+                'stage': s['stage'],
+                'offset_ms': (s['start'] - base) * 1000,
+                'duration_ms': s['duration'] * 1000,
+                'thread': s['thread'],
+                'args': s['args']
+            } for s in spans]
+        }
+
+    def _append_jsonl(self, path, record):
+        try:
+            self._ensure_parent(path)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except Exception as e:
+            self.logger.error(f"트레이스 기록 실패: {e}")
+
+    @staticmethod
+    def _ensure_parent(path):
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+
+# 전역 트레이서 인스턴스
+tracer = WorkflowTracer()
@@ -0,0 +1,407 @@
+"""
+로컬 음성 인식 서비스 모듈 (Unix 도메인 소켓 API)
+
+실행 중인 앱이 로드한 Whisper 모델을 다른 프로세스(에디터, 스크립트)와
+공유합니다. 요청/응답은 줄 단위 JSON이며, 원시 오디오는 요청 줄 바로 뒤에
+audio_bytes 만큼의 바이트로 전송합니다.
+
+요청 예:
+    {"id": "1", "type": "transcribe", "path": "/tmp/memo.wav", "priority": 5, "stream": true}
+    {"id": "2", "type": "transcribe", "audio_format": "s16le", "sample_rate": 16000, "audio_bytes": 32000}
+    {"id": "3", "type": "status"}
+
+응답 이벤트: queued, started, segment (stream=true일 때), done, error
+"""
+
+import itertools
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from config import config
+from whisper_handler import WhisperHandler
+from batch_transcribe import stream_audio_chunks, transcribe_chunk, _resample, TARGET_SAMPLE_RATE
+
+
+MAX_AUDIO_BYTES = 200 * 1024 * 1024  # 원시 오디오 최대 크기
+MAX_SAMPLE_RATE = 384000
+AUDIO_FORMATS = {'f32le': np.float32, 's16le': np.int16}
+
+
+def default_socket_path():
+    """기본 소켓 경로 ($XDG_RUNTIME_DIR 우선)"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, 'speech_to_text.sock')
+
+
+class TranscriptionJob:
+    """대기열에 들어가는 인식 요청"""
+
+    def __init__(self, request, audio=None, priority=0):
+        self.request = request
+        self.id = request.get('id')
+        self.priority = priority
+        self.stream = bool(request.get('stream', False))
+        self.audio = audio
+        self.events = queue.Queue()  # 연결 핸들러로 전달할 이벤트
+        self.submitted_at = time.time()
+        self.cancelled = False
+
+    def emit(self, event, **data):
+        data.update(id=self.id, event=event)
+        self.events.put(data)
+
+
+class TranscriptionService:
+    """상주 모델을 공유하는 인식 요청 처리기
+
+    요청은 우선순위 큐(priority 값이 클수록 먼저)에 쌓이고, 단일 추론 스레드가
+    순서대로 처리합니다.
+    """
+
+    def __init__(self, model_provider, socket_path=None, max_queue=None, chunk_seconds=None):
+        self.logger = logging.getLogger(__name__)
+        self.model_provider = model_provider
+        self.socket_path = socket_path or config.get('service.socket_path', None) or default_socket_path()
+        self.max_queue = max_queue or config.get('service.max_queue', 32)
+        self.chunk_seconds = chunk_seconds or config.get('service.chunk_seconds', 30)
+
+        self.jobs = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self.server = None
+        self.server_thread = None
+        self.worker_thread = None
+        self.running = False
+
+        self.stats = {
+            'requests': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'audio_seconds': 0.0,
+            'processing_time': 0.0
+        }
+        self._stats_lock = threading.Lock()  # 연결 핸들러 스레드와 추론 스레드가 함께 갱신
+
+    def start(self):
+        """소켓 서버와 추론 스레드 시작"""
+        if self.running:
+            return True
+
+        if not hasattr(socket, 'AF_UNIX'):
+            self.logger.error("이 플랫폼은 Unix 도메인 소켓을 지원하지 않습니다")
+            return False
+
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # 이전 실행에서 남은 소켓
+
+            handler = type('ServiceRequestHandler', (_ServiceRequestHandler,), {'service': self})
+            self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, handler, bind_and_activate=False)
+            try:
+                # bind 직후 chmod하면 그 사이에 다른 사용자가 연결할 수 있으므로 bind 전에
+                # 소켓 권한을 0600으로 지정 (프로세스 umask는 다른 스레드의 파일 생성에 영향)
+                try:
+                    os.fchmod(self.server.socket.fileno(), 0o600)
+                except OSError:
+                    pass  # 소켓 fchmod를 지원하지 않는 플랫폼은 bind 후 chmod로 대신함
+                self.server.server_bind()
+                os.chmod(self.socket_path, 0o600)
+                self.server.server_activate()
+            except OSError:
+                self.server.server_close()
+                raise
+            self.server.daemon_threads = True
+
+            self.running = True
+            self.worker_thread = threading.Thread(target=self._worker_loop, name="transcription-service", daemon=True)
+            self.worker_thread.start()
+            self.server_thread = threading.Thread(target=self.server.serve_forever, name="transcription-socket", daemon=True)
+            self.server_thread.start()
+
+            self.logger.info(f"음성 인식 서비스 시작: {self.socket_path}")
+            return True
+
+        except OSError as e:
+            self.logger.error(f"음성 인식 서비스 시작 실패: {e}")
+            self.server = None
+            self.running = False
+            return False
+
+    def stop(self):
+        """서비스 중지 - 대기 중인 요청은 오류로 종료"""
+        if not self.running:
+            return
+
+        self.running = False
+        try:
+            self.server.shutdown()
+            self.server.server_close()
+        except Exception as e:
+            self.logger.warning(f"소켓 서버 종료 중 오류: {e}")
+
+        while True:
+            try:
+                _, _, job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.emit('error', message="서비스가 종료되었습니다")
+        self.jobs.put((float('inf'), next(self._sequence), None))  # 추론 스레드 종료 신호
+
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+        self.logger.info("음성 인식 서비스 중지")
+
+    def submit(self, job):
+        """요청을 대기열에 추가"""
+        self._count(requests=1)
+        if self.jobs.qsize() >= self.max_queue:
+            self._count(rejected=1)
+            job.emit('error', message="대기열이 가득 찼습니다")
+            return False
+
+        self.jobs.put((-job.priority, next(self._sequence), job))
+        job.emit('queued', position=self.jobs.qsize())
+        return True
+
+    def get_status(self):
+        model = self.model_provider()
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return dict(stats, queued=self.jobs.qsize(), model_loaded=model is not None,
+                    model_name=config.get('whisper.model_name', 'base'))
+
+    def _worker_loop(self):
+        """단일 추론 스레드 - 우선순위 순으로 요청 처리"""
+        while self.running:
+            _, _, job = self.jobs.get()
+            if job is None:
+                break
+            if job.cancelled:
+                continue
+            self._run_job(job)
+
+    def _run_job(self, job):
+        model = self.model_provider()
+        if model is None:
+            self._count(failed=1)
+            job.emit('error', message="모델이 아직 로드되지 않았습니다")
+            return
+
+        options = WhisperHandler._load_whisper_options()
+        options.update({'enable_vad': False, 'silence_threshold': 0, 'return_segments': True})
+        if 'language' in job.request:
+            language = job.request['language']
+            options['language'] = None if language == 'auto' else language
+
+        job.emit('started', waited=time.time() - job.submitted_at)
+        started = time.time()
+        texts = []
+        audio_seconds = 0.0
+        language = None
+
+        try:
+            for index, audio in self._iter_chunks(job):
+                if job.cancelled:
+                    return
+                audio_seconds += len(audio) / TARGET_SAMPLE_RATE
+                if len(audio) < TARGET_SAMPLE_RATE * 0.1:
+                    continue
+
+                offset = index * self.chunk_seconds
+                segments, language = transcribe_chunk(model, audio, options)
+                for segment in segments:
+                    texts.append(segment['text'])
+                    if job.stream:
+                        job.emit('segment', start=segment['start'] + offset,
+                                 end=segment['end'] + offset, text=segment['text'])
+
+            processing_time = time.time() - started
+            self._count(completed=1, audio_seconds=audio_seconds, processing_time=processing_time)
+            job.emit('done', text=' '.join(t for t in texts if t), language=language,
+                     audio_seconds=audio_seconds, processing_time=processing_time)
+
+        except Exception as e:
+            self._count(failed=1)
+            self.logger.error(f"서비스 요청 처리 실패 ({job.id}): {e}")
+            job.emit('error', message=str(e))
+
+    def _count(self, **increments):
+        with self._stats_lock:
+            for name, value in increments.items():
+                self.stats[name] += value
+
+    def _iter_chunks(self, job):
+        """요청의 오디오를 chunk_seconds 단위 16kHz 청크로 반환"""
+        if job.audio is None:
+            yield from stream_audio_chunks(job.request['path'], self.chunk_seconds)
+            return
+
+        chunk_samples = self.chunk_seconds * TARGET_SAMPLE_RATE
+        for index, start in enumerate(range(0, len(job.audio), chunk_samples)):
+            yield index, job.audio[start:start + chunk_samples]
+
+
+class _ServiceRequestHandler(socketserver.StreamRequestHandler):
+    """클라이언트 연결 처리 - 요청 한 줄씩 읽어 처리하고 이벤트를 스트리밍"""
+
+    service = None
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self._send({'event': 'error', 'message': "잘못된 JSON 요청"})
+                continue
+            if not isinstance(request, dict):
+                self._send({'event': 'error', 'message': "요청은 JSON 객체여야 합니다"})
+                continue
+
+            request_type = request.get('type', 'transcribe')
+            if request_type == 'status':
+                self._send(dict(self.service.get_status(), id=request.get('id'), event='status'))
+            elif request_type == 'transcribe':
+                try:
+                    priority = int(request.get('priority', 0))
+                except (TypeError, ValueError, OverflowError):
+                    self._send({'id': request.get('id'), 'event': 'error',
+                                'message': f"잘못된 우선순위: {request.get('priority')!r}"})
+                    # 뒤따르는 오디오 페이로드를 읽지 않았으므로 스트림 위치를 알 수 없음
+                    if 'audio_bytes' in request:
+                        break
+                    continue
+                if not self._handle_transcribe(request, priority):
+                    break
+            else:
+                self._send({'id': request.get('id'), 'event': 'error',
+                            'message': f"알 수 없는 요청 종류: {request_type}"})
+
+    def _handle_transcribe(self, request, priority):
+        """인식 요청 처리 - 연결이 끊기면 False"""
+        audio = None
+        if 'audio_bytes' in request:
+            try:
+                audio = self._read_audio(request)
+            except ValueError as e:
+                self._send({'id': request.get('id'), 'event': 'error', 'message': str(e)})
+                # 페이로드를 끝까지 읽지 못했으면 스트림 위치를 알 수 없으므로 연결 종료
+                return isinstance(e, _PayloadSkipped)
+        elif not request.get('path') or not os.path.isfile(request['path']):
+            self._send({'id': request.get('id'), 'event': 'error', 'message': "파일을 찾을 수 없습니다"})
+            return True
+
+        job = TranscriptionJob(request, audio, priority)
+        self.service.submit(job)
+
+        while True:
+            event = job.events.get()
+            if not self._send(event):
+                job.cancelled = True
+                return False
+            if event['event'] in ('done', 'error'):
+                return True
+
+    def _read_audio(self, request):
+        """요청 뒤에 이어지는 원시 PCM 바이트를 16kHz float32로 변환"""
+        size = int(request['audio_bytes'])
+        if size <= 0 or size > MAX_AUDIO_BYTES:
+            raise ValueError(f"오디오 크기가 허용 범위를 벗어났습니다 (최대 {MAX_AUDIO_BYTES} 바이트)")
+
+        payload = self.rfile.read(size)
+        if len(payload) != size:
+            raise ValueError("오디오 데이터가 중간에 끊겼습니다")
+
+        audio_format = request.get('audio_format', 'f32le')
+        if audio_format not in AUDIO_FORMATS:
+            raise _PayloadSkipped(f"지원하지 않는 오디오 형식: {audio_format}")
+        dtype = np.dtype(AUDIO_FORMATS[audio_format])
+        if size % dtype.itemsize:
+            raise _PayloadSkipped(f"오디오 크기가 {audio_format} 샘플 크기의 배수가 아닙니다")
+
+        try:
+            sample_rate = int(request.get('sample_rate', TARGET_SAMPLE_RATE))
+        except (TypeError, ValueError):
+            sample_rate = 0
+        if not 0 < sample_rate <= MAX_SAMPLE_RATE:
+            raise _PayloadSkipped(f"잘못된 샘플레이트: {request.get('sample_rate')}")
+
+        audio = np.frombuffer(payload, dtype=dtype)
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
+        return _resample(audio, sample_rate)
+
+    def _send(self, data):
+        try:
+            self.wfile.write((json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8'))
+            self.wfile.flush()
+            return True
+        except OSError:
+            return False
+
+
+class _PayloadSkipped(ValueError):
+    """페이로드는 모두 읽었지만 처리할 수 없는 요청 (연결 유지)"""
+
+
+class TranscriptionClient:
+    """서비스 클라이언트 (스크립트/에디터 연동용)"""
+
+    def __init__(self, socket_path=None, timeout=None):
+        self.socket_path = socket_path or config.get('service.socket_path', None) or default_socket_path()
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+
+    def transcribe_file(self, path, priority=0, language=None, on_segment=None):
+        request = {'type': 'transcribe', 'path': os.path.abspath(path), 'priority': priority,
+                   'stream': on_segment is not None}
+        if language:
+            request['language'] = language
+        return self._request(request, on_segment=on_segment)
+
+    def transcribe_audio(self, audio, sample_rate=16000, priority=0, language=None, on_segment=None):
+        audio = np.asarray(audio)
+        audio_format = 's16le' if audio.dtype == np.int16 else 'f32le'
+        payload = audio.astype(AUDIO_FORMATS[audio_format], copy=False).tobytes()
+        request = {'type': 'transcribe', 'audio_format': audio_format, 'sample_rate': sample_rate,
+                   'audio_bytes': len(payload), 'priority': priority, 'stream': on_segment is not None}
+        if language:
+            request['language'] = language
+        return self._request(request, payload, on_segment)
+
+    def status(self):
+        return self._request({'type': 'status'})
+
+    def _request(self, request, payload=b'', on_segment=None):
+        request['id'] = str(next(self._ids))
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall((json.dumps(request) + '\n').encode('utf-8') + payload)
+
+            with sock.makefile('rb') as reader:
+                for line in reader:
+                    event = json.loads(line)
+                    if event['event'] == 'segment' and on_segment:
+                        on_segment(event)
+                    elif event['event'] in ('done', 'status'):
+                        return event
+                    elif event['event'] == 'error':
+                        raise RuntimeError(event['message'])
+
+        raise ConnectionError("서비스 연결이 끊겼습니다")
@@ -8,6 +8,7 @@ import os
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QWidgetAction, QLabel, QFrame
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QSize
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPen, QFont, QAction
+from tracing import tracer
 
 
 class TrayManager(QObject):
@@ -226,7 +227,8 @@ class TrayManager(QObject):
     def show_message(self, title, message, icon=QSystemTrayIcon.MessageIcon.Information, duration=4000):
         """향상된 트레이 알림 메시지 표시"""
         if self.tray_icon.supportsMessages():
-            self.tray_icon.showMessage(title, message, icon, duration)
+            with tracer.span('tray_notify'):
+                self.tray_icon.showMessage(title, message, icon, duration)
         else:
             self.logger.warning("시스템이 트레이 메시지를 지원하지 않습니다")
             # 콘솔에라도 메시지 출력
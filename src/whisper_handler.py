@@ -2,7 +2,6 @@
 고급 OpenAI Whisper 음성 인식 모듈
 """
 
-import whisper
 import numpy as np
 import threading
 import logging
@@ -11,6 +10,18 @@ import os
 import warnings
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QRunnable, QThreadPool
 from config import config
+from audio_buffer import AudioBuffer
+from tracing import tracer
+from metrics import metrics
+from event_log import event_log
+
+
+# 인코더 forward 호출 시각 (워커 스레드별, 단계별 지연 시간 분해용)
+_encoder_timing = threading.local()
+
+# 같은 모델을 받아쓰기 워커와 음성 인식 서비스가 함께 쓰므로 추론은 한 번에 하나씩 실행
+# (Whisper 디코더의 kv-cache 훅은 모델에 설치되어 동시 호출 시 서로의 캐시를 덮어씀)
+_inference_lock = threading.Lock()
 
 
 class WhisperWorker(QRunnable):
@@ -25,11 +36,16 @@ class WhisperWorker(QRunnable):
         self.callback = callback
         self.logger = logging.getLogger(__name__)
         self.start_time = time.time()
+        self.queued_at = time.perf_counter()
     
     def run(self):
+        tracer.bind(self.options.get('workflow_id'))
+        tracer.add_span('inference_queue', self.queued_at)
+        
         try:
-            # 오디오 데이터 전처리
-            audio_data = self._preprocess_audio(self.audio_data)
+            # 오디오 데이터 전처리 (AudioBuffer는 공유 메모리 뷰로 접근)
+            with tracer.span('whisper_preprocess'):
+                audio_data = self._preprocess_audio(np.asarray(self.audio_data))
             
             if audio_data is None or len(audio_data) == 0:
                 self.callback(None, "유효하지 않은 오디오 데이터", None)
@@ -37,32 +53,73 @@ class WhisperWorker(QRunnable):
             
             # 음성 구간 감지 (VAD)
             if self.options.get('enable_vad', True):
-                audio_data = self._apply_vad(audio_data)
+                with tracer.span('vad'):
+                    audio_data = self._apply_vad(audio_data)
             
             # Whisper 옵션 설정
             whisper_options = self._build_whisper_options()
             
             # Whisper로 음성 인식
             self.logger.debug(f"Whisper 실행 시작 - 옵션: {whisper_options}")
-            result = self.model.transcribe(audio_data, **whisper_options)
+            with _inference_lock:
+                _encoder_timing.calls = []
+                transcribe_start = time.perf_counter()
+                result = self.model.transcribe(audio_data, **whisper_options)
+            self._trace_transcribe(transcribe_start, time.perf_counter(), _encoder_timing.calls)
             
             # 결과 후처리
-            text, confidence = self._postprocess_result(result)
+            with tracer.span('postprocess'):
+                text, confidence = self._postprocess_result(result)
             
             processing_time = time.time() - self.start_time
             self.logger.info(f"음성 인식 완료 - 처리시간: {processing_time:.2f}초")
             
-            self.callback(text, None, {
+            metadata = {
                 'confidence': confidence,
                 'processing_time': processing_time,
                 'language': result.get('language', 'unknown'),
-                'segments': len(result.get('segments', []))
-            })
+                'segments': len(result.get('segments', [])),
+                'audio_duration': len(audio_data) / 16000,
+                'completed_at': time.perf_counter()
+            }
+            
+            # 자막 생성 등을 위한 구간별 결과 (배치 모드)
+            if self.options.get('return_segments', False):
+                metadata['segment_list'] = [{
+                    'start': float(segment['start']),
+                    'end': float(segment['end']),
+                    'text': segment['text'].strip(),
+                    'avg_logprob': float(segment.get('avg_logprob', 0.0))
+                } for segment in result.get('segments', [])]
+            
+            self.callback(text, None, metadata)
             
         except Exception as e:
             error_msg = f"음성 인식 실패: {e}"
             self.logger.error(error_msg)
             self.callback(None, error_msg, None)
+        finally:
+            # 인식이 끝나면 공유 메모리 버퍼 해제
+            audio_data = None
+            if isinstance(self.audio_data, AudioBuffer):
+                self.audio_data.release()
+            tracer.unbind()
+    
+    def _trace_transcribe(self, start, end, encoder_calls):
+        """transcribe 구간을 mel / encode / decode 단계로 분해하여 기록
+        
+        인코더 forward 훅이 기록한 호출 시각을 기준으로, 첫 인코딩 이전은
+        mel 계산, 인코딩 사이 구간은 디코딩으로 간주합니다.
+        """
+        tracer.add_span('transcribe', start, end)
+        if not encoder_calls:
+            return
+        
+        tracer.add_span('mel', start, encoder_calls[0][0])
+        for i, (encode_start, encode_end) in enumerate(encoder_calls):
+            tracer.add_span('encode', encode_start, encode_end)
+            decode_end = encoder_calls[i + 1][0] if i + 1 < len(encoder_calls) else end
+            tracer.add_span('decode', encode_end, decode_end)
     
     def _preprocess_audio(self, audio_data):
         """오디오 데이터 전처리"""
@@ -71,9 +128,10 @@ class WhisperWorker(QRunnable):
             if audio_data.dtype != np.float32:
                 audio_data = audio_data.astype(np.float32)
             
-            # 정규화
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
+            # 정규화 (레코더에서 이미 정규화된 경우 복사 생략)
+            peak = max(float(audio_data.max()), -float(audio_data.min()))
+            if peak > 0 and not np.isclose(peak, 1.0):
+                audio_data = audio_data / peak
             
             # 리샘플링 (16kHz로)
             if self.sample_rate != 16000:
@@ -232,7 +290,7 @@ class WhisperHandler(QObject):
     model_loading_failed = pyqtSignal(str)  # 에러 메시지
     language_detected = pyqtSignal(str)  # 감지된 언어
     
-    def __init__(self, model_name=None):
+    def __init__(self, model_name=None, autoload=True):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         
@@ -254,8 +312,9 @@ class WhisperHandler(QObject):
             'average_confidence': 0.0
         }
         
-        # 모델 로딩을 별도 스레드에서 수행
-        self.load_model_async()
+        # 모델 로딩을 별도 스레드에서 수행 (autoload=False면 호출자가 시점을 정함)
+        if autoload:
+            self.load_model_async()
     
     def load_model_async(self):
         """향상된 비동기 Whisper 모델 로딩"""
@@ -277,6 +336,12 @@ class WhisperHandler(QObject):
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
                     
+                    # whisper/torch는 import만으로 수 초가 걸리므로 로딩 스레드에서 지연 import
+                    import_start = time.time()
+                    import whisper
+                    self.stats['import_time'] = time.time() - import_start
+                    self.logger.info(f"Whisper/torch 모듈 로드 - 소요시간: {self.stats['import_time']:.2f}초")
+                    
                     # 모델 로드 시작 시간
                     start_time = time.time()
                     
@@ -289,6 +354,12 @@ class WhisperHandler(QObject):
                     
                     load_time = time.time() - start_time
                 
+                self.stats['model_load_time'] = load_time
+                metrics.observe('model_load_seconds', load_time)
+                event_log.emit('model_loaded', model=self.model_name, import_seconds=self.stats['import_time'],
+                               load_seconds=load_time)
+                
+                self._install_trace_hooks(self.model)
                 self.logger.info(f"Whisper 모델 로딩 완료 - 소요시간: {load_time:.2f}초")
                 self.model_loading_completed.emit(self.model_name)
                 
@@ -302,9 +373,35 @@ class WhisperHandler(QObject):
         thread = threading.Thread(target=load_model, daemon=True)
         thread.start()
     
+    def _install_trace_hooks(self, model):
+        """인코더 forward 시각을 기록하는 훅 설치 (단계별 지연 시간 추적용)"""
+        encoder = getattr(model, 'encoder', None)
+        if not tracer.enabled or encoder is None or not hasattr(encoder, 'register_forward_hook'):
+            return
+        
+        def before_encode(module, inputs):
+            _encoder_timing.started = time.perf_counter()
+        
+        def after_encode(module, inputs, output):
+            calls = getattr(_encoder_timing, 'calls', None)
+            if calls is not None:
+                calls.append((_encoder_timing.started, time.perf_counter()))
+        
+        encoder.register_forward_pre_hook(before_encode)
+        encoder.register_forward_hook(after_encode)
+    
     def transcribe_audio(self, audio_data, sample_rate=16000, custom_options=None):
-        """향상된 오디오 데이터를 텍스트로 변환"""
+        """향상된 오디오 데이터를 텍스트로 변환
+        
+        audio_data는 numpy 배열 또는 AudioBuffer이며, AudioBuffer는 복사 없이
+        워커로 전달된 뒤 인식이 끝나면 해제됩니다.
+        """
+        if isinstance(audio_data, AudioBuffer):
+            sample_rate = audio_data.sample_rate
+        
         if self.model is None:
+            if isinstance(audio_data, AudioBuffer):
+                audio_data.release()
             if not self.model_loading:
                 self.logger.error("Whisper 모델이 로드되지 않았습니다")
                 self.transcription_failed.emit("모델이 로드되지 않았습니다. 모델을 다시 로딩해주세요.")
@@ -315,6 +412,8 @@ class WhisperHandler(QObject):
         # 오디오 데이터 검증
         validation_error = self._validate_audio_data(audio_data)
         if validation_error:
+            if isinstance(audio_data, AudioBuffer):
+                audio_data.release()
             self.transcription_failed.emit(validation_error)
             return
         
@@ -323,7 +422,9 @@ class WhisperHandler(QObject):
         if custom_options:
             options.update(custom_options)
         
-        self.logger.info(f"음성 인식 시작 - 길이: {len(audio_data)/sample_rate:.2f}초")
+        audio_seconds = len(audio_data) / sample_rate
+        model_name = self.model_name
+        self.logger.info(f"음성 인식 시작 - 길이: {audio_seconds:.2f}초")
         self.transcription_started.emit()
         
         # 통계 업데이트
@@ -331,6 +432,24 @@ class WhisperHandler(QObject):
         
         # 콜백 함수
         def on_transcription_complete(text, error, metadata):
+            success = not error and bool(text and text.strip())
+            processing_time = (metadata or {}).get('processing_time')
+            # 실시간 배율은 이벤트 로그와 메트릭 모두 VAD 이전 입력 길이 기준
+            # (VAD 이후 길이는 voiced_seconds로 따로 기록)
+            rtf = processing_time / audio_seconds if processing_time is not None and audio_seconds > 0 else None
+            event_log.emit(
+                'transcription',
+                model=model_name,
+                language=(metadata or {}).get('language', options.get('language')),
+                audio_seconds=audio_seconds,
+                processing_seconds=processing_time,
+                rtf=rtf,
+                success=success,
+                text_length=len(text.strip()) if success else 0,
+                error=str(error) if error else None,
+                voiced_seconds=(metadata or {}).get('audio_duration')
+            )
+            
             if error:
                 self.stats['failed_transcriptions'] += 1
                 self.logger.error(f"음성 인식 실패: {error}")
@@ -341,7 +460,12 @@ class WhisperHandler(QObject):
                     self.stats['successful_transcriptions'] += 1
                     
                     if metadata:
-                        self.stats['total_processing_time'] += metadata.get('processing_time', 0)
+                        processing_time = metadata.get('processing_time', 0)
+                        self.stats['total_processing_time'] += processing_time
+                        
+                        # 메트릭 기록 (처리 시간, 실시간 배율)
+                        metrics.observe('transcription_seconds', processing_time)
+                        metrics.observe('real_time_factor', rtf)
                         
                         # 평균 신뢰도 업데이트
                         confidence = metadata.get('confidence', 0.5)
@@ -395,11 +519,25 @@ class WhisperHandler(QObject):
         
         # 설정에 저장
         config.set('whisper.model_name', model_name)
-        config.save_settings()
+        if not config.save_settings(immediate=True):
+            self.logger.warning(f"모델 설정 저장 실패 (다음 실행 시 이전 모델 사용): {config.save_error}")
         
         # 새 모델 로딩
         self.load_model_async()
     
+    def apply_settings(self, changes):
+        """설정 파일에서 바뀐 값 적용 - whisper.model_name이 바뀐 경우에만 모델 교체"""
+        option_paths = [path for path in changes
+                        if (path.startswith('whisper.') and path != 'whisper.model_name')
+                        or path == 'audio.silence_threshold']
+        if option_paths:
+            self.options = self._load_whisper_options()
+            self.logger.info(f"인식 옵션 재적용: {', '.join(sorted(option_paths))}")
+        
+        model_change = changes.get('whisper.model_name')
+        if model_change and model_change[1] and model_change[1] != self.model_name:
+            self.change_model(model_change[1])
+    
     def get_available_models(self):
         """사용 가능한 모델 목록 반환"""
         return [
@@ -530,16 +668,18 @@ class WhisperHandler(QObject):
         }
         self.logger.info("Whisper 통계가 초기화되었습니다")
     
-    def _load_whisper_options(self):
+    @staticmethod
+    def _load_whisper_options():
         """설정에서 Whisper 옵션 로드"""
+        settings = config.snapshot
         return {
-            'language': config.get('whisper.language', 'ko'),
-            'task': config.get('whisper.task', 'transcribe'),
-            'fp16': config.get('whisper.fp16', False),
-            'temperature': config.get('whisper.temperature', 0.0),
-            'best_of': config.get('whisper.best_of', 5),
-            'beam_size': config.get('whisper.beam_size', 5),
-            'silence_threshold': config.get('audio.silence_threshold', 0.01),
+            'language': settings.whisper.language,
+            'task': settings.whisper.task,
+            'fp16': settings.whisper.fp16,
+            'temperature': settings.whisper.temperature,
+            'best_of': settings.whisper.best_of,
+            'beam_size': settings.whisper.beam_size,
+            'silence_threshold': settings.audio.silence_threshold,
             'enable_vad': True,
             'clean_special_chars': False
         }
@@ -561,7 +701,7 @@ class WhisperHandler(QObject):
             return "오디오가 너무 깁니다 (최대 30초)"
         
         # 데이터 타입 확인
-        if not isinstance(audio_data, np.ndarray):
+        if not isinstance(audio_data, (np.ndarray, AudioBuffer)):
             return "잘못된 오디오 데이터 형식입니다"
         
         return None